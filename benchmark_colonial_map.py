@@ -0,0 +1,207 @@
+"""
+    Benchmarks constructing frames of display_colonial_map.py, timing update_year and each layer it calls
+    at representative years of the timelapse, for each display mode.
+    Results are compared against a stored baseline, flagging the layers that have become slower.
+
+    python benchmark_colonial_map.py --save-baseline    records the baseline
+    python benchmark_colonial_map.py                    compares against it, exiting with 1 if anything has regressed
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+benchmark_years = [1788, 1850, 1901, 1967, 2020]
+benchmark_display_modes = ['blak', 'white', 'legal'] # as display_colonial_map.display_modes
+benchmark_repeats = 5
+regression_threshold = 0.25 # fraction slower than the baseline that counts as a regression
+regression_noise_floor = 0.0005 # seconds, slowdowns smaller than this are put down to timer noise
+# kept beside this script, wherever it's run from, where .gitignore keeps them out of git
+baseline_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+results_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_results.json')
+
+def benchmark_display_mode(years, repeats):
+    """
+        Times update_year, and each layer it calls, at the given years. Run in a process of its own for each display mode,
+        as display_colonial_map sets up the figure and data for its display mode when it's imported
+
+        Parameters
+        ----------
+        years
+            List: years to time the frames of
+
+        repeats
+            Integer: number of times each frame is timed
+
+        Returns
+        -------
+        mode_timings
+            Dictionary: year -> layer -> median wall time in seconds
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        import display_colonial_map as colonial_map
+
+    # the benchmark is timed through the script's own frame profiler
+    colonial_map.profile_frames = True
+    frame_years = colonial_map.frame_plans[colonial_map.display_blak_history]['Year'].values
+
+    mode_timings = {}
+    for year in years:
+        year_frames = np.flatnonzero(frame_years == year)
+        if len(year_frames) == 0:
+            print('No frame for ' + str(year) + ', skipping it')
+            continue
+        frame = int(year_frames[0])
+
+        layer_timings = {}
+        for repeat in range(repeats):
+            # construct the frame before first, as the animation does, so the layers' caches are as they would be when animating
+            if frame > 0:
+                colonial_map.update_year(frame - 1)
+            colonial_map.profile_records = []
+            with colonial_map.profile_layer('update_year'):
+                colonial_map.update_year(frame)
+
+            for record in colonial_map.profile_records:
+                layer_timings.setdefault(record['layer'], []).append(record['wall_seconds'])
+
+        mode_timings[str(year)] = {layer: statistics.median(timings) for layer, timings in layer_timings.items()}
+
+    return mode_timings
+
+def run_benchmarks(display_modes, years, repeats):
+    """
+        Benchmarks each display mode in a process of its own
+
+        Parameters
+        ----------
+        display_modes
+            List: display modes to benchmark
+
+        years
+            List: years to time the frames of
+
+        repeats
+            Integer: number of times each frame is timed
+
+        Returns
+        -------
+        benchmark_results
+            Dictionary: the platform benchmarked on, and 'timings' of display mode -> year -> layer -> median wall time in seconds
+    """
+    import matplotlib
+
+    benchmark_results = {'python': platform.python_version(), 'matplotlib': matplotlib.__version__, 'machine': platform.machine(), \
+                         'repeats': repeats, 'timings': {}}
+    script_directory = os.path.dirname(os.path.abspath(__file__))
+
+    for display_mode in display_modes:
+        print('Benchmarking ' + display_mode + ' display mode')
+        with tempfile.TemporaryDirectory() as mode_directory:
+            mode_results_path = os.path.join(mode_directory, 'mode_timings.json')
+            subprocess.run([sys.executable, os.path.abspath(__file__), '--mode-results', mode_results_path, '--repeats', str(repeats), \
+                            '--years'] + [str(year) for year in years], \
+                           env=dict(os.environ, COLONIAL_MAP_DISPLAY_MODE=display_mode), cwd=script_directory, check=True)
+            with open(mode_results_path) as mode_results:
+                benchmark_results['timings'][display_mode] = json.load(mode_results)
+
+    return benchmark_results
+
+def compare_with_baseline(benchmark_results, baseline_results, threshold):
+    """
+        Prints each timing alongside its baseline, flagging those that have regressed
+
+        Parameters
+        ----------
+        benchmark_results
+            Dictionary: built by run_benchmarks
+
+        baseline_results
+            Dictionary: built by run_benchmarks for the baseline, or None if there is no baseline
+
+        threshold
+            Float: fraction slower than the baseline that counts as a regression
+
+        Returns
+        -------
+        regressions
+            List: description of each timing that has regressed
+    """
+    regressions = []
+    baseline_timings = baseline_results['timings'] if baseline_results is not None else {}
+
+    print('{:<6} {:<5} {:<32} {:>12} {:>12} {:>8}'.format('mode', 'year', 'layer', 'current ms', 'baseline ms', 'change'))
+    for display_mode, mode_timings in benchmark_results['timings'].items():
+        for year, year_timings in mode_timings.items():
+            for layer, seconds in sorted(year_timings.items(), key=lambda layer_timing: -layer_timing[1]):
+                baseline_seconds = baseline_timings.get(display_mode, {}).get(year, {}).get(layer)
+                if baseline_seconds is None:
+                    print('{:<6} {:<5} {:<32} {:>12.3f} {:>12} {:>8}'.format(display_mode, year, layer, seconds * 1000, '-', '-'))
+                    continue
+
+                change = (seconds - baseline_seconds) / baseline_seconds if baseline_seconds > 0 else 0
+                regressed = change > threshold and seconds - baseline_seconds > regression_noise_floor
+                print('{:<6} {:<5} {:<32} {:>12.3f} {:>12.3f} {:>+7.0%}{}'.format(display_mode, year, layer, seconds * 1000, baseline_seconds * 1000, change, \
+                                                                                 ' REGRESSION' if regressed else ''))
+                if regressed:
+                    regressions.append(display_mode + ' ' + year + ' ' + layer + ': ' + '{:.3f}ms, baseline {:.3f}ms'.format(seconds * 1000, baseline_seconds * 1000))
+
+    return regressions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark constructing frames of display_colonial_map.py against a stored baseline')
+    parser.add_argument('--modes', nargs='+', choices=benchmark_display_modes, default=benchmark_display_modes, help='display modes to benchmark')
+    parser.add_argument('--years', nargs='+', type=int, default=benchmark_years, help='years to time the frames of')
+    parser.add_argument('--repeats', type=int, default=benchmark_repeats, help='number of times each frame is timed, the median is kept')
+    parser.add_argument('--threshold', type=float, default=regression_threshold, help='fraction slower than the baseline that counts as a regression')
+    parser.add_argument('--baseline', default=baseline_file, help='baseline results to compare against')
+    parser.add_argument('--output', default=results_file, help='where to write the results')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    # the process benchmarking a single display mode writes its timings here
+    parser.add_argument('--mode-results', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode_results is not None:
+        mode_timings = benchmark_display_mode(args.years, args.repeats)
+        with open(args.mode_results, 'w') as mode_results:
+            json.dump(mode_timings, mode_results)
+        sys.exit(0)
+
+    benchmark_results = run_benchmarks(args.modes, args.years, args.repeats)
+    with open(args.output, 'w') as results:
+        json.dump(benchmark_results, results, indent=1)
+
+    baseline_results = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as baseline:
+            baseline_results = json.load(baseline)
+        if baseline_results['machine'] != benchmark_results['machine'] or baseline_results['python'] != benchmark_results['python']:
+            print('Baseline was recorded on ' + baseline_results['machine'] + ', Python ' + baseline_results['python'] + ', so timings may not be comparable')
+
+    regressions = compare_with_baseline(benchmark_results, baseline_results, args.threshold)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline:
+            json.dump(benchmark_results, baseline, indent=1)
+        print('Saved the baseline to ' + args.baseline)
+    elif baseline_results is None:
+        print('No baseline at ' + args.baseline + ', run with --save-baseline to record one')
+    elif regressions:
+        print(str(len(regressions)) + ' timings regressed more than {:.0%} against the baseline:'.format(args.threshold))
+        for regression in regressions:
+            print('  ' + regression)
+        sys.exit(1)
+    else:
+        print('No regressions against the baseline')
@@ -16,19 +16,68 @@ import json
 import numpy as np
 import re
 import math
-import datetime
 import textwrap
+import os
+import sys
+import hashlib
+import time
+import concurrent.futures
+import multiprocessing
+import queue
+import threading
+import array
+import subprocess
+import tempfile
+import contextlib
+import cProfile
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import Rectangle
+from matplotlib.collections import Collection, LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
+from matplotlib.colors import to_rgba
 import matplotlib.animation as animation
 
 import cartopy.crs as ccrs
 import cartopy
 
+from geojson_stream import iterate_geojson_features, open_geojson_stream
+from interval_index import build_interval_index, active_interval_rows, ended_interval_rows
+
 output_file = True
 output_console = not output_file
+print_frame_years = False # print the year and population percentage of each frame as it's constructed, the console output slows every frame
+
+#Rendering the movie
+encoder_preset = 'medium' # x264 preset, faster presets encode quicker for a larger file
+encoder_crf = 23 # x264 constant rate factor, lower is higher quality for a larger file
+encoder_threads = 0 # 0 lets ffmpeg choose
+frame_queue_size = 8 # drawn frames allowed to queue up waiting for the encoder
+cache_static_layers = True # rasterize the base map once, and the state boundaries once per epoch, drawing only the changing layers each frame
+compositor_tolerance = 2 # largest difference, out of 255, allowed between a composited frame and a full draw of it, before falling back to full draws
+skip_duplicate_draws = True # skip drawing a frame identical to the frame before, piping the previous frame's bytes to ffmpeg again, which still encodes it
+output_ffmpeg_args = ['-vcodec', 'h264', '-preset', encoder_preset, '-crf', str(encoder_crf), '-threads', str(encoder_threads), '-framerate', '2', '-vf', 'fps=24', '-pix_fmt', 'yuv420p']
+parallel_render = False # render segments of the movie across a process pool, then join them in order. Only applies to output_file
+render_workers = os.cpu_count() # each worker loads the data and builds its own figure
+frames_per_render_segment = 16 # shorter segments balance the load better across workers, as later years take longer to draw
+render_work_directory = None # render in segments kept here with a manifest, so an interrupted render resumes from its last completed segment
+profile_frames = False # time each layer of every frame, and drawing and encoding it, writing the timings to profile_directory. Only applies to output_file
+profile_directory = './profile'
+profile_with_cprofile = False # also dump a cProfile of the render to profile_directory, for snakeviz, or for speedscope once converted to callgrind with pyprof2calltree
+
+#Source data, and the compiled binary cache of it
+data_directory = os.environ.get('COLONIAL_MAP_DATA_DIRECTORY', './data') # e.g. a synthetic data directory written by generate_synthetic_data.py
+use_data_cache = True # reload parsed datasets from the cache, only reparsing the source files that have changed
+rebuild_data_cache = False # ignore any existing cache entries and reparse every source file
+compile_data_cache_only = False # compile the cache for every dataset, then exit without rendering
+data_cache_directory = os.path.join(data_directory, 'cache')
+data_cache_version = 2 # increment when a dataset loader changes, to invalidate existing cache entries
+concurrent_file_load = True # load the independent datasets in parallel
+file_load_workers = 8
+railway_lines_file = 'Railway_Lines_vw_-3300151204749464250.geojson'
+railway_lines_archive = 'Railway_Lines_vw_-3300151204749464250.7z' # shipped compressed as the raw file is too large for github
 
 #Select what to display
 display_state_boundaries = True
@@ -37,6 +86,14 @@ loop_display = True
 display_colonisation = True
 display_blak_history = True
 display_white_blak_hx_back_to_back = False #ignores display_blak_history, as runs both scenarios back to back
+display_modes = ['blak', 'white', 'legal']
+display_mode = os.environ.get('COLONIAL_MAP_DISPLAY_MODE') # one of display_modes overrides the three settings above, as benchmark_colonial_map.py does
+if display_mode is not None:
+    if display_mode not in display_modes:
+        raise ValueError('COLONIAL_MAP_DISPLAY_MODE must be one of ' + ', '.join(display_modes) + ', not ' + display_mode)
+    display_colonisation = display_mode != 'legal'
+    display_blak_history = display_mode != 'white'
+    display_white_blak_hx_back_to_back = False
 display_explorers = True
 display_explorers = display_colonisation and display_explorers
 display_towns = True
@@ -149,6 +206,9 @@ ax.add_feature(cartopy.feature.OCEAN)
 
 ax.set_title(image_title)
 
+#everything drawn so far is the base map, which doesn't change from frame to frame
+base_map_artists = [fig.patch] + ax.get_children()
+
 state_dictionary = {}
 state_x_plots = {}
 state_y_plots = {}
@@ -157,6 +217,11 @@ explorer_x_plots = {}
 explorer_y_plots = {}
 list_items = []
 
+# layer timings of the frames rendered, recorded when profile_frames is set
+profile_records = []
+profiled_frame = None
+profiled_year = None
+
 #Initialise Population coords
 pop_x1 = 108
 pop_x2 = 119
@@ -182,7 +247,10 @@ town_scatter = ax.scatter([], [], s=20, c="#e1910a", zorder=town_zorder)
 unknown_town_est_year_scatter = ax.scatter([], [], s=20, c="#e1910a", zorder=town_zorder)
 closed_mission_scatter = ax.scatter([], [], s=10, c="lightblue", marker='D', zorder=mission_zorder)
 open_mission_scatter = ax.scatter([], [], s=15, c="blue", marker='D', zorder=mission_zorder)
-massacre_scatter = ax.scatter([], [], s=20, facecolors="#cf210a", edgecolors="#cf210a", alpha=0.35, zorder=massacre_zorder)
+# massacre opacity is carried in each site's colour, so they can fade individually with age
+massacre_opacity = 0.35
+massacre_edge_colour = to_rgba('#690a03', massacre_opacity)
+massacre_scatter = ax.scatter([], [], s=20, facecolors="#cf210a", edgecolors="#cf210a", zorder=massacre_zorder)
 
 #initialise text
 acknowledgment_text = ax.text(115.0, -26.0, '', horizontalalignment='left', color='0.1', alpha=0, fontsize=10)
@@ -206,66 +274,145 @@ incarcerated_indigenous_txt = ax.text(156.05, -15, '', horizontalalignment='left
 incarcerated_nonindigenous_txt = ax.text(156.05, -15.5, '', horizontalalignment='left', color='0.2', fontsize=7)
 
 # initialise pools for dynamic use
-number_conflict_lines = 100 #should only require ~70 at most
-reference_conflicts = []
-if display_australian_conflict:
-    for i in range(number_conflict_lines):
-        reference_conflicts.append(ax.text(106, -9, '', horizontalalignment='left', color='0.1', fontsize=7, zorder=scrolling_text_zorder))    
+# artists are only created as a frame first needs them, then reused by later frames
+# each pool tracks which artists a frame used, so only those left over from the frame before need blanking
+artist_pools = {}
+
+def create_artist_pool(pool_name, new_artist):
+    """
+        Sets up an empty pool of artists, grown on demand
+
+        Parameters
+        ----------
+        pool_name
+            String: name the pool is reported under
+
+        new_artist
+            Function: creates one artist of the pool on the axes
+
+        Returns
+        -------
+        artist_pool
+            Dictionary: 
+                'artists' - artists created so far, in the order they are handed out
+                'new_artist' - function creating an artist
+                'properties' - properties last set on each artist
+                'used' - indices of the artists handed out since the pool was last released
+                'released' - indices of the artists in use when the pool was last released, or None once blank_released_pool_artists has blanked those not handed out again
+    """
+    artist_pool = {'artists': [], 'new_artist': new_artist, 'properties': [], 'used': set(), 'released': None}
+    artist_pools[pool_name] = artist_pool
+    return artist_pool
+
+def pool_artist(artist_pool, index, **properties):
+    """
+        Hands out an artist of the pool, growing the pool if it hasn't yet needed that many artists. 
+        Only the properties that differ from those last set on the artist are set again
+
+        Parameters
+        ----------
+        artist_pool
+            Dictionary: built by create_artist_pool
+
+        index
+            Integer: position of the artist in the pool
+
+        properties
+            Keyword arguments: artist properties to set, named as their set_ methods, e.g. text='Massacres', color='0.1'
+
+        Returns
+        -------
+        artist
+            MatplotLib artist
+    """
+    while len(artist_pool['artists']) <= index:
+        artist_pool['artists'].append(artist_pool['new_artist']())
+        artist_pool['properties'].append({})
+    artist = artist_pool['artists'][index]
+    artist_pool['used'].add(index)
+
+    set_properties = artist_pool['properties'][index]
+    for property_name, value in properties.items():
+        # colours can be numpy arrays, which don't compare to a single truth value
+        compared_value = tuple(value) if isinstance(value, np.ndarray) else value
+        if property_name not in set_properties or set_properties[property_name] != compared_value:
+            getattr(artist, 'set_' + property_name)(value)
+            set_properties[property_name] = compared_value
+
+    return artist
+
+def release_pool_artists(artist_pool):
+    """
+        Frees every artist of the pool to be handed out again. 
+        The artists aren't blanked straight away, as most are reused by the same frame, 
+        blank_released_pool_artists blanks those that weren't so they don't ghost into the frame
+
+        Parameters
+        ----------
+        artist_pool
+            Dictionary: built by create_artist_pool
+    """
+    if artist_pool['released'] is None:
+        artist_pool['released'] = artist_pool['used']
+    else:
+        artist_pool['released'] |= artist_pool['used']
+    artist_pool['used'] = set()
+
+def blank_released_pool_artists():
+    """
+        Blanks the artists of released pools that haven't been handed out again since they were released
+    """
+    for artist_pool in artist_pools.values():
+        if artist_pool['released'] is None:
+            continue
+
+        for index in artist_pool['released'] - artist_pool['used']:
+            artist = artist_pool['artists'][index]
+            if isinstance(artist, Text):
+                if artist_pool['properties'][index].get('text') != "":
+                    artist.set_text("")
+                    artist_pool['properties'][index]['text'] = ""
+            else:
+                artist.set_data([], [])
+        artist_pool['released'] = None
+
+def report_artist_pools():
+    """
+        Prints the high-water mark of each artist pool, the most artists it has needed in any frame
+    """
+    for pool_name, artist_pool in artist_pools.items():
+        if artist_pool['artists']:
+            print('Artist pool ' + pool_name + ': ' + str(len(artist_pool['artists'])) + ' artists')
 
-number_defining_moment_lines_to_display = 98 # number of text references need to be more than number we want to display due to wordwrap exploding number count
-reference_defining_moments = []
-if display_defining_moments:
-    for i in range(int(number_defining_moment_lines_to_display * 1.7)):
-        reference_defining_moments.append(ax.text(153, -11, '', horizontalalignment='left', color='0.1', fontsize=7, zorder=scrolling_text_zorder))
+reference_conflicts = create_artist_pool('conflicts', lambda: ax.text(106, -9, '', horizontalalignment='left', color='0.1', fontsize=7, zorder=scrolling_text_zorder))
+
+number_defining_moment_lines_to_display = 98
+reference_defining_moments = create_artist_pool('defining moments', lambda: ax.text(153, -11, '', horizontalalignment='left', color='0.1', fontsize=7, zorder=scrolling_text_zorder))
 
 number_massacre_lines_to_display = 95
-reference_massacre_lines = []
-if display_massacre_text:
-    for i in range(number_massacre_lines_to_display + 1):
-        reference_massacre_lines.append(ax.text(162, -11, '', horizontalalignment='left', color='0.1', fontsize=7, zorder=scrolling_text_zorder))
-
-number_milestones_to_display = 169 # 13 x 13 matrix
-reference_milestones = []
-if display_first_nations_milestones:
-    for i in range(number_milestones_to_display):
-        reference_milestones.append(ax.text(120, -35, '', horizontalalignment='left', color='0.1', fontsize=8))
-
-number_state_boundary_features = 10
-reference_state_boundary_features = []
-number_state_names = 15
-reference_state_names = []
-if display_state_boundaries:
-    for i in range(number_state_boundary_features):
-        state_boundary_plot, = ax.plot([],[], color='0.7', linewidth=0.5, zorder=state_boundary_zorder)
-        reference_state_boundary_features.append(state_boundary_plot)
-    
-    for i in range(number_state_names):
-        reference_state_names.append(ax.text(110, -25, '', verticalalignment='center', horizontalalignment='left', color='0.6', fontsize=10, zorder=state_boundary_zorder))
-
-number_legislation = 10000
-reference_legislation = []
-if display_legal_controls:
-    for i in range(number_legislation):
-        reference_legislation.append(ax.text(110, -25, '', horizontalalignment='left', color='0', fontsize=6))
-
-number_explorer_paths = 40
-reference_explorer_paths = []
-number_explorer_names = 40
-reference_explorer_names = []
-if display_explorers:
-    for i in range(number_explorer_paths):
-        path_plot, = ax.plot([], [], color='purple', linestyle='dotted', alpha=0, zorder=explorer_zorder)
-        reference_explorer_paths.append(path_plot)
-
-    for i in range(number_explorer_names):
-        reference_explorer_names.append(ax.text(106, -27.5, '', horizontalalignment='left', color='0', fontsize=7, alpha=0, zorder=scrolling_text_zorder))
-
-number_railway_segments = 20000
-reference_railway_segments = []
+reference_massacre_lines = create_artist_pool('massacre lines', lambda: ax.text(162, -11, '', horizontalalignment='left', color='0.1', fontsize=7, zorder=scrolling_text_zorder))
+
+reference_milestones = create_artist_pool('milestones', lambda: ax.text(120, -35, '', horizontalalignment='left', color='0.1', fontsize=8))
+
+reference_state_boundary_features = create_artist_pool('state boundaries', lambda: ax.plot([],[], color='0.7', linewidth=0.5, zorder=state_boundary_zorder)[0])
+reference_state_names = create_artist_pool('state names', lambda: ax.text(110, -25, '', verticalalignment='center', horizontalalignment='left', color='0.6', fontsize=10, zorder=state_boundary_zorder))
+mapped_state_boundary_epoch = None
+mapped_state_boundary_artists = []
+
+reference_legislation = create_artist_pool('legislation', lambda: ax.text(110, -25, '', horizontalalignment='left', color='0', fontsize=6))
+
+reference_explorer_paths = create_artist_pool('explorer paths', lambda: ax.plot([], [], color='purple', linestyle='dotted', alpha=0, zorder=explorer_zorder)[0])
+reference_explorer_names = create_artist_pool('explorer names', lambda: ax.text(106, -27.5, '', horizontalalignment='left', color='0', fontsize=7, alpha=0, zorder=scrolling_text_zorder))
+mapped_explorer_window = ()
+
+# one collection of segments per railway line status, drawn in this order
+# caps and joins match those of individually plotted lines
+railway_line_styles = {'commenced': ('0.5', 'dashed', 'butt'), 'opened': ('0.3', '-', 'projecting'), 'closed': ('0.6', 'dotted', 'butt')}
+railway_collections = {}
 if display_railway_lines:
-    for i in range(number_railway_segments):
-        line_plot, = ax.plot([], [], color='1', linestyle='dashed', linewidth=0.7, zorder=railway_zorder)
-        reference_railway_segments.append(line_plot)
+    for railway_status, (railway_colour, railway_line_style, railway_capstyle) in railway_line_styles.items():
+        railway_collections[railway_status] = LineCollection([], colors=railway_colour, linestyles=railway_line_style, linewidths=0.7, capstyle=railway_capstyle, joinstyle='round', zorder=railway_zorder)
+        ax.add_collection(railway_collections[railway_status], autolim=False)
 
 def init():   
     """
@@ -275,6 +422,320 @@ def init():
     global list_items
     return list_items
 
+def data_file_path(file_name):
+    """
+        Builds the path of a file in the data directory
+
+        Parameters
+        ----------
+        file_name
+            String: name of the file, relative to the data directory
+
+        Returns
+        -------
+        file_path
+            String: path of the file
+    """
+    return os.path.join(data_directory, file_name)
+
+# signature of each source file the datasets were loaded from, None where it was read outside the data cache so it wasn't computed
+data_source_signatures = {}
+
+def register_data_sources(source_files):
+    """
+        Records source files read outside of load_cached_dataset, such as the GeoJSON files named in the 'States.csv' and 'Explorers.csv' files, 
+        so a render's manifest covers every file the frames are drawn from. Their signatures are computed when the manifest is built
+
+        Parameters
+        ----------
+        source_files
+            List: names of the files, relative to the data directory
+    """
+    for source_file in source_files:
+        data_source_signatures.setdefault(source_file, None)
+
+def source_file_signature(file_path, cached_signature=None):
+    """
+        Fingerprints a source file so that cache entries built from it can be invalidated when it changes.
+        The file contents are only hashed when the modification time or size differ from the cached signature, 
+        so an unchanged file costs a single stat call, and a file that is touched but not changed doesn't invalidate the cache
+
+        Parameters
+        ----------
+        file_path
+            String: path of the source file
+
+        (Optional) cached_signature
+            Dictionary: signature of the file recorded in the cache manifest
+
+        Returns
+        -------
+        signature
+            Dictionary: 'mtime_ns', 'size' and 'sha1' of the file
+    """
+    file_stat = os.stat(file_path)
+    if cached_signature is not None and cached_signature.get('mtime_ns') == file_stat.st_mtime_ns and cached_signature.get('size') == file_stat.st_size:
+        return cached_signature
+
+    file_hash = hashlib.sha1()
+    with open(file_path, 'rb') as source_file:
+        for chunk in iter(lambda: source_file.read(1024 * 1024), b''):
+            file_hash.update(chunk)
+
+    return {'mtime_ns': file_stat.st_mtime_ns, 'size': file_stat.st_size, 'sha1': file_hash.hexdigest()}
+
+def read_data_cache(cache_path, cache_format):
+    """
+        Reads a dataset from the compiled data cache
+
+        Parameters
+        ----------
+        cache_path
+            String: path of the cache entry, without the file extension
+
+        cache_format
+            String: 'parquet', 'pickle' or 'npz'
+
+        Returns
+        -------
+        dataset
+            Panda DataFrame for the 'parquet' and 'pickle' formats, dictionary of Numpy arrays for the 'npz' format
+    """
+    if cache_format == 'parquet':
+        return pd.read_parquet(cache_path + '.parquet')
+    elif cache_format == 'pickle':
+        return pd.read_pickle(cache_path + '.pkl')
+    elif cache_format == 'npz':
+        with np.load(cache_path + '.npz', allow_pickle=False) as cached_arrays:
+            return {array_name: cached_arrays[array_name] for array_name in cached_arrays.files}
+    else:
+        raise ValueError('Unknown data cache format: ' + str(cache_format))
+
+def write_replacing(file_path, write_file):
+    """
+        Writes a file to a uniquely named temporary file beside it, then moves it into place in one step, 
+        so an interrupted write, or another process writing the same file, never leaves a partial or mismatched file behind
+
+        Parameters
+        ----------
+        file_path
+            String: path of the file to write
+
+        write_file
+            Function: writes the file, given the temporary path to write it to
+    """
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', prefix=os.path.basename(file_path) + '.', suffix='.tmp')
+    os.close(file_descriptor)
+    try:
+        write_file(temporary_path)
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+def write_data_cache(cache_path, dataset):
+    """
+        Writes a dataset to the compiled data cache.
+        DataFrames are stored as Parquet where the columns allow it, otherwise pickled; dictionaries of Numpy arrays are stored as .npz
+
+        Parameters
+        ----------
+        cache_path
+            String: path of the cache entry, without the file extension
+
+        dataset
+            Panda DataFrame or dictionary of Numpy arrays: dataset to store
+
+        Returns
+        -------
+        cache_format
+            String: format the dataset was stored in, 'parquet', 'pickle' or 'npz'
+    """
+    if isinstance(dataset, dict):
+        def write_npz(temporary_path):
+            # savez adds a .npz extension to a path without one, so give it the open file
+            with open(temporary_path, 'wb') as cache_file:
+                np.savez(cache_file, **dataset)
+        write_replacing(cache_path + '.npz', write_npz)
+        return 'npz'
+
+    def write_parquet(temporary_path):
+        dataset.to_parquet(temporary_path)
+        pd.testing.assert_frame_equal(dataset, pd.read_parquet(temporary_path))
+
+    try:
+        # Parquet needs string column names and consistently typed columns, which not all of the raw files provide,
+        # so only keep the Parquet copy if it reads back identical to the parsed dataset
+        write_replacing(cache_path + '.parquet', write_parquet)
+        return 'parquet'
+    except (ImportError, ValueError, TypeError, NotImplementedError, AssertionError):
+        pass
+
+    write_replacing(cache_path + '.pkl', dataset.to_pickle)
+    return 'pickle'
+
+def write_cache_manifest(manifest_path, manifest):
+    """
+        Writes the manifest of a cache entry, replacing any existing manifest in one step, as the data files are,
+        so an interrupted write or another process loading the same dataset never sees a partial manifest
+
+        Parameters
+        ----------
+        manifest_path
+            String: path of the manifest file
+
+        manifest
+            Dictionary: version, loader arguments, source file signatures and format of the cache entry
+    """
+    def write_manifest(temporary_path):
+        with open(temporary_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+    write_replacing(manifest_path, write_manifest)
+
+def load_cached_dataset(cache_name, source_files, loader, *loader_args):
+    """
+        Loads a dataset from the compiled data cache, only parsing the source files when the cache entry is missing or stale.
+        A freshly parsed dataset is written back to the cache for the next run
+
+        Parameters
+        ----------
+        cache_name
+            String: name of the cache entry
+
+        source_files
+            List: names of the files, relative to the data directory, the dataset is parsed from
+
+        loader
+            Function: parses the source files, returning a Panda DataFrame or a dictionary of Numpy arrays
+
+        loader_args
+            Arguments passed to the loader, recorded in the cache entry as the parsed result can depend on them
+
+        Returns
+        -------
+        dataset
+            Panda DataFrame or dictionary of Numpy arrays: as returned by the loader
+    """
+    if not use_data_cache:
+        register_data_sources(source_files)
+        return loader(*loader_args)
+
+    cache_path = os.path.join(data_cache_directory, cache_name)
+    manifest_path = cache_path + '.json'
+
+    cached_manifest = {}
+    if not rebuild_data_cache and os.path.exists(manifest_path):
+        try:
+            with open(manifest_path) as manifest_file:
+                cached_manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            cached_manifest = {}
+
+    cached_sources = cached_manifest.get('sources', {})
+    manifest = {'version': data_cache_version, 'loader_args': repr(loader_args), 'sources': {}}
+    for source_file in source_files:
+        manifest['sources'][source_file] = source_file_signature(data_file_path(source_file), cached_sources.get(source_file))
+
+    data_source_signatures.update(manifest['sources'])
+
+    cache_is_current = cached_manifest.get('version') == manifest['version'] and cached_manifest.get('loader_args') == manifest['loader_args'] \
+        and cached_sources.keys() == manifest['sources'].keys() \
+        and all(cached_sources[source_file]['sha1'] == signature['sha1'] for source_file, signature in manifest['sources'].items())
+
+    if cache_is_current:
+        try:
+            dataset = read_data_cache(cache_path, cached_manifest['format'])
+            if cached_sources != manifest['sources']:
+                # contents unchanged, but record the new modification times to avoid rehashing the files on the next run
+                manifest['format'] = cached_manifest['format']
+                write_cache_manifest(manifest_path, manifest)
+            return dataset
+        except Exception as err:
+            print(f"Unexpected {err=}, {type(err)=}")
+            print("Could not read data cache, reparsing: " + cache_name)
+
+    dataset = loader(*loader_args)
+
+    os.makedirs(data_cache_directory, exist_ok=True)
+    manifest['format'] = write_data_cache(cache_path, dataset)
+    write_cache_manifest(manifest_path, manifest)
+
+    return dataset
+
+def timed_dataset_load(dataset_name, source_files, loader, *loader_args):
+    """
+        Loads a dataset through the compiled data cache, timing how long it takes
+
+        Parameters
+        ----------
+        dataset_name
+            String: name of the dataset, also used as the name of its cache entry
+
+        source_files
+            List: names of the files, relative to the data directory, the dataset is parsed from
+
+        loader
+            Function: parses the source files
+
+        loader_args
+            Arguments passed to the loader
+
+        Returns
+        -------
+        dataset
+            Panda DataFrame or dictionary of Numpy arrays: as returned by the loader
+
+        elapsed_seconds
+            Float: wall time taken to load the dataset
+    """
+    start_time = time.perf_counter()
+    dataset = load_cached_dataset(dataset_name, source_files, loader, *loader_args)
+    return dataset, time.perf_counter() - start_time
+
+def load_datasets(dataset_loaders):
+    """
+        Loads independent datasets, fanning them out across a thread pool when concurrent_file_load is set.
+        Parsing is dominated by file I/O and openpyxl, so the datasets overlap well on threads
+
+        Parameters
+        ----------
+        dataset_loaders
+            Dictionary: dataset name -> tuple of (source files, loader, loader arguments...)
+
+        Returns
+        -------
+        datasets
+            Dictionary: dataset name -> loaded dataset
+    """
+    start_time = time.perf_counter()
+    load_results = {}
+
+    if concurrent_file_load and len(dataset_loaders) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(file_load_workers, len(dataset_loaders))) as executor:
+            load_futures = {dataset_name: executor.submit(timed_dataset_load, dataset_name, *dataset_loader) for dataset_name, dataset_loader in dataset_loaders.items()}
+            for dataset_name, load_future in load_futures.items():
+                load_results[dataset_name] = load_future.result()
+    else:
+        for dataset_name, dataset_loader in dataset_loaders.items():
+            load_results[dataset_name] = timed_dataset_load(dataset_name, *dataset_loader)
+
+    for dataset_name, (dataset, elapsed_seconds) in load_results.items():
+        print('Loaded ' + dataset_name + ' in ' + '{:.3f}'.format(elapsed_seconds) + 's')
+    if load_results:
+        print('Loaded ' + str(len(load_results)) + ' datasets in ' + '{:.3f}'.format(time.perf_counter() - start_time) + 's')
+
+    return {dataset_name: dataset for dataset_name, (dataset, elapsed_seconds) in load_results.items()}
+
+def compile_data_cache():
+    """
+        Parses every dataset in the data directory into the compiled data cache, 
+        so subsequent renders in any display mode load from the cache
+    """
+    init_file_load(True, True, True)
+    init_colonial_file_load(True, True, True, railway_lines_source_file() is not None, True, True, True, True, True)
+    init_legal_file_load()
+
 def init_file_load(display_state_boundaries=False, display_first_nations_milestones=False, display_australian_conflict=False):
     """
         Loads files into memory on start 
@@ -310,25 +771,19 @@ def init_file_load(display_state_boundaries=False, display_first_nations_milesto
                 'Current' value in the 'To' field replaced with the 'final_anime_year' value
     """
 
-    #Year [0], Indigenous Population [1], Colonial Population [2], Total Population [3], Indigenous percentage [4], Indigenous Percentage drop from Baseline [5]
-    population = pd.read_csv('./data/population.csv', index_col='Year')
+    population = load_cached_dataset('population', ['Population.csv'], read_population)
     state_boundaries = pd.DataFrame()
     first_nations_milestones = pd.DataFrame()
     australian_conflicts = pd.DataFrame()
 
     if display_state_boundaries:  
-        state_boundaries = pd.read_csv('./data/States.csv', index_col='YearEffectiveFrom')
+        state_boundaries = load_cached_dataset('state_boundaries', ['States.csv'], read_state_boundaries)
 
     if display_first_nations_milestones:
-        first_nations_milestones = pd.read_csv('./data/First Nations milestones.csv', index_col=None)
+        first_nations_milestones = load_cached_dataset('first_nations_milestones', ['First Nations milestones.csv'], read_first_nations_milestones)
 
     if display_australian_conflict:
-        australian_conflicts = pd.read_csv('./data/Australia in Conflict.csv')
-
-        australian_conflicts['From'] = pd.to_numeric(australian_conflicts['From'])
-        
-        australian_conflicts['To'].replace('Current', final_anime_year, inplace=True)
-        australian_conflicts['To'] = pd.to_numeric(australian_conflicts['To'])
+        australian_conflicts = load_cached_dataset('australian_conflicts', ['Australia in Conflict.csv'], read_australian_conflicts, final_anime_year)
 
     return population, state_boundaries, first_nations_milestones, australian_conflicts
 
@@ -349,7 +804,7 @@ def init_colonial_file_load(display_explorers=False, display_towns=False, displa
             boolean: whether to load the 'undated_city_list.csv' file
 
          (Optional) display_railway_lines
-            boolean: whether to load the 'Railway_Lines_vw_-3300151204749464250.geojson' and 'operating_dates_of_australian_railway_lines.csv' files
+            boolean: whether to load the 'Railway_Lines_vw_-3300151204749464250.geojson' (or '.7z') and 'operating_dates_of_australian_railway_lines.csv' files
 
         (Optional) display_massacre_sites
             boolean: whether to load the 'ColonialMassacresInAustralia_Data.json' file
@@ -381,8 +836,8 @@ def init_colonial_file_load(display_explorers=False, display_towns=False, displa
                 not indexed
 
         railways
-            Panda DataFrame: containing the normalised contents of the 'Railway_Lines_vw_-3300151204749464250.geojson' file
-                indexed on the 'properties.name' attribute
+            Dictionary of Numpy arrays: railway line geometry from the 'Railway_Lines_vw_-3300151204749464250.geojson' file, or the '.7z' archive it is shipped in,
+                see read_railways
 
         railway_operating_dates
             Panda DataFrame: containing the contents of the 'operating_dates_of_australian_railway_lines.csv' file
@@ -413,81 +868,40 @@ def init_colonial_file_load(display_explorers=False, display_towns=False, displa
                 not indexed
 
     """
-    explorers = pd.DataFrame()
-    cities = pd.DataFrame()
-    undated_cities = pd.DataFrame()
-    railways = pd.DataFrame()
-    railway_operating_dates = pd.DataFrame()
-    massacres = pd.DataFrame()
-    missions = pd.DataFrame()
-    deaths_in_custody = pd.DataFrame()
-    incarceration_rates = pd.DataFrame()
-    defining_moments = pd.DataFrame()
-
+    #dataset name: (source files, loader, loader arguments...)
+    dataset_loaders = {}
     if display_explorers:
-        #From [0], To [1], Explorer [2], GeoJson [3], MapReference [4]
-        explorers = pd.read_csv('./data/Explorers.csv', index_col='From')
+        dataset_loaders['explorers'] = (['Explorers.csv'], read_explorers)
     if display_towns:
-        #Town Name [0], Title [1], HREF Text [2], State [3], wikipedia href [4], dms_latitude [5], dms_longitude [6], dec_latitude [7], dec_longitude [8], established date (city page) [9], established date (parent page) [10], population [11]
-        cities = pd.read_csv('./data/city_list.csv', header=None, quotechar='"', index_col=9).sort_index()
+        dataset_loaders['cities'] = (['city_list.csv'], read_cities)
     if display_undated_towns:
-        undated_cities = pd.read_csv('./data/undated_city_list.csv', header=None, quotechar='"')
+        dataset_loaders['undated_cities'] = (['undated_city_list.csv'], read_undated_cities)
     if display_railway_lines:
-        #type: FeatureCollection, crs, features -> type: feature, id, geometry, properties -> objectid, featuressubtype, name, operational_status, feature_date, feature_source, attribute_date, attribute_source, source_ufi, source_jurisdiction, custodian_agency, custodian licensing, loading_date, track_gauge, ground_relationship, tracks, length_km, alternative_name, owner, source_supply_date, infrastructuretype, field, globalid
-        #                                          type: feature, id, geometry, coordinates        
-        railway_line_data = json.load(open('./data/Railway_Lines_vw_-3300151204749464250.geojson'))
-        railways = pd.json_normalize(railway_line_data, 'features', errors='ignore')
-        railways.set_index('properties.name', inplace=True)
-        railways = railways.sort_index()  
-
-        #Name, Features, Alternative Name, Wikipedia, Commenced, Opened, Closed, LineLength(km)
-        railway_operating_dates = pd.read_csv('./data/operating_dates_of_australian_railway_lines.csv')
-
+        dataset_loaders['railways'] = ([railway_lines_source_file()], read_railways)
+        dataset_loaders['railway_operating_dates'] = (['operating_dates_of_australian_railway_lines.csv'], read_railway_operating_dates)
     if display_massacre_sites:
-        #features -> type: feature, geometry, properties -> name, description, id, source, datestart, dateend, udatestart, udateend, latitude, longitude, linkback, Source_ID, LanguageGroup, Colony, StateOrTerritory, PoliceDistrict, KnownDate, AttackTime, Victims, VictimsDead, VictimDescription, Attackers, AttackersDead, AttackerDescription, Transport, Motive, WeaponsUsed, CorroborationRating, TLCMapLinkBack, TLCMapDataset
-        massacre_data = json.load(open('./data/ColonialMassacresInAustralia_Data.json'))
-        massacres = pd.json_normalize(massacre_data, 'features', errors='ignore')
-        massacres['properties.datestart'] = pd.to_datetime(massacres['properties.datestart'])
-        massacres['yearofmassacre'] = massacres['properties.datestart'].dt.year
-        massacres.set_index('yearofmassacre', inplace=True)
-        massacres = massacres.sort_index()
-
+        dataset_loaders['massacres'] = (['ColonialMassacresInAustralia_Data.json'], read_massacres)
     if display_missions:
-        # Mission, State, From, To, Run By, Lat, Lon, Wikipedia
-        missions = pd.read_csv('./data/Aboriginal and Torres Strait Islander Missions and Reserves.csv')
-        
-        missions['From'] = pd.to_numeric(missions['From'])
-
-        missions['To'].replace('current', final_anime_year + 1, inplace=True)
-        missions['To'] = pd.to_numeric(missions['To'])
-
-        missions['Lat'] = missions['Lat'].apply(dms2dec)
-        missions['Lon'] = missions['Lon'].apply(dms2dec)
-
+        dataset_loaders['missions'] = (['Aboriginal and Torres Strait Islander Missions and Reserves.csv'], read_missions, final_anime_year)
     if display_deaths_in_custody:
-        #Year,Prison,Police,Youth detention,Other,Total
-        #Year reporting is from July to June, so need to take the right hand value as the year
-        deaths_in_custody = pd.read_csv('./data/Deaths in Custody.csv')
-        split_years = deaths_in_custody['Year'].str.split(pat="–", n=1, expand=True)
-        deaths_in_custody['StartReportingYear'] = split_years[0].astype(int)
-        deaths_in_custody['EndReportingYear'] = split_years[1].astype(int)
-        deaths_in_custody.set_index('StartReportingYear', inplace=True)
-        deaths_in_custody = deaths_in_custody.sort_index()
-
+        dataset_loaders['deaths_in_custody'] = (['Deaths in Custody.csv'], read_deaths_in_custody)
     if display_incarceration_rates:        
-        incarceration_cols = [0,3,4]
-        inceration_skipped_rows = [0,1,2,3,4,6]
-        incarceration_dtypes = {'Reference period': pd.Int32Dtype(), 'Aboriginal and Torres Strait Islander': pd.Int32Dtype(), 'Non-Indigenous': pd.Int32Dtype()}
-        incarceration_rates_1 = pd.read_excel('./data/Prisoner characteristics, Australia (Tables 1 to 13) 1997 - 2013.xlsx', sheet_name='Table _2', header=0, skiprows=5, skipfooter=20, usecols=incarceration_cols, index_col=0, dtype=incarceration_dtypes, keep_default_na=True)
-        incarceration_rates_2 = pd.read_excel('./data/Prisoner characteristics, Australia (Tables 1 to 13) 2014 - 2024.xlsx', sheet_name='Table 2', header=0, skiprows=inceration_skipped_rows, skipfooter=13, usecols=incarceration_cols, index_col=0, dtype=incarceration_dtypes, keep_default_na=True)
-        incarceration_rates = pd.concat([incarceration_rates_1, incarceration_rates_2])
-        incarceration_rates['Percentage'] = incarceration_rates['Aboriginal and Torres Strait Islander'] / (incarceration_rates['Aboriginal and Torres Strait Islander'] + incarceration_rates['Non-Indigenous'])
-
+        dataset_loaders['incarceration_rates'] = (['Prisoner characteristics, Australia (Tables 1 to 13) 1997 - 2013.xlsx', 'Prisoner characteristics, Australia (Tables 1 to 13) 2014 - 2024.xlsx'], read_incarceration_rates)
     if display_defining_moments:
-        defining_moments = pd.read_csv('./data/Australian defining moments.csv')
-
-        defining_moments['From'] = pd.to_numeric(defining_moments['From'])
-        defining_moments['To'] = pd.to_numeric(defining_moments['To'])
+        dataset_loaders['defining_moments'] = (['Australian defining moments.csv'], read_defining_moments)
+
+    datasets = load_datasets(dataset_loaders)
+
+    explorers = datasets.get('explorers', pd.DataFrame())
+    cities = datasets.get('cities', pd.DataFrame())
+    undated_cities = datasets.get('undated_cities', pd.DataFrame())
+    railways = datasets.get('railways', {})
+    railway_operating_dates = datasets.get('railway_operating_dates', pd.DataFrame())
+    massacres = datasets.get('massacres', pd.DataFrame())
+    missions = datasets.get('missions', pd.DataFrame())
+    deaths_in_custody = datasets.get('deaths_in_custody', pd.DataFrame())
+    incarceration_rates = datasets.get('incarceration_rates', pd.DataFrame())
+    defining_moments = datasets.get('defining_moments', pd.DataFrame())
     
     return explorers, cities, undated_cities, railways, railway_operating_dates, massacres, missions, deaths_in_custody, incarceration_rates, defining_moments
 
@@ -536,6 +950,392 @@ def dms2dec(dms_str):
     
     return dec_value
 
+def read_population():
+    """
+        Parses the 'Population.csv' file
+
+        Returns
+        -------
+        population
+            Panda DataFrame: indexed on the 'Year' column
+    """
+    #Year [0], Indigenous Population [1], Colonial Population [2], Total Population [3], Indigenous percentage [4], Indigenous Percentage drop from Baseline [5]
+    return pd.read_csv(data_file_path('Population.csv'), index_col='Year')
+
+def read_state_boundaries():
+    """
+        Parses the 'States.csv' file
+
+        Returns
+        -------
+        state_boundaries
+            Panda DataFrame: indexed on the 'YearEffectiveFrom' column
+    """
+    return pd.read_csv(data_file_path('States.csv'), index_col='YearEffectiveFrom')
+
+def read_state_boundary_geometry(state_boundaries):
+    """
+        Parses the boundary GeoJSON and state name files referenced by each epoch in the 'States.csv' file, 
+        each file only parsed once however many epochs share it
+
+        Parameters
+        ----------
+        state_boundaries
+            Panda DataFrame: contents of the 'States.csv' file, indexed on the 'YearEffectiveFrom' column
+
+        Returns
+        -------
+        state_boundary_geometry
+            Dictionary: keyed on the 'YearEffectiveFrom' of each epoch
+                'features' - list of Numpy Float Arrays, longitude and latitude of each boundary
+                'names' - list of state name, longitude, latitude tuples for the map being displayed
+    """
+    boundary_features = {}
+    boundary_names = {}
+    state_boundary_geometry = {}
+    register_data_sources(sorted(set(state_boundaries['GeoJsonFile']) | set(state_boundaries['StateNameFile'])))
+
+    for epoch, boundary_row in state_boundaries.iterrows():
+        state_boundary_path = boundary_row['GeoJsonFile']
+        if state_boundary_path not in boundary_features:
+            with open(data_file_path(state_boundary_path)) as state_boundary_file:
+                state_geo_paths = json.load(state_boundary_file)
+            boundary_features[state_boundary_path] = [np.asarray(feature['geometry']['coordinates'], dtype=float) for feature in state_geo_paths['features']]
+
+        state_text_path = boundary_row['StateNameFile']
+        if state_text_path not in boundary_names:
+            state_names = pd.read_csv(data_file_path(state_text_path))
+            if display_colonisation:
+                state_name_list = state_names.loc[state_names["Mapping"] == "Colonisation"]
+            else:
+                state_name_list = state_names.loc[state_names["Mapping"] == "Legislation"]
+            boundary_names[state_text_path] = list(zip(state_name_list['StateName'], state_name_list['Longitude'].astype(float), state_name_list['Latitude'].astype(float)))
+
+        state_boundary_geometry[epoch] = {'features': boundary_features[state_boundary_path], 'names': boundary_names[state_text_path]}
+
+    return state_boundary_geometry
+
+def read_first_nations_milestones():
+    """
+        Parses the 'First Nations milestones.csv' file
+
+        Returns
+        -------
+        first_nations_milestones
+            Panda DataFrame: not indexed
+    """
+    return pd.read_csv(data_file_path('First Nations milestones.csv'), index_col=None)
+
+def read_australian_conflicts(final_anime_year):
+    """
+        Parses the 'Australia in Conflict.csv' file
+
+        Parameters
+        ----------
+        final_anime_year
+            Integer: year to replace 'Current' end dates with
+
+        Returns
+        -------
+        australian_conflicts
+            Panda DataFrame: not indexed
+                'Current' value in the 'To' field replaced with the 'final_anime_year' value
+    """
+    australian_conflicts = pd.read_csv(data_file_path('Australia in Conflict.csv'))
+
+    australian_conflicts['From'] = pd.to_numeric(australian_conflicts['From'])
+    
+    australian_conflicts['To'] = australian_conflicts['To'].replace('Current', final_anime_year)
+    australian_conflicts['To'] = pd.to_numeric(australian_conflicts['To'])
+
+    return australian_conflicts
+
+def read_explorers():
+    """
+        Parses the 'Explorers.csv' file
+
+        Returns
+        -------
+        explorers
+            Panda DataFrame: indexed on the 'From' column
+    """
+    #From [0], To [1], Explorer [2], GeoJson [3], MapReference [4]
+    return pd.read_csv(data_file_path('Explorers.csv'), index_col='From')
+
+def read_explorer_paths(explorers):
+    """
+        Parses the GeoJSON path of each explorer listed in the 'Explorers.csv' file
+
+        Parameters
+        ----------
+        explorers
+            Panda DataFrame: contents of the 'Explorers.csv' file
+
+        Returns
+        -------
+        explorer_paths
+            Dictionary: keyed on the 'GeoJson' file name, list of Numpy Float Arrays of the longitude and latitude of each path feature
+    """
+    explorer_paths = {}
+    register_data_sources(sorted(explorers['GeoJson'].unique()))
+
+    for explorer_file_path in explorers['GeoJson'].unique():
+        with open(data_file_path(explorer_file_path)) as explorer_file:
+            explorer_geo_path = json.load(explorer_file)
+        explorer_paths[explorer_file_path] = [np.asarray(feature['geometry']['coordinates'], dtype=float) for feature in explorer_geo_path['features']]
+
+    return explorer_paths
+
+def read_cities():
+    """
+        Parses the 'city_list.csv' file
+
+        Returns
+        -------
+        cities
+            Panda DataFrame: indexed on the 9th column 'established date (city page)'
+    """
+    #Town Name [0], Title [1], HREF Text [2], State [3], wikipedia href [4], dms_latitude [5], dms_longitude [6], dec_latitude [7], dec_longitude [8], established date (city page) [9], established date (parent page) [10], population [11]
+    return pd.read_csv(data_file_path('city_list.csv'), header=None, quotechar='"', index_col=9).sort_index()
+
+def read_undated_cities():
+    """
+        Parses the 'undated_city_list.csv' file
+
+        Returns
+        -------
+        undated_cities
+            Panda DataFrame: not indexed
+    """
+    return pd.read_csv(data_file_path('undated_city_list.csv'), header=None, quotechar='"')
+
+def railway_lines_source_file():
+    """
+        Finds the railway lines GeoJSON in the data directory, preferring an extracted copy over the shipped '.7z' archive
+
+        Returns
+        -------
+        source_file
+            String: name of the GeoJSON file or the archive, relative to the data directory
+                None if neither is present
+    """
+    for source_file in [railway_lines_file, railway_lines_archive]:
+        if os.path.exists(data_file_path(source_file)):
+            return source_file
+
+    return None
+
+def read_railways():
+    """
+        Parses the 'Railway_Lines_vw_-3300151204749464250.geojson' file, 
+        or streams it directly out of the '.7z' archive it is shipped in.
+        Only the name and geometry of each railway line are kept, with the coordinates flattened into a single float32 array
+
+        Returns
+        -------
+        railways
+            Dictionary of Numpy arrays: 
+                'names' - name of each line segment, sorted so segments of the same railway line are contiguous
+                'offsets' - index into 'coordinates' of the first point of each line segment, with a final entry for the total number of points
+                'coordinates' - float32 longitude/latitude of every point, N x 2
+    """
+    #type: FeatureCollection, crs, features -> type: feature, id, geometry, properties -> objectid, featuressubtype, name, operational_status, feature_date, feature_source, attribute_date, attribute_source, source_ufi, source_jurisdiction, custodian_agency, custodian licensing, loading_date, track_gauge, ground_relationship, tracks, length_km, alternative_name, owner, source_supply_date, infrastructuretype, field, globalid
+    #                                          type: feature, id, geometry, coordinates        
+    segment_names = []
+    segment_lengths = []
+    coordinates = array.array('f')
+
+    def add_segment(name, segment_coords):
+        segment_names.append(name)
+        segment_lengths.append(len(segment_coords))
+        for lon, lat, *elevation in segment_coords:
+            coordinates.append(lon)
+            coordinates.append(lat)
+
+    source_file = railway_lines_source_file()
+    if source_file is None:
+        raise FileNotFoundError('Railway lines not found in the data directory: ' + railway_lines_file + ' or ' + railway_lines_archive)
+
+    with open_geojson_stream(data_file_path(source_file)) as railway_stream:
+        for feature in iterate_geojson_features(railway_stream):
+            name = (feature.get('properties') or {}).get('name')
+            geometry = feature.get('geometry')
+            if name is None or geometry is None:
+                continue
+
+            if geometry['type'] == 'LineString':
+                add_segment(name, geometry['coordinates'])
+            elif geometry['type'] == 'MultiLineString':
+                for line_coords in geometry['coordinates']:
+                    add_segment(name, line_coords)
+            elif geometry['type'] == 'Point':
+                add_segment(name, [geometry['coordinates']])
+
+    segment_names = np.array(segment_names, dtype=str)
+    segment_lengths = np.array(segment_lengths, dtype=np.int64)
+    coordinates = np.frombuffer(coordinates, dtype=np.float32).reshape(-1, 2)
+    segment_starts = np.concatenate([[0], np.cumsum(segment_lengths)[:-1]]).astype(np.int64)
+
+    # group the segments of each railway line together
+    segment_order = np.argsort(segment_names, kind='stable')
+    sorted_lengths = segment_lengths[segment_order]
+    point_order = np.repeat(segment_starts[segment_order] - np.concatenate([[0], np.cumsum(sorted_lengths)[:-1]]), sorted_lengths) + np.arange(sorted_lengths.sum())
+
+    return {'names': segment_names[segment_order], 'offsets': np.concatenate([[0], np.cumsum(sorted_lengths)]).astype(np.int64), 'coordinates': coordinates[point_order]}
+
+def read_railway_operating_dates():
+    """
+        Parses the 'operating_dates_of_australian_railway_lines.csv' file
+
+        Returns
+        -------
+        railway_operating_dates
+            Panda DataFrame: not indexed
+    """
+    #Name, Features, Alternative Name, Wikipedia, Commenced, Opened, Closed, LineLength(km)
+    return pd.read_csv(data_file_path('operating_dates_of_australian_railway_lines.csv'))
+
+def read_massacres():
+    """
+        Parses the 'ColonialMassacresInAustralia_Data.json' file
+
+        Returns
+        -------
+        massacres
+            Panda DataFrame: normalised features, indexed on the derived 'yearofmassacre' column, generated from the 'properties.datestart' attribute
+    """
+    #features -> type: feature, geometry, properties -> name, description, id, source, datestart, dateend, udatestart, udateend, latitude, longitude, linkback, Source_ID, LanguageGroup, Colony, StateOrTerritory, PoliceDistrict, KnownDate, AttackTime, Victims, VictimsDead, VictimDescription, Attackers, AttackersDead, AttackerDescription, Transport, Motive, WeaponsUsed, CorroborationRating, TLCMapLinkBack, TLCMapDataset
+    with open(data_file_path('ColonialMassacresInAustralia_Data.json')) as massacre_file:
+        massacre_data = json.load(massacre_file)
+    massacres = pd.json_normalize(massacre_data, 'features', errors='ignore')
+    massacres['properties.datestart'] = pd.to_datetime(massacres['properties.datestart'])
+    massacres['yearofmassacre'] = massacres['properties.datestart'].dt.year
+    massacres.set_index('yearofmassacre', inplace=True)
+    return massacres.sort_index()
+
+def read_missions(final_anime_year):
+    """
+        Parses the 'Aboriginal and Torres Strait Islander Missions and Reserves.csv' file
+
+        Parameters
+        ----------
+        final_anime_year
+            Integer: year after which to treat 'current' missions as closed
+
+        Returns
+        -------
+        missions
+            Panda DataFrame: not indexed
+                'Lat' and 'Lon' columns converted to decimal geocoordinates
+                'current' value in the 'To' field replaced with the 'final_anime_year' + 1 value
+    """
+    # Mission, State, From, To, Run By, Lat, Lon, Wikipedia
+    missions = pd.read_csv(data_file_path('Aboriginal and Torres Strait Islander Missions and Reserves.csv'))
+    
+    missions['From'] = pd.to_numeric(missions['From'])
+
+    missions['To'] = missions['To'].replace('current', final_anime_year + 1)
+    missions['To'] = pd.to_numeric(missions['To'])
+
+    missions['Lat'] = pd.to_numeric(missions['Lat'].apply(dms2dec), errors='coerce')
+    missions['Lon'] = pd.to_numeric(missions['Lon'].apply(dms2dec), errors='coerce')
+
+    return missions
+
+def read_deaths_in_custody():
+    """
+        Parses the 'Deaths in Custody.csv' file
+
+        Returns
+        -------
+        deaths_in_custody
+            Panda DataFrame: 'StartReportingYear' column and 'EndReportingYear' columns derived from the 'Year'
+                indexed on the derived 'StartReportingYear' column
+    """
+    #Year,Prison,Police,Youth detention,Other,Total
+    #Year reporting is from July to June, so need to take the right hand value as the year
+    deaths_in_custody = pd.read_csv(data_file_path('Deaths in Custody.csv'))
+    split_years = deaths_in_custody['Year'].str.split(pat="–", n=1, expand=True)
+    deaths_in_custody['StartReportingYear'] = split_years[0].astype(int)
+    deaths_in_custody['EndReportingYear'] = split_years[1].astype(int)
+    deaths_in_custody.set_index('StartReportingYear', inplace=True)
+    return deaths_in_custody.sort_index()
+
+def read_incarceration_rates():
+    """
+        Parses the 'Table 2' worksheets from the 'Prisoner characteristics, Australia (Tables 1 to 13) 1997 - 2013.xlsx' and 'Prisoner characteristics, Australia (Tables 1 to 13) 2014 - 2024.xlsx' files
+
+        Returns
+        -------
+        incarceration_rates
+            Panda DataFrame: merged worksheets, indexed on 'Reference period' column 0
+                derived 'Percentage' column, based on 'Aboriginal and Torres Strait Islander' / 'Aboriginal and Torres Strait Islander' + 'Non-Indigenous' columns
+    """
+    incarceration_cols = [0,3,4]
+    inceration_skipped_rows = [0,1,2,3,4,6]
+    incarceration_dtypes = {'Reference period': pd.Int32Dtype(), 'Aboriginal and Torres Strait Islander': pd.Int32Dtype(), 'Non-Indigenous': pd.Int32Dtype()}
+    incarceration_rates_1 = pd.read_excel(data_file_path('Prisoner characteristics, Australia (Tables 1 to 13) 1997 - 2013.xlsx'), sheet_name='Table _2', header=0, skiprows=5, skipfooter=20, usecols=incarceration_cols, index_col=0, dtype=incarceration_dtypes, keep_default_na=True)
+    incarceration_rates_2 = pd.read_excel(data_file_path('Prisoner characteristics, Australia (Tables 1 to 13) 2014 - 2024.xlsx'), sheet_name='Table 2', header=0, skiprows=inceration_skipped_rows, skipfooter=13, usecols=incarceration_cols, index_col=0, dtype=incarceration_dtypes, keep_default_na=True)
+    incarceration_rates = pd.concat([incarceration_rates_1, incarceration_rates_2])
+    incarceration_rates['Percentage'] = incarceration_rates['Aboriginal and Torres Strait Islander'] / (incarceration_rates['Aboriginal and Torres Strait Islander'] + incarceration_rates['Non-Indigenous'])
+    return incarceration_rates
+
+def read_defining_moments():
+    """
+        Parses the 'Australian defining moments.csv' file
+
+        Returns
+        -------
+        defining_moments
+            Panda DataFrame: not indexed, with the display lines of each moment in 'Wrapped Lines'
+    """
+    defining_moments = pd.read_csv(data_file_path('Australian defining moments.csv'))
+
+    defining_moments['From'] = pd.to_numeric(defining_moments['From'])
+    defining_moments['To'] = pd.to_numeric(defining_moments['To'])
+
+    # each moment is listed the same way whichever year it is displayed in, so wrap it once here
+    defining_moments['Wrapped Lines'] = [textwrap.wrap(text=event, width=50, initial_indent="".join([str(from_year), ": "]), subsequent_indent="      ") \
+                                         for event, from_year in zip(defining_moments['Event'], defining_moments['From'])]
+
+    return defining_moments
+
+def read_state_protection_boards():
+    """
+        Parses the 'Aboriginal Protector Boards.csv' file
+
+        Returns
+        -------
+        state_protection_boards
+            Panda DataFrame: not indexed
+    """
+    #State [0], Impact [1], BoardName [2], From [3], To [4]
+    return pd.read_csv(data_file_path('Aboriginal Protector Boards.csv'))
+
+def read_legislation():
+    """
+        Parses the jurisdiction worksheets from the 'Aboriginal Control Legislation.xlsx' file in a single pass over the workbook
+
+        Returns
+        -------
+        legislation
+            Panda DataFrame: legislation from every worksheet, not indexed
+                derived 'Jurisdiction' column, with the state code of the worksheet the legislation was listed in
+                rows grouped by jurisdiction, in worksheet order
+    """
+    #Worksheets: British Empire, Australian Commonwealth, Australian Capital Territory, Queensland, Western Australia, South Australia, New South Wales, Northern Territory, Tasmania, Victoria
+    # State [0], Impact [1], From [2], To [3], Legislation Name [4], Amended By [5], Repealed By [6], Description [7]
+    legislation_worksheets = {'British Empire': 'BRITAIN', 'Australian Commonwealth': 'CTH', 'Australian Capital Territory': 'ACT', 'Queensland': 'QLD', 'Western Australia': 'WA', \
+                              'South Australia': 'SA', 'New South Wales': 'NSW', 'Northern Territory': 'NT', 'Tasmania': 'TAS', 'Victoria': 'VIC'}
+    legislation_cols = ['State', 'Impact', 'From', 'To', 'Legislation Name']
+    legislation_dtypes = {'From': pd.Int32Dtype(), 'To': pd.Int32Dtype()}
+    # reading a list of worksheets opens and parses the workbook once, rather than once per worksheet
+    worksheets = pd.read_excel(data_file_path('Aboriginal Control Legislation.xlsx'), sheet_name=list(legislation_worksheets), header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
+
+    legislation = pd.concat([worksheets[sheet_name].assign(Jurisdiction=jurisdiction) for sheet_name, jurisdiction in legislation_worksheets.items()], ignore_index=True)
+
+    return legislation
+
 def init_legal_file_load():
     """
         Loads the legal data from files into memory
@@ -546,67 +1346,147 @@ def init_legal_file_load():
             Panda DataFrame: containing the contents of the 'Aboriginal Protector Boards.csv' file
                 not indexed
         
-        british_legislation
-            Panda DataFrame: containing the contents of the worksheet 'British Empire' from the 'Aboriginal Protector Boards.csv' file
-                not indexed
-        
-        commonwealth_legislation
-            Panda DataFrame: containing the contents of the worksheet 'Australian Commonwealth' from the 'Aboriginal Protector Boards.csv' file
+        legislation
+            Panda DataFrame: containing the contents of the jurisdiction worksheets from the 'Aboriginal Control Legislation.xlsx' file, 
+                British Empire, Australian Commonwealth, Australian Capital Territory, Queensland, Western Australia, South Australia, New South Wales, Northern Territory, Tasmania and Victoria
                 not indexed
+                'Jurisdiction' column holds the state code of the worksheet: BRITAIN, CTH, ACT, QLD, WA, SA, NSW, NT, TAS, VIC
+    """
 
-        act_legislation
-            Panda DataFrame: containing the contents of the worksheet 'Australian Capital Territory' from the 'Aboriginal Protector Boards.csv' file
-                not indexed   
-        
-        qld_legislation
-            Panda DataFrame: containing the contents of the worksheet 'Queensland' from the 'Aboriginal Protector Boards.csv' file
-                not indexed         
-        
-        wa_legislation
-            Panda DataFrame: containing the contents of the worksheet 'Western Australia' from the 'Aboriginal Protector Boards.csv' file
-                not indexed 
-        
-        sa_legislation
-            Panda DataFrame: containing the contents of the worksheet 'South Australia' from the 'Aboriginal Protector Boards.csv' file
-                not indexed
-        
-        nsw_legislation
-            Panda DataFrame: containing the contents of the worksheet 'New South Wales' from the 'Aboriginal Protector Boards.csv' file
-                not indexed        
-        
-        nt_legislation
-            Panda DataFrame: containing the contents of the worksheet 'Northern Territory' from the 'Aboriginal Protector Boards.csv' file
-                not indexed
-                
-        tas_legislation
-            Panda DataFrame: containing the contents of the worksheet 'Tasmania' from the 'Aboriginal Protector Boards.csv' file
-                not indexed
-        
-        vic_legislation
-            Panda DataFrame: containing the contents of the worksheet 'Victoria' from the 'Aboriginal Protector Boards.csv' file
-                not indexed
+    state_protection_boards = load_cached_dataset('state_protection_boards', ['Aboriginal Protector Boards.csv'], read_state_protection_boards)
+    legislation = load_cached_dataset('legislation', ['Aboriginal Control Legislation.xlsx'], read_legislation)
+
+    return state_protection_boards, legislation
+
+
+def build_frame_plan(blak_history):
     """
+        Evaluates the population figures and indicators displayed in every frame of the timelapse in a single pass,
+        so update_year only applies the precomputed values to the artists
 
-    #State [0], Impact [1], BoardName [2], From [3], To [4]
-    state_protection_boards = pd.read_csv('./data/Aboriginal Protector Boards.csv')
-    #Worksheets: British Empire, Australian Commonwealth, Australian Capital Territory, Queensland, Western Australia, South Australia, New South Wales, Northern Territory, Tasmania, Victoria
-    # State [0], Impact [1], From [2], To [3], Legislation Name [4], Amended By [5], Repealed By [6], Description [7]
-    legislation_file_path = './data/Aboriginal Control Legislation.xlsx'
-    legislation_cols = ['State', 'Impact', 'From', 'To', 'Legislation Name']
-    legislation_dtypes = {'From': pd.Int32Dtype(), 'To': pd.Int32Dtype()}
-    british_legislation = pd.read_excel(legislation_file_path, sheet_name='British Empire', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    commonwealth_legislation = pd.read_excel(legislation_file_path, sheet_name='Australian Commonwealth', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    act_legislation = pd.read_excel(legislation_file_path, sheet_name='Australian Capital Territory', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    qld_legislation = pd.read_excel(legislation_file_path, sheet_name='Queensland', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    wa_legislation = pd.read_excel(legislation_file_path, sheet_name='Western Australia', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    sa_legislation = pd.read_excel(legislation_file_path, sheet_name='South Australia', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    nsw_legislation = pd.read_excel(legislation_file_path, sheet_name='New South Wales', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    nt_legislation = pd.read_excel(legislation_file_path, sheet_name='Northern Territory', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    tas_legislation = pd.read_excel(legislation_file_path, sheet_name='Tasmania', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
-    vic_legislation = pd.read_excel(legislation_file_path, sheet_name='Victoria', header=0, usecols=legislation_cols, dtype=legislation_dtypes, keep_default_na=True)
+        Parameters
+        ----------
+        blak_history
+            boolean: whether the plan is for the Blak or White telling of history
+
+        Returns
+        -------
+        frame_plan
+            Panda DataFrame: one row per frame of the timelapse, including the repeated frames at the start and end
+                'Year' - year displayed in the frame
+                'Indigenous Population', 'Non-Indigenous Population' - estimated populations, and their '... Text' display values
+                'Indigenous Population Change', 'Non-Indigenous Population Change' - change from the previous year, zero for repeated frames, 
+                    and their '... Text' display values, '... Label Colour' and '... Colour'
+                'Non-Indigenous Population Colour' - colour of the population label and value
+                'Population Percentage' - Indigenous percentage of the population as displayed, with 'Population Percentage Value' as a fraction
+                'Incarceration Percentage' - fraction of those incarcerated that are Indigenous, NaN when not displayed or not recorded
+                'Acknowledgement Alpha' - fade of the Acknowledgement to Country, or Terra Nullius
+    """
+    number_frames = timelapse_period + (number_repeat_frames_at_start_and_end * 2)
+    current_frame = np.arange(number_frames)
+    frame_year = colonial_epoch + np.clip(current_frame - number_repeat_frames_at_start_and_end, 0, timelapse_period - 1)
+
+    # the first frame reaching the final year still shows its change, the repeated frames after it don't
+    changing_frame = (frame_year != colonial_epoch) & (current_frame < timelapse_period + number_repeat_frames_at_start_and_end)
 
-    return state_protection_boards, british_legislation, commonwealth_legislation, act_legislation, qld_legislation, wa_legislation, sa_legislation, nsw_legislation, nt_legislation, tas_legislation, vic_legislation
+    population_years = population.reindex(np.arange(colonial_epoch, colonial_epoch + timelapse_period))
+    indigenous_population = population_years['Indigenous Population'].str.replace(',', '').astype(np.int64)
+    if blak_history:
+        non_indigenous_population = population_years['Total Population'].str.replace(',', '').astype(np.int64) - indigenous_population
+    else:
+        non_indigenous_population = population_years['Colonial Population'].str.replace(',', '').astype(np.int64)
+
+    # changes in the year after the epoch are from the pre-colonial baseline
+    previous_indigenous_population = indigenous_population.shift(1, fill_value=previous_year_indigenous_population)
+    previous_indigenous_population.iloc[1:2] = previous_year_indigenous_population
+    previous_non_indigenous_population = non_indigenous_population.shift(1, fill_value=previous_year_non_indigenous_population)
+    previous_non_indigenous_population.iloc[1:2] = previous_year_non_indigenous_population
+
+    frame_plan = pd.DataFrame({'Year': frame_year})
+    frame_plan['Indigenous Population'] = indigenous_population.loc[frame_year].values
+    frame_plan['Non-Indigenous Population'] = non_indigenous_population.loc[frame_year].values
+    frame_plan['Indigenous Population Change'] = np.where(changing_frame, frame_plan['Indigenous Population'] - previous_indigenous_population.loc[frame_year].values, 0)
+    frame_plan['Non-Indigenous Population Change'] = np.where(changing_frame, frame_plan['Non-Indigenous Population'] - previous_non_indigenous_population.loc[frame_year].values, 0)
+
+    for population_col in ['Indigenous Population', 'Non-Indigenous Population']:
+        frame_plan[population_col + ' Text'] = frame_plan[population_col].map('{:,}'.format).str.rjust(10, ' ')
+        change_col = population_col + ' Change'
+        frame_plan[change_col + ' Text'] = frame_plan[change_col].map('{:,}'.format).str.rjust(7, ' ')
+        frame_plan[change_col + ' Label Colour'] = np.where(frame_plan[change_col] == 0, '0.25', 'k')
+        frame_plan[change_col + ' Colour'] = np.select([frame_plan[change_col] < 0, frame_plan[change_col] == 0], ['#cf210a', '0.25'], 'k')
+    frame_plan['Non-Indigenous Population Colour'] = np.where(frame_plan['Non-Indigenous Population'] == 0, '0.25', 'k')
+
+    frame_plan['Population Percentage'] = population_years['Indigenous percentage'].loc[frame_year].values
+    frame_plan['Population Percentage Value'] = frame_plan['Population Percentage'].str.rstrip('%').astype(float) / 100
+
+    if blak_history and display_incarceration_rates:
+        recorded_incarceration = frame_year >= incarceration_rates.index[0]
+        frame_plan['Incarceration Percentage'] = np.nan
+        frame_plan.loc[recorded_incarceration, 'Incarceration Percentage'] = incarceration_rates['Percentage'].loc[frame_year[recorded_incarceration]].values
+    else:
+        frame_plan['Incarceration Percentage'] = np.nan
+
+    frame_plan['Acknowledgement Alpha'] = 1 - (frame_plan['Year'] - colonial_epoch)/(1787 - colonial_epoch)
+
+    return frame_plan
+
+def frame_state(frame):
+    """
+        Works out which frame of which telling of history an animation frame displays, from the frame index alone, 
+        so frames can be constructed in any order
 
+        Parameters
+        ----------
+        frame
+            Integer: frame index
+
+        Returns
+        -------
+        current_frame
+            Integer: frame within the timelapse, including the repeated frames at the start and end
+
+        blak_history
+            boolean: whether the frame is part of the Blak telling of history
+    """
+    frames_per_telling = timelapse_period + (number_repeat_frames_at_start_and_end * 2)
+
+    if display_white_blak_hx_back_to_back:
+        # the White telling is followed by the Blak telling
+        blak_history = frame % (frames_per_telling * 2) >= frames_per_telling
+    else:
+        blak_history = display_blak_history
+
+    return frame % frames_per_telling, blak_history
+
+def clear_frame_artists():
+    """
+        Resets the artists that are only drawn in some frames, so nothing carries over from whichever frame was constructed before
+    """
+    #Unfortunately you can't set an empty scatter artist by calling set_offsets() with ([[]]) or ([],[])
+    #so resetting the scatter artists with a masked array
+    empty_offset = np.ma.masked_array([0,0], mask=True)
+    town_scatter.set_offsets(empty_offset)
+    unknown_town_est_year_scatter.set_offsets(empty_offset)
+    closed_mission_scatter.set_offsets(empty_offset)
+    open_mission_scatter.set_offsets(empty_offset)
+
+    massacre_scatter.set_offsets(empty_offset)
+    massacre_scatter.set_sizes([])
+    massacre_scatter.set_facecolors([])
+    massacre_scatter.set_edgecolors([]) 
+
+    acknowledgment_text.set_alpha(0)
+
+    for text_pyplot_axes in [est_current_indig_pop_text, est_current_indig_pop_value_text, est_delta_indig_pop_text, est_delta_indig_pop_value_text, indig_pop_perc_text, indig_incarc_pop_perc_text, \
+                             death_in_custody_royal_commission_1_txt, death_in_custody_royal_commission_2_txt, death_in_custody_txt, aggregate_deaths_in_custody_txt, \
+                             incarcerated_indigenous_txt, incarcerated_nonindigenous_txt]:
+        text_pyplot_axes.set_text("")
+
+    for patch in [pop_perc_backing_rectangle, pop_perc_bar, prison_perc_backing_rectangle, prison_perc_bar]:
+        patch.set_alpha(0)
+
+    for artist_pool in [reference_milestones, reference_massacre_lines, reference_explorer_names]:
+        release_pool_artists(artist_pool)
 
 def update_year(frame): 
     """
@@ -622,86 +1502,27 @@ def update_year(frame):
         list_items
            List containing MatplotLib ax objects to be drawn for this animation frame
     """
-    global list_items, reference_railway_segments, town_scatter, unknown_town_est_year_scatter, closed_mission_scatter, open_mission_scatter, massacre_scatter
-    global display_blak_history, display_missions, display_massacre_sites, display_massacre_text, display_deaths_in_custody, display_incarceration_rates, display_first_nations_milestones
+    global list_items
     global pop_perc_backing_rectangle, pop_perc_bar
-    global previous_year_indigenous_population, previous_year_non_indigenous_population
     global acknowledgment_text, est_current_indig_pop_text, est_current_indig_pop_value_text, est_delta_indig_pop_text, est_delta_indig_pop_value_text, est_current_nonindig_pop_text, \
         est_current_nonindig_pop_value_text, est_delta_nonindig_pop_text, est_delta_nonindig_pop_value_text, indig_pop_perc_text, indig_incarc_pop_perc_text, year_text
     
-    if not display_white_blak_hx_back_to_back:
-        reference_frame = frame
-    elif display_white_blak_hx_back_to_back and frame < (timelapse_period + (number_repeat_frames_at_start_and_end * 2)):
-        reference_frame = frame
-        display_blak_history = False
-        temp_display_blak_history = display_blak_history
-        display_blak_history = False
-        temp_display_missions = display_missions
-        display_missions = False
-        temp_display_massacre_sites = display_massacre_sites
-        display_massacre_sites = False
-        temp_display_massacre_text = display_massacre_text
-        display_massacre_text = False
-        temp_display_deaths_in_custody = display_deaths_in_custody
-        display_deaths_in_custody = False
-        temp_display_incarceration_rates = display_incarceration_rates
-        display_incarceration_rates = False
-        temp_display_first_nations_milestones = display_first_nations_milestones
-        display_first_nations_milestones = False
-    else:
-        reference_frame = frame - timelapse_period - (number_repeat_frames_at_start_and_end * 2)
-        for ax in reference_railway_segments:
-            ax.set_data([], [])
-
-        #Unfortunately you can't set an empty scatter artist by calling set_offsets() with ([[]]) or ([],[])
-        #so resetting the scatter artists with a masked array
-        empty_offset = np.ma.masked_array([0,0], mask=True)
-        town_scatter.set_offsets(empty_offset)
-        unknown_town_est_year_scatter.set_offsets(empty_offset)
-        closed_mission_scatter.set_offsets(empty_offset)
-        open_mission_scatter.set_offsets(empty_offset)
-
-        massacre_scatter.set_offsets(empty_offset)
-        massacre_scatter.set_sizes([])
-        massacre_scatter.set_facecolors([])
-        massacre_scatter.set_edgecolors([]) 
-
-        display_blak_history = True
-        
-    current_frame = reference_frame % (timelapse_period + (number_repeat_frames_at_start_and_end * 2))
-    if current_frame <= number_repeat_frames_at_start_and_end:
-        current_year = colonial_epoch
-    elif current_frame >= timelapse_period + number_repeat_frames_at_start_and_end:
-        current_year = colonial_epoch + timelapse_period - 1
-    else:
-        current_year = colonial_epoch + current_frame - number_repeat_frames_at_start_and_end
-
-    pop_year = population.loc[current_year:current_year]
-    pop_percentage = pop_year['Indigenous percentage'].values[0]
-    pop_percentage_value = (float(pop_percentage.rstrip('%')))/100
-    print(datetime.datetime.now())
-    print('Current Year: ' + str(current_year))
-    print('Pop Perc: ' + str(pop_percentage_value))
-
-    if display_blak_history:
-        current_year_indigenous_population = int(pop_year['Indigenous Population'].values[0].replace(',',''))
-        current_year_non_indigenous_population = int(pop_year['Total Population'].values[0].replace(',','')) - current_year_indigenous_population
-    else:
-        current_year_non_indigenous_population = int(pop_year['Colonial Population'].values[0].replace(',',''))
+    global profiled_frame, profiled_year
 
-    indigenous_population_change = 0
-    non_indigenous_population_change = 0
+    profiled_frame = frame
+    current_frame, blak_history = frame_state(frame)
 
-    if current_year != colonial_epoch:
-        if display_blak_history:
-            indigenous_population_change = current_year_indigenous_population - previous_year_indigenous_population  
-            previous_year_indigenous_population = current_year_indigenous_population 
-        
-        non_indigenous_population_change = current_year_non_indigenous_population - previous_year_non_indigenous_population
-        previous_year_non_indigenous_population = current_year_non_indigenous_population
-    else:
-        previous_year_indigenous_population = 750000
-        previous_year_non_indigenous_population = 0
+    clear_frame_artists()
+
+    frame_plan = frame_plans[blak_history].iloc[current_frame]
+    current_year = int(frame_plan['Year'])
+    profiled_year = current_year
+
+    pop_percentage = frame_plan['Population Percentage']
+    pop_percentage_value = frame_plan['Population Percentage Value']
+    if print_frame_years:
+        print('Current Year: ' + str(current_year))
+        print('Pop Perc: ' + str(pop_percentage_value))
 
     #reset reference to a new list of items
     #list_items = []
@@ -709,46 +1530,56 @@ def update_year(frame):
         
     #State boundaries
     if display_state_boundaries:
-        map_state_boundaries(current_year, list_items)
+        with profile_layer('map_state_boundaries'):
+            map_state_boundaries(current_year, list_items)
     
     if display_colonisation:
         #explorer paths
         if display_explorers:
-            map_explorers(current_year, list_items)
+            with profile_layer('map_explorers'):
+                map_explorers(current_year, list_items)
 
         #undated cities and towns
         if display_undated_towns and current_year >= start_of_town_growth:
-            map_undated_towns(current_year, list_items)
+            with profile_layer('map_undated_towns'):
+                map_undated_towns(current_year, list_items)
         
         #cities and towns
         if display_towns:
-            map_towns(current_year, list_items)
+            with profile_layer('map_towns'):
+                map_towns(current_year, list_items)
 
         #massacres
-        if display_massacre_sites:
-            map_massacres(current_year, list_items)
+        if display_massacre_sites and blak_history:
+            with profile_layer('map_massacres'):
+                map_massacres(current_year, list_items)
 
         #railway lines
         if display_railway_lines:            
-            map_railway_lines(current_year, list_items)
+            with profile_layer('map_railway_lines'):
+                map_railway_lines(current_year, list_items)
 
-        if display_missions:
-            map_missions(current_year, list_items)
+        if display_missions and blak_history:
+            with profile_layer('map_missions'):
+                map_missions(current_year, list_items)
     
     #Legislation
     if display_legal_controls:
-        map_legislation(current_year, list_items)
+        with profile_layer('map_legislation'):
+            map_legislation(current_year, list_items)
+
+    text_panels_start = start_profile_layer()
 
     #Acknowledgement to Country
-    if display_blak_history and current_year < 1788:
-        ack_alpha = 1 - (current_year - colonial_epoch)/(1787 - colonial_epoch)
+    if blak_history and current_year < 1788:
+        ack_alpha = frame_plan['Acknowledgement Alpha']
         acknowledgment_text.set_x(115.0)
         acknowledgment_text.set_y(-26.0)
         acknowledgment_text.set_text("Acknowledging the traditional owners of this land, paying respect to the people, the cultures, and the elders past and present, that which has been lost, and that which has survived")
         acknowledgment_text.set_alpha(ack_alpha)
         list_items.append(acknowledgment_text)
     elif current_year < 1788:        
-        ack_alpha = 1 - (current_year - colonial_epoch)/(1787 - colonial_epoch)
+        ack_alpha = frame_plan['Acknowledgement Alpha']
         acknowledgment_text.set_x(132.5)
         acknowledgment_text.set_y(-26.0)
         acknowledgment_text.set_text("Terra Nullius")
@@ -757,35 +1588,23 @@ def update_year(frame):
          
     # Population Numbers
     #Indigenous Population
-    if display_blak_history:
+    if blak_history:
         est_current_indig_pop_text.set_text('Est. Indigenous Population: ')
         list_items.append(est_current_indig_pop_text)
-        est_current_indig_pop_value_text.set_text(format(current_year_indigenous_population,',').rjust(10,' '))
+        est_current_indig_pop_value_text.set_text(frame_plan['Indigenous Population Text'])
         list_items.append(est_current_indig_pop_value_text)
 
         #Indigenous Population Delta
-        if indigenous_population_change == 0:
-            txt_colour = '0.25'
-        else:
-            txt_colour = 'k'
-            
         est_delta_indig_pop_text.set_text('Est. Indigenous Population Change: ')  
-        est_delta_indig_pop_text.set_color(txt_colour)
+        est_delta_indig_pop_text.set_color(frame_plan['Indigenous Population Change Label Colour'])
         list_items.append(est_delta_indig_pop_text) 
 
-        if indigenous_population_change < 0:
-            txt_colour = '#cf210a'
-        elif indigenous_population_change == 0:
-            txt_colour = '0.25'
-        else:
-            txt_colour='k'
-
-        est_delta_indig_pop_value_text.set_text(format(indigenous_population_change,',').rjust(7,' '))
-        est_delta_indig_pop_value_text.set_color(txt_colour)
+        est_delta_indig_pop_value_text.set_text(frame_plan['Indigenous Population Change Text'])
+        est_delta_indig_pop_value_text.set_color(frame_plan['Indigenous Population Change Colour'])
         list_items.append(est_delta_indig_pop_value_text )
 
     #Non-Indigenous Population
-    if display_blak_history:
+    if blak_history:
         population_x_position = pop_x1
         population_y_position = pop_y2
         population_value_x_position = pop_x2
@@ -808,10 +1627,7 @@ def update_year(frame):
         population_change_value_x_position = 128
         population_change_value_y_position = pop_y2
 
-    if current_year_non_indigenous_population == 0:
-        txt_colour = '0.25'
-    else:
-        txt_colour = 'k'
+    txt_colour = frame_plan['Non-Indigenous Population Colour']
     est_current_nonindig_pop_text.set_x(population_x_position)
     est_current_nonindig_pop_text.set_y(population_y_position)
     est_current_nonindig_pop_text.set_text(population_txt)
@@ -820,34 +1636,24 @@ def update_year(frame):
 
     est_current_nonindig_pop_value_text.set_x(population_value_x_position)
     est_current_nonindig_pop_value_text.set_y(population_value_y_position)
-    est_current_nonindig_pop_value_text.set_text(format(current_year_non_indigenous_population,',').rjust(10,' '))
+    est_current_nonindig_pop_value_text.set_text(frame_plan['Non-Indigenous Population Text'])
     est_current_nonindig_pop_value_text.set_color(txt_colour)
     list_items.append(est_current_nonindig_pop_value_text)
 
     #Non-Indigenous Population Change
-    if non_indigenous_population_change == 0:
-        txt_colour = '0.25'
-    else:
-        txt_colour = 'k'
     est_delta_nonindig_pop_text.set_x(population_change_x_position)
     est_delta_nonindig_pop_text.set_y(population_change_y_position)
     est_delta_nonindig_pop_text.set_text(population_change_txt)
-    est_delta_nonindig_pop_text.set_color(txt_colour)
+    est_delta_nonindig_pop_text.set_color(frame_plan['Non-Indigenous Population Change Label Colour'])
     list_items.append(est_delta_nonindig_pop_text)
 
-    if non_indigenous_population_change < 0:
-        txt_colour = '#cf210a'
-    elif non_indigenous_population_change == 0:
-        txt_colour = '0.25'
-    else:
-        txt_colour='k'
     est_delta_nonindig_pop_value_text.set_x(population_change_value_x_position)
     est_delta_nonindig_pop_value_text.set_y(population_change_value_y_position)
-    est_delta_nonindig_pop_value_text.set_text(format(non_indigenous_population_change,',').rjust(7,' '))
-    est_delta_nonindig_pop_value_text.set_color(txt_colour)
+    est_delta_nonindig_pop_value_text.set_text(frame_plan['Non-Indigenous Population Change Text'])
+    est_delta_nonindig_pop_value_text.set_color(frame_plan['Non-Indigenous Population Change Colour'])
     list_items.append(est_delta_nonindig_pop_value_text)
     
-    if display_blak_history:
+    if blak_history:
         # Percentage Indigenous Pop
         #indig_pop_colour = str(1 - pop_percentage_value)
         indig_pop_colour = '0.9'
@@ -864,8 +1670,8 @@ def update_year(frame):
         pop_perc_bar.set_alpha(1)
         list_items.append(pop_perc_bar)  
 
-        if display_incarceration_rates and current_year >= incarceration_rates.index[0]:  
-            incarceration_perc = incarceration_rates.loc[current_year]['Percentage']
+        if display_incarceration_rates and pd.notna(frame_plan['Incarceration Percentage']):  
+            incarceration_perc = frame_plan['Incarceration Percentage']
             #incarceration_colour = str(1 - incarceration_perc)
             incarceration_colour = '0.9'
             indig_incarc_pop_perc_text.set_text('Percent Incarcerated that are Indigenous: ' + str("{:.1%}".format(incarceration_perc)))
@@ -880,7 +1686,8 @@ def update_year(frame):
             prison_perc_bar.set_facecolor(incarceration_colour)
             list_items.append(prison_perc_bar) 
 
-            add_incarcerated(current_year, list_items)
+            with profile_layer('add_incarcerated'):
+                add_incarcerated(current_year, list_items)
         else:
             prison_perc_backing_rectangle.set_alpha(0)
             list_items.append(prison_perc_backing_rectangle)
@@ -891,32 +1698,32 @@ def update_year(frame):
     year_text.set_text('Year: ' + str(current_year))
     year_text.set_color('blue')
     list_items.append(year_text)  
+    stop_profile_layer('text panels', text_panels_start)
 
     # Milestone table
-    if display_first_nations_milestones:
-        add_first_nations_milestones(current_year, list_items)
+    if display_first_nations_milestones and blak_history:
+        with profile_layer('add_first_nations_milestones'):
+            add_first_nations_milestones(current_year, list_items)
 
     # Conflict Text
     if display_australian_conflict:
-        add_australian_conflicts(current_year, list_items)
+        with profile_layer('add_australian_conflicts'):
+            add_australian_conflicts(current_year, blak_history, list_items)
 
     if display_defining_moments:
-        add_australian_defining_moments(current_year, list_items)
+        with profile_layer('add_australian_defining_moments'):
+            add_australian_defining_moments(current_year, blak_history, list_items)
 
-    if display_deaths_in_custody:
-        add_deaths_in_custody(current_year, list_items)
-
-    if display_white_blak_hx_back_to_back and frame < (timelapse_period + (number_repeat_frames_at_start_and_end * 2)):
-        display_blak_history = temp_display_blak_history
-        display_missions = temp_display_missions
-        display_massacre_sites = temp_display_massacre_sites
-        display_massacre_text = temp_display_massacre_text
-        display_deaths_in_custody = temp_display_deaths_in_custody
-        display_incarceration_rates = temp_display_incarceration_rates
-        display_first_nations_milestones = temp_display_first_nations_milestones
-    
-    print(datetime.datetime.now())
-    print('')
+    if display_deaths_in_custody and blak_history:
+        with profile_layer('add_deaths_in_custody'):
+            add_deaths_in_custody(current_year, list_items)
+
+    # blank the pooled artists the previous frame used that this frame didn't
+    with profile_layer('blank_released_pool_artists'):
+        blank_released_pool_artists()
+
+    if print_frame_years:
+        print('')
 
     return list_items
 
@@ -959,13 +1766,7 @@ def add_first_nations_milestones(current_year, list_items):
         for col in range(len(first_nations_milestones.columns)):
             if col > 0:
                 if current_year >= min_col_values[col]:                    
-                    text_pyplot_axes = reference_milestones[col]
-                    text_pyplot_axes.set_x(init_x + init_offset + (col * column_offset))
-                    text_pyplot_axes.set_y(init_y)
-                    text_pyplot_axes.set_text((first_nations_milestones.columns)[col])
-                    text_pyplot_axes.set_horizontalalignment('center')
-                    text_pyplot_axes.set_color(txt_colour)
-                    text_pyplot_axes.set_fontsize(txt_fontsize)   
+                    text_pyplot_axes = pool_artist(reference_milestones, col, x=init_x + init_offset + (col * column_offset), y=init_y, text=(first_nations_milestones.columns)[col], horizontalalignment='center', color=txt_colour, fontsize=txt_fontsize)
                     list_items.append(text_pyplot_axes)  
                     #states_txt = ax.text(init_x + init_offset + (col * column_offset), init_y, (first_nations_milestones.columns)[col], horizontalalignment='center', color=str(txt_colour), fontsize=txt_fontsize)
                     #list_items.append(states_txt)  
@@ -995,32 +1796,20 @@ def add_first_nations_milestones(current_year, list_items):
                     # write out the matrix of dates
                     if i == 0:
                         pointer = (len(first_nations_milestones.columns) * (row + 1))
-                        text_pyplot_axes = reference_milestones[pointer]
-                        text_pyplot_axes.set_x(init_x + (i * column_offset))
-                        text_pyplot_axes.set_y(init_y - (row_offset * (counted_row + 1)))
-                        text_pyplot_axes.set_text((first_nations_milestones.iloc[row])[i])
-                        text_pyplot_axes.set_horizontalalignment('right')
-                        text_pyplot_axes.set_color(event_txt_colour)
-                        text_pyplot_axes.set_fontsize(txt_fontsize)   
+                        text_pyplot_axes = pool_artist(reference_milestones, pointer, x=init_x + (i * column_offset), y=init_y - (row_offset * (counted_row + 1)), text=(first_nations_milestones.iloc[row])[i], horizontalalignment='right', color=event_txt_colour, fontsize=txt_fontsize)
                         list_items.append(text_pyplot_axes) 
                         #event_txt = ax.text(init_x + (i * column_offset), init_y - (row_offset * (counted_row + 1)), (first_nations_milestones.iloc[row])[i], horizontalalignment='right', color=str(event_txt_colour), fontsize=txt_fontsize)
                         #list_items.append(event_txt)             
                     else:      
                         if current_year >= (first_nations_milestones.iloc[row])[i] and pd.notna((first_nations_milestones.iloc[row])[i]): 
                             pointer = (len(first_nations_milestones.columns) * (row + 1)) + i
-                            text_pyplot_axes = reference_milestones[pointer]
-                            text_pyplot_axes.set_x(init_x + init_offset + (i * column_offset))
-                            text_pyplot_axes.set_y(init_y - (row_offset * (counted_row + 1)))
-                            text_pyplot_axes.set_text(str(int((first_nations_milestones.iloc[row])[i])))
-                            text_pyplot_axes.set_horizontalalignment('center')
-                            text_pyplot_axes.set_color(event_year_txt_colour)
-                            text_pyplot_axes.set_fontsize(txt_fontsize)   
+                            text_pyplot_axes = pool_artist(reference_milestones, pointer, x=init_x + init_offset + (i * column_offset), y=init_y - (row_offset * (counted_row + 1)), text=str(int((first_nations_milestones.iloc[row])[i])), horizontalalignment='center', color=event_year_txt_colour, fontsize=txt_fontsize)
                             list_items.append(text_pyplot_axes)     
                             #event_txt = ax.text(init_x + init_offset + (i * column_offset), init_y - (row_offset * (counted_row + 1)), str(int((first_nations_milestones.iloc[row])[i])), horizontalalignment='center', color=str(event_year_txt_colour), fontsize=txt_fontsize)
                             #list_items.append(event_txt)     
                 counted_row += 1    
 
-def add_australian_conflicts(current_year, list_items):
+def add_australian_conflicts(current_year, blak_history, list_items):
     """
         Lists conflicts Australia has been involved in
 
@@ -1028,15 +1817,17 @@ def add_australian_conflicts(current_year, list_items):
         ----------
         current_year
             integer: current year to display
+
+        blak_history
+            boolean: whether to include conflicts only listed in the Blak telling of history
             
         list_items
             list: MatplotLib ax objects to be drawn for this animation frame
     """
     global reference_conflicts
 
-    # clean up residual from previous year to avoid ghosting in generating movie
-    for ax in reference_conflicts:
-        ax.set_text("")
+    # free the previous year's artists, those not reused are blanked once the frame is built to avoid ghosting in generating movie
+    release_pool_artists(reference_conflicts)
 
     veteran_memory = 60
 
@@ -1050,34 +1841,22 @@ def add_australian_conflicts(current_year, list_items):
 
     counted_row = 0
 
-    active_conflicts = pd.DataFrame()
-    past_conflicts = pd.DataFrame()
+    active_rows = active_interval_rows(australian_conflicts_index, current_year)
+    past_rows = ended_interval_rows(australian_conflicts_index, current_year, veteran_memory)
 
-    if display_blak_history:
-        active_conflicts = australian_conflicts[((australian_conflicts['From'] <= current_year) & ((australian_conflicts['To'] >= current_year) | (australian_conflicts['To'].isna())))]
-        past_conflicts = australian_conflicts[((australian_conflicts['To'] > current_year - veteran_memory) & (australian_conflicts['To'] < current_year))]
-        past_conflicts = past_conflicts.sort_values(by=['To', 'From'], ascending=[False, True])
-    else:
-        active_conflicts = australian_conflicts[((australian_conflicts['From'] <= current_year) & ((australian_conflicts['To'] >= current_year) | (australian_conflicts['To'].isna())) & (australian_conflicts['Blak Hx'] != True))]
-        past_conflicts = australian_conflicts[((australian_conflicts['To'] > current_year - veteran_memory) & (australian_conflicts['To'] < current_year) & (australian_conflicts['Blak Hx'] != True))]
-        past_conflicts = past_conflicts.sort_values(by=['To', 'From'], ascending=[False, True])
+    if not blak_history:
+        active_rows = active_rows[australian_conflicts_white_history[active_rows]]
+        past_rows = past_rows[australian_conflicts_white_history[past_rows]]
+
+    active_conflicts = australian_conflicts.iloc[active_rows]
+    past_conflicts = australian_conflicts.iloc[past_rows]
 
     if active_conflicts.size > 0 or past_conflicts.size > 0:        
-        text_pyplot_axes = reference_conflicts[counted_row]
-        text_pyplot_axes.set_x(init_x)
-        text_pyplot_axes.set_y(init_y)
-        text_pyplot_axes.set_text("Australian Conflicts")
-        text_pyplot_axes.set_color(txt_active_conflict_colour)
-        text_pyplot_axes.set_fontsize(10)   
+        text_pyplot_axes = pool_artist(reference_conflicts, counted_row, x=init_x, y=init_y, text="Australian Conflicts", color=txt_active_conflict_colour, fontsize=10)
         list_items.append(text_pyplot_axes)  
         #list_items.append(ax.text(init_x, init_y - (counted_row * row_offset), "Australian Conflicts", horizontalalignment='left', color=str(txt_colour), fontsize=10))
         counted_row += 1              
-        text_pyplot_axes = reference_conflicts[counted_row]
-        text_pyplot_axes.set_x(init_x)
-        text_pyplot_axes.set_y(init_y - (counted_row * row_offset))
-        text_pyplot_axes.set_text("")
-        text_pyplot_axes.set_color(txt_active_conflict_colour)
-        text_pyplot_axes.set_fontsize(txt_fontsize)   
+        text_pyplot_axes = pool_artist(reference_conflicts, counted_row, x=init_x, y=init_y - (counted_row * row_offset), text="", color=txt_active_conflict_colour, fontsize=txt_fontsize)
         list_items.append(text_pyplot_axes)  
         #list_items.append(ax.text(init_x, init_y - (counted_row * row_offset), "", horizontalalignment='left', color=str(txt_colour), fontsize=10))
         counted_row += 1
@@ -1092,13 +1871,7 @@ def add_australian_conflicts(current_year, list_items):
                 else:
                     txt_active_conflict_colour = '0.15'
 
-                text_pyplot_axes = reference_conflicts[counted_row]
-                text_pyplot_axes.set_x(init_x)
-                text_pyplot_axes.set_y(init_y - (counted_row * row_offset))
-                text_pyplot_axes.set_text(conflict_text)
-                text_pyplot_axes.set_color(txt_active_conflict_colour)
-                text_pyplot_axes.set_fontsize(txt_fontsize)              
-                text_pyplot_axes.set_alpha(1)
+                text_pyplot_axes = pool_artist(reference_conflicts, counted_row, x=init_x, y=init_y - (counted_row * row_offset), text=conflict_text, color=txt_active_conflict_colour, fontsize=txt_fontsize, alpha=1)
                 list_items.append(text_pyplot_axes)
                 #list_items.append(ax.text(init_x, init_y - (counted_row * row_offset), conflict_text, horizontalalignment='left', color=str(txt_active_conflict_colour), fontsize=txt_fontsize))
                 counted_row += 1
@@ -1108,13 +1881,7 @@ def add_australian_conflicts(current_year, list_items):
                 conflict_text = conflict_str(past_conflict, False, current_year)
                 conflict_alpha = math.sqrt(1 - ((current_year - past_conflict[5])/veteran_memory)**2)
 
-                text_pyplot_axes = reference_conflicts[counted_row]
-                text_pyplot_axes.set_x(init_x)
-                text_pyplot_axes.set_y(init_y - (counted_row * row_offset))
-                text_pyplot_axes.set_text(conflict_text)
-                text_pyplot_axes.set_color(txt_past_conflict_colour)
-                text_pyplot_axes.set_fontsize(txt_fontsize)   
-                text_pyplot_axes.set_alpha(conflict_alpha)
+                text_pyplot_axes = pool_artist(reference_conflicts, counted_row, x=init_x, y=init_y - (counted_row * row_offset), text=conflict_text, color=txt_past_conflict_colour, fontsize=txt_fontsize, alpha=conflict_alpha)
                 list_items.append(text_pyplot_axes)
                 #list_items.append(ax.text(init_x, init_y - (counted_row * row_offset), conflict_text, horizontalalignment='left', color=txt_past_conflict_colour, fontsize=txt_fontsize, alpha=conflict_alpha))        
                 counted_row += 1
@@ -1158,7 +1925,7 @@ def conflict_str(conflict, active, current_year):
     
     return conflict_text
      
-def add_australian_defining_moments(current_year, list_items):
+def add_australian_defining_moments(current_year, blak_history, list_items):
     """
         Lists defining moments in Australia's history
 
@@ -1166,6 +1933,9 @@ def add_australian_defining_moments(current_year, list_items):
         ----------
         current_year
             integer: current year to display
+
+        blak_history
+            boolean: whether to include moments only listed in the Blak telling of history
             
         list_items
             list: MatplotLib ax objects to be drawn for this animation frame
@@ -1173,13 +1943,12 @@ def add_australian_defining_moments(current_year, list_items):
     global reference_defining_moments
     global number_defining_moment_lines_to_display
 
-    # clean up residual from previous year to avoid ghosting in generating movie
-    for ax in reference_defining_moments:
-        ax.set_text("")
+    # free the previous year's artists, those not reused are blanked once the frame is built to avoid ghosting in generating movie
+    release_pool_artists(reference_defining_moments)
 
     citizen_memory = 10    
 
-    if display_blak_history:
+    if blak_history:
         init_x = 153.8
     else:
         init_x = 156.2
@@ -1193,34 +1962,22 @@ def add_australian_defining_moments(current_year, list_items):
 
     counted_row = 0
 
-    active_moments= pd.DataFrame()
-    past_moments = pd.DataFrame()
+    active_rows = active_interval_rows(defining_moments_index, current_year)
+    past_rows = ended_interval_rows(defining_moments_index, current_year, citizen_memory)
 
-    if display_blak_history:
-        active_moments = defining_moments[((defining_moments['From'] <= current_year) & ((defining_moments['To'] >= current_year) | (defining_moments['To'].isna())))]
-        active_moments = active_moments.sort_values(by=['From'], ascending=[False])
-        past_moments = defining_moments[((defining_moments['To'] > current_year - citizen_memory) & (defining_moments['To'] < current_year))]
-        past_moments = past_moments.sort_values(by=['To', 'From'], ascending=[False, True])
+    if blak_history:
+        # most recent first, so the reversal below displays the oldest entries at the top
+        active_rows = active_rows[np.lexsort((active_rows, -defining_moments_from[active_rows]))]
     else:
-        active_moments = defining_moments[((defining_moments['From'] <= current_year) & ((defining_moments['To'] >= current_year) | (defining_moments['To'].isna())) & (defining_moments['Blak Hx'] != True))]
-        past_moments = defining_moments[((defining_moments['To'] > current_year - citizen_memory) & (defining_moments['To'] < current_year) & (defining_moments['Blak Hx'] != True))]
-        past_moments = past_moments.sort_values(by=['To', 'From'], ascending=[False, True])
-
-    if active_moments.size > 0 or past_moments.size > 0:
-        text_pyplot_axes = reference_defining_moments[counted_row]
-        text_pyplot_axes.set_x(init_x)
-        text_pyplot_axes.set_y(init_y - (counted_row * row_offset))
-        text_pyplot_axes.set_text("Defining Moments")
-        text_pyplot_axes.set_color(txt_active_moment_colour)
-        text_pyplot_axes.set_fontsize(10)   
+        active_rows = active_rows[defining_moments_white_history[active_rows]]
+        past_rows = past_rows[defining_moments_white_history[past_rows]]
+
+    if active_rows.size > 0 or past_rows.size > 0:
+        text_pyplot_axes = pool_artist(reference_defining_moments, counted_row, x=init_x, y=init_y - (counted_row * row_offset), text="Defining Moments", color=txt_active_moment_colour, fontsize=10)
         list_items.append(text_pyplot_axes)  
         #list_items.append(ax.text(init_x, init_y - (counted_row * row_offset), "Defining Moments", horizontalalignment='left', color=str(txt_colour), fontsize=10))
         counted_row += 2 # allow a greater gap under the heading
-        text_pyplot_axes = reference_defining_moments[counted_row]
-        text_pyplot_axes.set_x(init_x)
-        text_pyplot_axes.set_y(init_y - (counted_row * row_offset))
-        text_pyplot_axes.set_text("")
-        text_pyplot_axes.set_fontsize(txt_fontsize)    
+        text_pyplot_axes = pool_artist(reference_defining_moments, counted_row, x=init_x, y=init_y - (counted_row * row_offset), text="", fontsize=txt_fontsize)
         list_items.append(text_pyplot_axes)
         #list_items.append(ax.text(init_x, init_y - (counted_row * row_offset), "", horizontalalignment='left', color=str(txt_colour), fontsize=10))
         counted_row += 1
@@ -1228,37 +1985,20 @@ def add_australian_defining_moments(current_year, list_items):
         active_moments_with_wrapped_lines = []
         past_moments_with_wrapped_lines = []
 
-        if active_moments.size > 0:  
-            active_moments = active_moments.iloc[::-1] # reverse the order to display the oldest entries at the top
-            for active_moment in active_moments.itertuples():
-                initial_indent = "".join([str(active_moment[3]), ": "])
-                wrapped_lines = textwrap.wrap(text=active_moment[1], width=50, initial_indent=initial_indent, subsequent_indent="      ")
-                for line in wrapped_lines:
-                    text_pyplot_axes = reference_defining_moments[counted_row]
-                    text_pyplot_axes.set_x(init_x)
-                    text_pyplot_axes.set_y(init_y - (counted_row * row_offset))
-                    text_pyplot_axes.set_text(line)
-                    text_pyplot_axes.set_color(txt_active_moment_colour)
-                    text_pyplot_axes.set_fontsize(txt_fontsize)    
-                    text_pyplot_axes.set_alpha(1)
+        if active_rows.size > 0:  
+            for active_row in active_rows[::-1]: # reverse the order to display the oldest entries at the top
+                for line in defining_moments_wrapped_lines[active_row]:
+                    text_pyplot_axes = pool_artist(reference_defining_moments, counted_row, x=init_x, y=init_y - (counted_row * row_offset), text=line, color=txt_active_moment_colour, fontsize=txt_fontsize, alpha=1)
                     active_moments_with_wrapped_lines.append(text_pyplot_axes)  
                     #list_items.append(ax.text(init_x, init_y - (counted_row * row_offset), line, horizontalalignment='left', color=str(txt_colour), fontsize=txt_fontsize))
                     counted_row += 1
 
-        if past_moments.size > 0:            
-            for past_moment in past_moments.itertuples():                   
-                initial_indent = "".join([str(past_moment[3]), ": "])             
-                wrapped_lines = textwrap.wrap(text=past_moment[1], width=50, initial_indent=initial_indent, subsequent_indent="      ")
-                moment_alpha = math.sqrt(1 - ((current_year - past_moment[4])/citizen_memory)**2)
+        if past_rows.size > 0:            
+            for past_row in past_rows:                   
+                moment_alpha = math.sqrt(1 - ((current_year - defining_moments_to[past_row])/citizen_memory)**2)
                 
-                for line in wrapped_lines:                                  
-                    text_pyplot_axes = reference_defining_moments[counted_row]
-                    text_pyplot_axes.set_x(init_x)
-                    text_pyplot_axes.set_y(init_y - (counted_row * row_offset))
-                    text_pyplot_axes.set_text(line)
-                    text_pyplot_axes.set_color(txt_past_moment_colour)
-                    text_pyplot_axes.set_fontsize(txt_fontsize)   
-                    text_pyplot_axes.set_alpha(moment_alpha)
+                for line in defining_moments_wrapped_lines[past_row]:                                  
+                    text_pyplot_axes = pool_artist(reference_defining_moments, counted_row, x=init_x, y=init_y - (counted_row * row_offset), text=line, color=txt_past_moment_colour, fontsize=txt_fontsize, alpha=moment_alpha)
                     past_moments_with_wrapped_lines.append(text_pyplot_axes) 
                     #past_moments_with_wrapped_lines.append(ax.text(init_x, init_y - (counted_row * row_offset), line, horizontalalignment='left', color='0.3', fontsize=txt_fontsize, alpha=moment_alpha))
                     counted_row += 1
@@ -1275,7 +2015,7 @@ def add_australian_defining_moments(current_year, list_items):
         # clean up extraneous ax entries so doesn't effect generated movies
         if counted_row + 1 > number_defining_moment_lines_to_display:
             for i in range(number_defining_moment_lines_to_display, counted_row):
-                reference_defining_moments[i].set_text("")
+                pool_artist(reference_defining_moments, i, text="")
 
 
 def map_state_boundaries(current_year, list_items):
@@ -1290,48 +2030,39 @@ def map_state_boundaries(current_year, list_items):
         list_items
             list: MatplotLib ax objects to be drawn for this animation frame
     """
-    global reference_state_boundary_features, reference_state_names
+    global reference_state_boundary_features, reference_state_names, mapped_state_boundary_epoch, mapped_state_boundary_artists
 
-    # clean up residual from previous year to avoid ghosting in generating movie
-    for ax in reference_state_boundary_features:
-        ax.set_data([], [])
+    boundary_rows = np.flatnonzero((current_year >= state_boundaries.index.values) & (current_year <= state_boundaries['YearEffectiveTo'].values))
+    if len(boundary_rows) > 0:
+        state_boundary_epoch = state_boundaries.index[boundary_rows[0]]
+    else:
+        state_boundary_epoch = None
 
-    for ax in reference_state_names:
-        ax.set_text("")
+    # boundaries only change a few dozen times over the timelapse, so the artists are only restyled when the epoch changes
+    if state_boundary_epoch != mapped_state_boundary_epoch:
+        # free the previous epoch's artists, those not reused are blanked once the frame is built to avoid ghosting in generating movie
+        release_pool_artists(reference_state_boundary_features)
+        release_pool_artists(reference_state_names)
 
-    boundary_row = state_boundaries[(current_year >= state_boundaries.index) & (current_year <= state_boundaries.YearEffectiveTo)]
-    if len(boundary_row) > 0:
-        state_boundary_path = boundary_row.GeoJsonFile.values[0]
-        state_geo_paths = pd.read_json('./data/' + state_boundary_path)
-        features = state_geo_paths['features']
-        feature_ctr = 0       
-        
-        for feature in features:
-            geometries = feature['geometry']
-            coords = geometries['coordinates']
-            df = pd.DataFrame(coords, columns=['longitude','latitude'])               
-            plot_pyplot_axes = reference_state_boundary_features[feature_ctr]
-            plot_pyplot_axes.set_data(df.longitude.values, df.latitude.values)
-            list_items.append(plot_pyplot_axes)
-            #state_line_plot, = ax.plot(df.longitude.values, df.latitude.values, color='0.7', linewidth=0.5, zorder=state_boundary_zorder)  
-            #list_items.append(state_line_plot)
-            feature_ctr += 1
-        
-        state_name_ctr = 0
-        state_text_path = boundary_row.StateNameFile.values[0]
-        state_names = pd.read_csv('./data/' + state_text_path)
-        if display_colonisation:
-            state_name_list = state_names.loc[state_names["Mapping"] == "Colonisation"]
-        else:
-            state_name_list = state_names.loc[state_names["Mapping"] == "Legislation"]
-        for index, state_name in state_name_list.iterrows():                                           
-            text_pyplot_axes = reference_state_names[state_name_ctr]
-            text_pyplot_axes.set_x(float(state_name['Longitude']))
-            text_pyplot_axes.set_y(float(state_name['Latitude']))
-            text_pyplot_axes.set_text(state_name['StateName'])
-            list_items.append(text_pyplot_axes) 
-            #list_items.append(ax.text(float(state_name['Longitude']), float(state_name['Latitude']), state_name['StateName'], verticalalignment='center', horizontalalignment='left', color='0.6', fontsize=10, zorder=state_boundary_zorder))
-            state_name_ctr += 1
+        mapped_state_boundary_artists = []
+        if state_boundary_epoch is not None:
+            epoch_geometry = state_boundary_geometry[state_boundary_epoch]
+
+            for feature_ctr, feature_coords in enumerate(epoch_geometry['features']):
+                plot_pyplot_axes = pool_artist(reference_state_boundary_features, feature_ctr)
+                plot_pyplot_axes.set_data(feature_coords[:, 0], feature_coords[:, 1])
+                mapped_state_boundary_artists.append(plot_pyplot_axes)
+                #state_line_plot, = ax.plot(feature_coords[:, 0], feature_coords[:, 1], color='0.7', linewidth=0.5, zorder=state_boundary_zorder)  
+                #list_items.append(state_line_plot)
+
+            for state_name_ctr, (state_name, longitude, latitude) in enumerate(epoch_geometry['names']):
+                text_pyplot_axes = pool_artist(reference_state_names, state_name_ctr, x=longitude, y=latitude, text=state_name)
+                mapped_state_boundary_artists.append(text_pyplot_axes) 
+                #list_items.append(ax.text(longitude, latitude, state_name, verticalalignment='center', horizontalalignment='left', color='0.6', fontsize=10, zorder=state_boundary_zorder))
+
+        mapped_state_boundary_epoch = state_boundary_epoch
+
+    list_items.extend(mapped_state_boundary_artists)
 
 
 def map_legislation(current_year, list_items):
@@ -1349,24 +2080,17 @@ def map_legislation(current_year, list_items):
     global reference_legislation
     legislation_count = 0
 
-    # clean up residual from previous year to avoid ghosting in generating movie
-    for ax in reference_legislation:
-        ax.set_text("")
-
-    active_british_legislation = british_legislation[((british_legislation['From'] <= current_year) & ((british_legislation['To'] > current_year) | (british_legislation['To'].isna())))]
-    active_commonwealth_legislation = commonwealth_legislation[((commonwealth_legislation['From'] <= current_year) & ((commonwealth_legislation['To'] > current_year) | (commonwealth_legislation['To'].isna())))]
-    active_act_legislation = act_legislation[((act_legislation['From'] <= current_year) & ((act_legislation['To'] > current_year) | (act_legislation['To'].isna())))]
-    active_qld_legislation = qld_legislation[((qld_legislation['From'] <= current_year) & ((qld_legislation['To'] > current_year) | (qld_legislation['To'].isna())))]
-    active_wa_legislation = wa_legislation[((wa_legislation['From'] <= current_year) & ((wa_legislation['To'] > current_year) | (wa_legislation['To'].isna())))]
-    active_sa_legislation = sa_legislation[((sa_legislation['From'] <= current_year) & ((sa_legislation['To'] > current_year) | (sa_legislation['To'].isna())))]
-    active_nsw_legislation = nsw_legislation[((nsw_legislation['From'] <= current_year) & ((nsw_legislation['To'] > current_year) | (nsw_legislation['To'].isna())))]
-    active_nt_legislation = nt_legislation[((nt_legislation['From'] <= current_year) & ((nt_legislation['To'] > current_year) | (nt_legislation['To'].isna())))]
-    active_tas_legislation = tas_legislation[((tas_legislation['From'] <= current_year) & ((tas_legislation['To'] > current_year) | (tas_legislation['To'].isna())))]
-    active_vic_legislation = vic_legislation[((vic_legislation['From'] <= current_year) & ((vic_legislation['To'] > current_year) | (vic_legislation['To'].isna())))]
+    # free the previous year's artists, those not reused are blanked once the frame is built to avoid ghosting in generating movie
+    release_pool_artists(reference_legislation)
+
+    active_legislation = legislation.iloc[active_interval_rows(legislation_index, current_year)]
+    active_legislation_by_jurisdiction = dict(tuple(active_legislation.groupby('Jurisdiction', sort=False)))
+    no_legislation = legislation.iloc[0:0]
     
     #Aboriginal Protection Boards and Legislation
     pb_txt_locations = {'State':['VIC','NSW','WA','QLD','SA','NT','ACT','TAS','CTH','BRITAIN'],'Longitude':[141.5,141.5,116.0,140.0,129.5,129.5,155.5,145.5,153.0,111.0],'Latitude':[-36.0,-30.4,-23.4,-20.9,-27.9,-16.4,-34.7,-41.2,-12.0,-12.0]}
     pb_locations_df = pd.DataFrame(pb_txt_locations)
+    parliament_headings = {'CTH': 'Commonwealth Parliament', 'BRITAIN': 'British Parliament'}
 
     for index, state_pb in pb_locations_df.iterrows():
         pb_txt_x = state_pb['Longitude']
@@ -1377,51 +2101,15 @@ def map_legislation(current_year, list_items):
         # TODO - check end dates of legislation
         if display_legislation:
             y_offset = pb_txt_y - 0.2
-            if state_pb['State'] == 'VIC':               
-                legislation_count += add_legislation(list_items, active_vic_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'NSW':               
-                legislation_count += add_legislation(list_items, active_nsw_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'WA':               
-                legislation_count += add_legislation(list_items, active_wa_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'QLD':               
-                legislation_count += add_legislation(list_items, active_qld_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'SA':               
-                legislation_count += add_legislation(list_items, active_sa_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'NT':               
-                legislation_count += add_legislation(list_items, active_nt_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'ACT':               
+            active_jurisdiction_legislation = active_legislation_by_jurisdiction.get(state_pb['State'], no_legislation)
+            if state_pb['State'] == 'ACT':
                 y_offset -= 0.8
-                legislation_count += add_legislation(list_items, active_act_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'TAS':    
-                legislation_count += add_legislation(list_items, active_tas_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'CTH':
-                if len(active_commonwealth_legislation) > 0:
-                    text_pyplot_axes = reference_legislation[legislation_count]
-                    text_pyplot_axes.set_x(pb_txt_x)
-                    text_pyplot_axes.set_y(pb_txt_y)
-                    text_pyplot_axes.set_text('Commonwealth Parliament')
-                    text_pyplot_axes.set_color('0.25')      
-                    text_pyplot_axes.set_verticalalignment('center')              
-                    text_pyplot_axes.set_horizontalalignment('left')
-                    text_pyplot_axes.set_fontsize(10)
-                    list_items.append(text_pyplot_axes)
-                    #list_items.append(ax.text(pb_txt_x, pb_txt_y, 'Commonwealth Parliament', verticalalignment='center', horizontalalignment='left', color='0.25', fontsize=10))
-                    legislation_count += 1
-                legislation_count += add_legislation(list_items, active_commonwealth_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
-            elif state_pb['State'] == 'BRITAIN':
-                if len(active_british_legislation) > 0:                    
-                    text_pyplot_axes = reference_legislation[legislation_count]
-                    text_pyplot_axes.set_x(pb_txt_x)
-                    text_pyplot_axes.set_y(pb_txt_y)
-                    text_pyplot_axes.set_text('British Parliament')
-                    text_pyplot_axes.set_color('0.25')      
-                    text_pyplot_axes.set_verticalalignment('center')              
-                    text_pyplot_axes.set_horizontalalignment('left')
-                    text_pyplot_axes.set_fontsize(10)
-                    list_items.append(text_pyplot_axes)
-                    #list_items.append(ax.text(pb_txt_x, pb_txt_y, 'British Parliament', verticalalignment='center', horizontalalignment='left', color='0.25', fontsize=10))  
-                    legislation_count += 1       
-                legislation_count += add_legislation(list_items, active_british_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
+            elif state_pb['State'] in parliament_headings and len(active_jurisdiction_legislation) > 0:
+                text_pyplot_axes = pool_artist(reference_legislation, legislation_count, x=pb_txt_x, y=pb_txt_y, text=parliament_headings[state_pb['State']], color='0.25', verticalalignment='center', horizontalalignment='left', fontsize=10)
+                list_items.append(text_pyplot_axes)
+                #list_items.append(ax.text(pb_txt_x, pb_txt_y, parliament_headings[state_pb['State']], verticalalignment='center', horizontalalignment='left', color='0.25', fontsize=10))
+                legislation_count += 1
+            legislation_count = add_legislation(list_items, active_jurisdiction_legislation, pb_txt_x, y_offset, reference_legislation, legislation_count)
 
         #protection boards
         if display_protection_boards:
@@ -1432,14 +2120,7 @@ def map_legislation(current_year, list_items):
                     impact_colour = '0.25'
 
                 #print(protection_board['BoardName'])                                
-                text_pyplot_axes = reference_legislation[legislation_count]
-                text_pyplot_axes.set_x(pb_txt_x)
-                text_pyplot_axes.set_y(pb_txt_y)
-                text_pyplot_axes.set_text(protection_board['BoardName'])
-                text_pyplot_axes.set_color(impact_colour)      
-                text_pyplot_axes.set_verticalalignment('center')              
-                text_pyplot_axes.set_horizontalalignment('left')
-                text_pyplot_axes.set_fontsize(8)
+                text_pyplot_axes = pool_artist(reference_legislation, legislation_count, x=pb_txt_x, y=pb_txt_y, text=protection_board['BoardName'], color=impact_colour, verticalalignment='center', horizontalalignment='left', fontsize=8)
                 list_items.append(text_pyplot_axes)
                 #pb_txt = ax.text(pb_txt_x, pb_txt_y, protection_board['BoardName'], horizontalalignment='left', color=impact_colour, fontsize=8)
                 #list_items.append(pb_txt)
@@ -1466,7 +2147,7 @@ def add_legislation(list_items, df_legislation, anchor_x_offset, anchor_y_offset
             Float: geocoordinate longitude to start listing from
 
         reference_legislation
-            List: pre-initialised MatPlotLib ax objects to use in mapping legislation text
+            Dictionary: artist pool to use in mapping legislation text
 
         legislation_count
             Integer: current count of legislation that has been added so far
@@ -1485,14 +2166,7 @@ def add_legislation(list_items, df_legislation, anchor_x_offset, anchor_y_offset
         if legislation['Impact'] == '+':
             impact_colour = '0.25'
 
-        text_pyplot_axes = reference_legislation[legal_count]
-        text_pyplot_axes.set_x(anchor_x_offset)
-        text_pyplot_axes.set_y(y_offset)
-        text_pyplot_axes.set_text(legislation['Legislation Name'])
-        text_pyplot_axes.set_color(impact_colour)   
-        text_pyplot_axes.set_verticalalignment('center')
-        text_pyplot_axes.set_horizontalalignment('left')
-        text_pyplot_axes.set_fontsize(6)
+        text_pyplot_axes = pool_artist(reference_legislation, legal_count, x=anchor_x_offset, y=y_offset, text=legislation['Legislation Name'], color=impact_colour, verticalalignment='center', horizontalalignment='left', fontsize=6)
         list_items.append(text_pyplot_axes)
         #legal_txt = ax.text(anchor_x_offset, y_offset, legislation['Legislation Name'], horizontalalignment='left', color=impact_colour, fontsize=6)
         #list_items.append(legal_txt)
@@ -1512,11 +2186,7 @@ def map_explorers(current_year, list_items):
         list_items
             list: MatplotLib ax objects to be drawn for this animation frame
     """
-    global reference_explorer_paths
-
-    # clean up residual from previous year to avoid ghosting in generating movie
-    for ax in reference_explorer_paths:
-        ax.set_data([], [])
+    global reference_explorer_paths, mapped_explorer_window
 
     num_explorer_paths = 0
 
@@ -1524,6 +2194,15 @@ def map_explorers(current_year, list_items):
     explorer_start = current_year - explorer_memory
     explorer_files = explorers.loc[explorer_start:current_year]
     explorer_files.reset_index(inplace=True) #reclaiming index column
+
+    # the paths only need to be remapped when explorers enter or leave the window, otherwise only their colour and fade change
+    explorer_window = tuple(explorer_files['GeoJson'])
+    remap_explorer_paths = explorer_window != mapped_explorer_window
+    if remap_explorer_paths:
+        # free the previous window's artists, those not reused are blanked once the frame is built to avoid ghosting in generating movie
+        release_pool_artists(reference_explorer_paths)
+        mapped_explorer_window = explorer_window
+
     list_explorers = []
     if len(explorer_files) > 0:
         for i in range(len(explorer_files)):
@@ -1545,19 +2224,12 @@ def map_explorers(current_year, list_items):
                     explorer_alpha = 0
                             
             feature_ctr = 0    
-            explorer_geo_path = pd.read_json('./data/' + explorer_file_path)
-            features = explorer_geo_path['features']
-            for feature in features:
-                geometries = feature['geometry']
-                coords = geometries['coordinates']
-                df = pd.DataFrame(coords, columns=['longitude','latitude'])
-                plot_pyplot_axes = reference_explorer_paths[num_explorer_paths]
-                plot_pyplot_axes.set_data(df.longitude.values, df.latitude.values)
-                plot_pyplot_axes.set_color(explorer_colour)
-                plot_pyplot_axes.set_linestyle('dotted')
-                plot_pyplot_axes.set_alpha(explorer_alpha)   
+            for feature_coords in explorer_paths[explorer_file_path]:
+                plot_pyplot_axes = pool_artist(reference_explorer_paths, num_explorer_paths, color=explorer_colour, linestyle='dotted', alpha=explorer_alpha)
+                if remap_explorer_paths:
+                    plot_pyplot_axes.set_data(feature_coords[:, 0], feature_coords[:, 1])
                 list_items.append(plot_pyplot_axes)
-                #explorer_line_plot, = ax.plot(df.longitude.values, df.latitude.values, color=explorer_colour, linestyle='dotted', alpha=explorer_alpha, zorder=explorer_zorder)  
+                #explorer_line_plot, = ax.plot(feature_coords[:, 0], feature_coords[:, 1], color=explorer_colour, linestyle='dotted', alpha=explorer_alpha, zorder=explorer_zorder)  
                 #list_items.append(explorer_line_plot)
                 feature_ctr += 1
                 num_explorer_paths += 1
@@ -1589,19 +2261,9 @@ def add_explorers(list_items, explorer_list, anchor_x_offset, anchor_y_offset, c
     """
     global reference_explorer_names
 
-    # clean up residual from previous year to avoid ghosting in generating movie
-    for ax in reference_explorer_names:
-        ax.set_text("")
-
     y_offset = anchor_y_offset
 
-    text_pyplot_axes = reference_explorer_names[0]
-    text_pyplot_axes.set_x(anchor_x_offset)
-    text_pyplot_axes.set_y(y_offset)
-    text_pyplot_axes.set_text("Explorers")
-    text_pyplot_axes.set_color(colour)
-    text_pyplot_axes.set_fontsize(10)
-    text_pyplot_axes.set_alpha(max([row[1] for row in explorer_list]))   
+    text_pyplot_axes = pool_artist(reference_explorer_names, 0, x=anchor_x_offset, y=y_offset, text="Explorers", color=colour, fontsize=10, alpha=max([row[1] for row in explorer_list]))
     list_items.append(text_pyplot_axes)
     #explorer_txt = ax.text(anchor_x_offset, y_offset, "Explorers", horizontalalignment='left', color=colour, fontsize=10, alpha=max([row[1] for row in explorer_list]))
     #list_items.append(explorer_txt)    
@@ -1609,18 +2271,127 @@ def add_explorers(list_items, explorer_list, anchor_x_offset, anchor_y_offset, c
     for i in range(len(explorer_list) - 1, -1, -1):
         y_offset -= 0.34
 
-        text_pyplot_axes = reference_explorer_names[i + 1]
-        text_pyplot_axes.set_x(anchor_x_offset)
-        text_pyplot_axes.set_y(y_offset)
-        text_pyplot_axes.set_text(explorer_list[i][0])
-        text_pyplot_axes.set_color(colour)
-        text_pyplot_axes.set_fontsize(7)
-        text_pyplot_axes.set_alpha(explorer_list[i][1])   
+        text_pyplot_axes = pool_artist(reference_explorer_names, i + 1, x=anchor_x_offset, y=y_offset, text=explorer_list[i][0], color=colour, fontsize=7, alpha=explorer_list[i][1])
         list_items.append(text_pyplot_axes)
         #explorer_txt = ax.text(anchor_x_offset, y_offset, explorer_list[i][0], horizontalalignment='left', color=colour, fontsize=7, alpha=explorer_list[i][1])
         #list_items.append(explorer_txt)
 
 
+def init_massacre_accumulator():
+    """
+        Sets up the running arrays and totals of massacres, in the order they are mapped. 
+        Positions, sizes, totals and the wrapped text listing are all built over the whole dataset at load time
+
+        Returns
+        -------
+        massacre_accumulator
+            Dictionary:
+                'years' - year of each massacre, ascending
+                'positions' - longitude, latitude of each massacre
+                'sizes' - display size of each massacre
+                'colour_table' - RGBA colour of a massacre, indexed by the number of years since it occurred
+                'attacks_by_colonists', 'colonist_attackers_dead', 'colonist_victims_dead', 'attacks_by_Aboriginals', 'Aboriginal_attackers_dead', 'Aboriginal_victims_dead'
+                    - running totals up to and including each massacre
+                'line_text', 'line_site' - text listing of all massacres, and the massacre each line belongs to
+                'line_ends' - number of listing lines up to and including each massacre
+    """
+    victims_dead = massacres['properties.VictimsDead'].astype(int).values
+    attackers_dead = massacres['properties.AttackersDead'].astype(int).values
+    attackers = massacres['properties.Attackers'].astype(str)
+
+    # Count dead betwween colonial initiated conflicts and First Nations initiated conflicts
+    # Not currently counting First Nations vs First Nations conflicts in the running totals
+    attacked_by_colonists = (attackers == "Colonists").values
+    attacked_by_Aboriginals = ~attacked_by_colonists & (attackers.str[:10] == "Aboriginal").values
+
+    anime_massacre_duration = final_anime_year - massacres.index[0]
+
+    line_text, line_site, line_ends = build_massacre_lines(massacres.index.values)
+
+    return {'years': massacres.index.values,
+            'positions': np.column_stack([massacres['properties.longitude'].astype(float).values, massacres['properties.latitude'].astype(float).values]),
+            'sizes': massacre_display_size(victims_dead + attackers_dead),
+            'colour_table': massacre_display_colours(np.arange(anime_massacre_duration + 1), anime_massacre_duration),
+            'attacks_by_colonists': np.cumsum(attacked_by_colonists),
+            'colonist_attackers_dead': np.cumsum(np.where(attacked_by_colonists, attackers_dead, 0)),
+            'colonist_victims_dead': np.cumsum(np.where(attacked_by_colonists, victims_dead, 0)),
+            'attacks_by_Aboriginals': np.cumsum(attacked_by_Aboriginals),
+            'Aboriginal_attackers_dead': np.cumsum(np.where(attacked_by_Aboriginals, attackers_dead, 0)),
+            'Aboriginal_victims_dead': np.cumsum(np.where(attacked_by_Aboriginals, victims_dead, 0)),
+            'line_text': line_text,
+            'line_site': line_site,
+            'line_ends': line_ends}
+
+def build_massacre_lines(massacre_years):
+    """
+        Builds the text listing of every massacre, wrapped to the width of the listing, 
+        so each frame only needs to slice out the lines it displays
+
+        Parameters
+        ----------
+        massacre_years
+            Numpy Integer Array: year of each massacre, ascending
+
+        Returns
+        -------
+        line_text
+            List: text of each listing line, each massacre listed bottom line first
+
+        line_site
+            Numpy Integer Array: the massacre each line belongs to
+
+        line_ends
+            Numpy Integer Array: number of listing lines up to and including each massacre
+    """
+    line_text = []
+    line_site = []
+    line_ends = []
+
+    for site in range(len(massacre_years)):
+        massacre = massacres.iloc[site]
+        massacre_year = int(massacre_years[site])
+        if site == 0:
+            previous_massacre_year = massacres.index[0]
+        else:
+            previous_massacre_year = int(massacre_years[site - 1])
+
+        site_lines = []
+        if massacre_year - previous_massacre_year > 1:
+            for no_massacre_year in range(1, massacre_year - previous_massacre_year):
+                site_lines.append("")
+
+        if pd.isna(massacre['properties.KnownDate']):
+            massacre_known_date = str(massacre_year)
+        else:
+            massacre_known_date = str(massacre['properties.KnownDate'])
+                
+        if pd.isna(massacre['properties.LanguageGroup']):
+            first_nations_language = ""
+        else:
+            first_nations_language = str(massacre['properties.LanguageGroup'])
+
+        if pd.isna(massacre['properties.WeaponsUsed']):
+            weapons_used = ""
+        else:
+            weapons_used = str(massacre['properties.WeaponsUsed'])
+
+        number_dead = int(massacre['properties.VictimsDead']) + int(massacre['properties.AttackersDead'])
+
+        site_lines.append("")
+        # each text is listed bottom line first, as the listing is displayed in reverse order
+        for massacre_text in ["".join(["Attack involved ", weapons_used]), \
+                              "".join([str(massacre['properties.Attackers']), " attacked ", str(massacre['properties.Victims'])]), \
+                              "".join([str(number_dead), " dead. Attackers: ", str(massacre['properties.AttackersDead']), ", Victims: ", str(massacre['properties.VictimsDead'])]), \
+                              "".join([massacre_known_date, " - ", first_nations_language])]:
+            wrapped_lines = textwrap.wrap(text=massacre_text, width=63, subsequent_indent="      ")
+            site_lines.extend(reversed(wrapped_lines))
+
+        line_text.extend(site_lines)
+        line_site.extend([site] * len(site_lines))
+        line_ends.append(len(line_text))
+
+    return line_text, np.array(line_site, dtype=int), np.array(line_ends, dtype=int)
+
 def map_massacres(current_year, list_items):
     """
         Map locations of massacres
@@ -1636,124 +2407,55 @@ def map_massacres(current_year, list_items):
     global massacre_scatter
 
     earliest_recorded_massacre = massacres.index[0]
-    anime_massacre_duration = final_anime_year - earliest_recorded_massacre
 
     if current_year >= earliest_recorded_massacre:
-        massacre_sites = massacres.loc[earliest_recorded_massacre:current_year]
-        list_massacres = []
-        previous_massacre_year = earliest_recorded_massacre
-
-        if len(massacre_sites) > 0:
-            lat = massacre_sites['properties.latitude'].values
-            lon = massacre_sites['properties.longitude'].values
-            victims_dead = massacre_sites['properties.VictimsDead'].values
-            attackers_dead = massacre_sites['properties.AttackersDead'].values                    
-            massacre_dates = massacre_sites['properties.datestart'].values
-            known_date = massacre_sites['properties.KnownDate'].values
-            language_group = massacre_sites['properties.LanguageGroup'].values
-            attackers = massacre_sites['properties.Attackers'].values
-            victims = massacre_sites['properties.Victims'].values
-            weapons = massacre_sites['properties.WeaponsUsed'].values
-
-            massacre_plot_locations = np.zeros(len(massacre_sites), dtype=[('position', float, 2)])
-            massacre_size = np.zeros(len(massacre_sites), dtype=int)
-            massacre_colour = np.empty(len(massacre_sites), dtype=object)  
-            massacre_alpha = np.ones(len(massacre_sites), dtype=float)     
-
-            num_attacks_by_colonists = 0
-            num_colonist_attackers_dead = 0
-            num_colonist_victims_dead = 0
-            num_attacks_by_Aboriginals = 0  
-            num_Aboriginal_attackers_dead = 0
-            num_Aboriginal_victims_dead = 0          
-
-            for i in range(len(massacre_sites)):
-                massacre_plot_locations['position'][i][0] = lon[i]
-                massacre_plot_locations['position'][i][1] = lat[i]
-
-                number_dead = int(victims_dead[i]) + int(attackers_dead[i])
-
-                massacre_size[i] = massacre_display_size(number_dead)
-
-                massacre_year = int(pd.to_datetime(massacre_dates[i]).year)
-                massacre_colour[i], massacre_alpha[i] = massacre_display_colour(current_year, massacre_year, anime_massacre_duration)    
-
-                if massacre_year - previous_massacre_year > 1:
-                    for no_massacre_year in range(1, massacre_year - previous_massacre_year):
-                        list_massacres.append(["", massacre_colour[i]])
-                        
-                previous_massacre_year = massacre_year    
-
-                if pd.isna(known_date[i]):
-                    massacre_known_date = str(massacre_year)
-                else:
-                    massacre_known_date = str(known_date[i])
-                        
-                if pd.isna(language_group[i]):
-                    first_nations_language = ""
-                else:
-                    first_nations_language = str(language_group[i])
+        number_sites = np.searchsorted(massacre_accumulator['years'], current_year, side='right')
 
-                if pd.isna(weapons[i]):
-                    weapons_used = ""
-                else:
-                    weapons_used = str(weapons[i])
-                        
-                list_massacres.append(["", massacre_colour[i]])
-
-                massacre_text = "".join(["Attack involved ", weapons_used])
-                wrapped_lines = textwrap.wrap(text=massacre_text, width=63, subsequent_indent="      ")
-                for line_number in range(len(wrapped_lines) - 1, -1, -1):
-                    list_massacres.append([wrapped_lines[line_number], massacre_colour[i]])
-
-                massacre_text = "".join([str(attackers[i]), " attacked ", str(victims[i])])
-                wrapped_lines = textwrap.wrap(text=massacre_text, width=63, subsequent_indent="      ")
-                for line_number in range(len(wrapped_lines) - 1, -1, -1):
-                    list_massacres.append([wrapped_lines[line_number], massacre_colour[i]])
-
-                massacre_text = "".join([str(number_dead), " dead. Attackers: ", str(attackers_dead[i]), ", Victims: ", str(victims_dead[i])])
-                wrapped_lines = textwrap.wrap(text=massacre_text, width=63, subsequent_indent="      ")
-                for line_number in range(len(wrapped_lines) - 1, -1, -1):
-                    list_massacres.append([wrapped_lines[line_number], massacre_colour[i]])     
-
-                massacre_text = "".join([massacre_known_date, " - ", first_nations_language])
-                wrapped_lines = textwrap.wrap(text=massacre_text, width=63, subsequent_indent="      ")
-                for line_number in range(len(wrapped_lines) - 1, -1, -1):
-                    list_massacres.append([wrapped_lines[line_number], massacre_colour[i]])     
-
-                # Count dead betwween colonial initiated conflicts and First Nations initiated conflicts
-                # Not currently counting First Nations vs First Nations conflicts in the running totals
-                if attackers[i] == "Colonists":
-                    num_attacks_by_colonists += 1
-                    num_colonist_attackers_dead += int(attackers_dead[i])
-                    num_colonist_victims_dead += int(victims_dead[i])
-                elif attackers[i][:10] == "Aboriginal":
-                    num_attacks_by_Aboriginals += 1
-                    num_Aboriginal_attackers_dead += int(attackers_dead[i])
-                    num_Aboriginal_victims_dead += int(victims_dead[i])
-
-            #TODO, create individual ax.scatter objects each with their own alpha values
-            massacre_scatter.set_offsets(massacre_plot_locations['position'])
-            massacre_scatter.set_sizes(massacre_size)
+        if number_sites > 0:
+            massacre_colour = massacre_accumulator['colour_table'][current_year - massacre_accumulator['years'][:number_sites]]
+            # text fades by its position in the listing rather than the age of the massacre
+            massacre_text_colour = [tuple(site_colour) for site_colour in massacre_colour[:, :3]]
+
+            massacre_scatter.set_offsets(massacre_accumulator['positions'][:number_sites])
+            massacre_scatter.set_sizes(massacre_accumulator['sizes'][:number_sites])
             massacre_scatter.set_facecolors(massacre_colour)
-            massacre_scatter.set_edgecolors('#690a03')
+            massacre_scatter.set_edgecolors(massacre_edge_colour)
             list_items.append(massacre_scatter)
 
-            last_massacre_year = int(pd.to_datetime(massacre_dates[-1]).year)
-            if last_massacre_year < current_year:
-                for i in range (1, current_year - last_massacre_year):
-                    list_massacres.append(["", massacre_colour[0]])
-
-            list_massacres.append(["", massacre_colour[0]])
-            list_massacres.append(["", massacre_colour[0]])
-            list_massacres.append(["".join(['{:,}'.format(num_attacks_by_Aboriginals), " attacks by First Nations; ", '{:,}'.format(num_Aboriginal_victims_dead), " victims. ", '{:,}'.format(num_Aboriginal_attackers_dead), " attackers died"]), massacre_colour[0]])
-            list_massacres.append(["".join(['{:,}'.format(num_attacks_by_colonists), " attacks by colonists; ", '{:,}'.format(num_colonist_victims_dead), " victims. ", '{:,}'.format(num_colonist_attackers_dead), " attackers died"]), massacre_colour[0]])
-            list_massacres.append(["".join(['{:,}'.format(num_attacks_by_colonists + num_attacks_by_Aboriginals), " identified massacre events; ", '{:,}'.format(num_colonist_attackers_dead + num_colonist_victims_dead + num_Aboriginal_attackers_dead + num_Aboriginal_victims_dead), " dead"]), massacre_colour[0]])
-
             if display_massacre_text:
-                add_massacres(list_items, list_massacres, 161.7, -11.25)
-
-def add_massacres(list_items, massacre_list, anchor_x_offset, anchor_y_offset):
+                last_site = number_sites - 1
+                num_attacks_by_colonists = massacre_accumulator['attacks_by_colonists'][last_site]
+                num_colonist_attackers_dead = massacre_accumulator['colonist_attackers_dead'][last_site]
+                num_colonist_victims_dead = massacre_accumulator['colonist_victims_dead'][last_site]
+                num_attacks_by_Aboriginals = massacre_accumulator['attacks_by_Aboriginals'][last_site]
+                num_Aboriginal_attackers_dead = massacre_accumulator['Aboriginal_attackers_dead'][last_site]
+                num_Aboriginal_victims_dead = massacre_accumulator['Aboriginal_victims_dead'][last_site]
+
+                list_totals = []
+                last_massacre_year = int(massacre_accumulator['years'][last_site])
+                if last_massacre_year < current_year:
+                    for i in range (1, current_year - last_massacre_year):
+                        list_totals.append("")
+
+                list_totals.append("")
+                list_totals.append("")
+                list_totals.append("".join(['{:,}'.format(num_attacks_by_Aboriginals), " attacks by First Nations; ", '{:,}'.format(num_Aboriginal_victims_dead), " victims. ", '{:,}'.format(num_Aboriginal_attackers_dead), " attackers died"]))
+                list_totals.append("".join(['{:,}'.format(num_attacks_by_colonists), " attacks by colonists; ", '{:,}'.format(num_colonist_victims_dead), " victims. ", '{:,}'.format(num_colonist_attackers_dead), " attackers died"]))
+                list_totals.append("".join(['{:,}'.format(num_attacks_by_colonists + num_attacks_by_Aboriginals), " identified massacre events; ", '{:,}'.format(num_colonist_attackers_dead + num_colonist_victims_dead + num_Aboriginal_attackers_dead + num_Aboriginal_victims_dead), " dead"]))
+
+                # only the most recent lines of the listing are displayed
+                last_line = massacre_accumulator['line_ends'][last_site]
+                first_line = max(0, last_line - max(0, number_massacre_lines_to_display - len(list_totals)))
+
+                list_massacres = []
+                for line in range(first_line, last_line):
+                    list_massacres.append([massacre_accumulator['line_text'][line], massacre_text_colour[massacre_accumulator['line_site'][line]]])
+                for total_line in list_totals:
+                    list_massacres.append([total_line, massacre_text_colour[0]])
+
+                add_massacres(list_items, list_massacres, massacre_text_colour[0], 161.7, -11.25)
+
+def add_massacres(list_items, massacre_list, heading_colour, anchor_x_offset, anchor_y_offset):
     """
         List massacres in recent time window
 
@@ -1765,6 +2467,9 @@ def add_massacres(list_items, massacre_list, anchor_x_offset, anchor_y_offset):
         massacre_list
             list: text fragments of massacres to list, processed in reverse order
 
+        heading_colour
+            Tuple: RGB colour of the listing heading
+
         anchor_x_offset
             Float: geocoordinate latitude to start listing from
 
@@ -1772,22 +2477,12 @@ def add_massacres(list_items, massacre_list, anchor_x_offset, anchor_y_offset):
             Float: geocoordinate longitude to start listing from 
     """
     global reference_massacre_lines, number_massacre_lines_to_display
-
-    # clean up residual from previous year to avoid ghosting in generating movie
-    for ax in reference_massacre_lines:
-        ax.set_text("")
    
     y_offset = anchor_y_offset
     
-    text_pyplot_axes = reference_massacre_lines[-1]
-    text_pyplot_axes.set_x(anchor_x_offset)
-    text_pyplot_axes.set_y(y_offset)
-    text_pyplot_axes.set_text("Massacres")
-    text_pyplot_axes.set_color(massacre_list[0][1])
-    text_pyplot_axes.set_fontsize(10)
-    text_pyplot_axes.set_alpha(1)   
+    text_pyplot_axes = pool_artist(reference_massacre_lines, 0, x=anchor_x_offset, y=y_offset, text="Massacres", color=heading_colour, fontsize=10, alpha=1)
     list_items.append(text_pyplot_axes)  
-    #massacre_txt = ax.text(anchor_x_offset, y_offset, "Massacres", horizontalalignment='left', color=massacre_list[0][1], fontsize=10)
+    #massacre_txt = ax.text(anchor_x_offset, y_offset, "Massacres", horizontalalignment='left', color=heading_colour, fontsize=10)
     #list_items.append(massacre_txt) 
 
     last_massacre_events = massacre_list[(-1 * number_massacre_lines_to_display):]
@@ -1816,42 +2511,29 @@ def add_massacres(list_items, massacre_list, anchor_x_offset, anchor_y_offset):
         
         massacre_event_txt = last_massacre_events[i][0]
 
-        text_pyplot_axes = reference_massacre_lines[i]
-        text_pyplot_axes.set_x(anchor_x_offset)
-        text_pyplot_axes.set_y(y_offset)
-        text_pyplot_axes.set_text(massacre_event_txt)
-        text_pyplot_axes.set_color(massacre_list[i][1])
-        text_pyplot_axes.set_fontsize(7)   
-        text_pyplot_axes.set_alpha(alpha_array[alpha_pointer])
+        text_pyplot_axes = pool_artist(reference_massacre_lines, i + 1, x=anchor_x_offset, y=y_offset, text=massacre_event_txt, color=last_massacre_events[i][1], fontsize=7, alpha=alpha_array[alpha_pointer])
         list_items.append(text_pyplot_axes)  
         #massacre_txt = ax.text(anchor_x_offset, y_offset, massacre_event_txt, horizontalalignment='left', color=last_massacre_events[i][1], fontsize=7, alpha=alpha_array[alpha_pointer])
         #list_items.append(massacre_txt)
 
-def massacre_display_colour(current_year, massacre_year, anime_massacre_duration):
+def massacre_display_colours(time_passed, anime_massacre_duration):
     """
-        Determine colour for massacre based on age of event
+        Determine colour for massacres based on age of event
 
         Parameters
         ----------            
-        current_year
-            Integer: current year to determine age of event from
-
-        massacre_year
-            Integer: year of the event
+        time_passed
+            Numpy Integer Array: number of years since each event
 
         anime_massacre_duration
             Integer: number of years over which the animation spans
 
         Returns
         -------
-        current_massacre_colour
-            String: hex colour for massacre based on the age of the event
-
-        massacre_alpha
-            Float: Degree of transparency based on the age of the event
+        massacre_colours
+            Numpy Float Array: RGBA colour for each massacre based on the age of the event, 
+                fading to half the massacre opacity over the animation
     """
-    time_passed = current_year - massacre_year
-
     #cf210a
     red_base = 207
     green_base = 33
@@ -1866,19 +2548,17 @@ def massacre_display_colour(current_year, massacre_year, anime_massacre_duration
     yearly_green_increment = anime_massacre_duration / (green_base - green_target)
     yearly_blue_increment = anime_massacre_duration / (blue_base - blue_target)
 
-    red_delta = int(time_passed / yearly_red_increment)
-    green_delta = int(time_passed / yearly_green_increment)
-    blue_delta = int(time_passed / yearly_blue_increment)
+    red_delta = np.trunc(time_passed / yearly_red_increment)
+    green_delta = np.trunc(time_passed / yearly_green_increment)
+    blue_delta = np.trunc(time_passed / yearly_blue_increment)
 
     red_value = red_base - red_delta
     green_value = green_base - green_delta
     blue_value = blue_base - blue_delta
 
-    current_massacre_colour = "#" + hex(red_value)[2:].rjust(2, "0") + hex(green_value)[2:].rjust(2, "0") + hex(blue_value)[2:].rjust(2, "0")
-
     massacre_alpha = 1 - (time_passed / anime_massacre_duration) / 2
 
-    return current_massacre_colour, massacre_alpha
+    return np.column_stack((red_value / 255, green_value / 255, blue_value / 255, massacre_opacity * massacre_alpha))
 
 def massacre_display_size(number_dead):
     """
@@ -2035,13 +2715,9 @@ def map_towns(current_year, list_items):
         lon = colonial_period_cities[8].values
         pop = colonial_period_cities[11].values
 
-        plot_locations = np.zeros(len(colonial_period_cities), dtype=[('position', float, 2)])
-        pop_size = np.zeros(len(colonial_period_cities), dtype=int)
-        city_colour = np.empty(len(colonial_period_cities), dtype=object)
-
-        size_town(colonial_period_cities, current_year, lat, lon, pop, plot_locations, pop_size, city_colour, -1)
+        pop_size, city_colour = size_town(colonial_period_cities.index.values, current_year, pop, -1)
       
-        town_scatter.set_offsets(plot_locations['position'])
+        town_scatter.set_offsets(np.column_stack((lon, lat)).astype(float))
         town_scatter.set_sizes(pop_size)
         town_scatter.set_color(city_colour)
         #colonial_scat.set_zorder(city_zorder)
@@ -2065,98 +2741,82 @@ def map_undated_towns(current_year, list_items):
     lon = undated_cities[8].values
     pop = undated_cities[11].values
 
-    plot_locations = np.zeros(len(undated_cities), dtype=[('position', float, 2)])
-    pop_size = np.zeros(len(undated_cities), dtype=int)
-    city_colour = np.empty(len(undated_cities), dtype=object)
-
     city_perc = 1 - (final_anime_year - current_year)/(final_anime_year - start_of_town_growth)
 
-    size_town(undated_cities, current_year, lat, lon, pop, plot_locations, pop_size, city_colour, city_perc)
+    pop_size, city_colour = size_town(None, current_year, pop, city_perc)
 
-    unknown_town_est_year_scatter.set_offsets(plot_locations['position'])
+    unknown_town_est_year_scatter.set_offsets(np.column_stack((lon, lat)).astype(float))
     unknown_town_est_year_scatter.set_sizes(pop_size)
     unknown_town_est_year_scatter.set_color(city_colour)
     # as we don't know their establishment dates, fade them in, in the last 100 years
     unknown_town_est_year_scatter.set_alpha(city_perc)
     list_items.append(unknown_town_est_year_scatter)
 
-def size_town(cities, current_year, lat, lon, pop, plot_locations, pop_size, city_colour, city_perc):
+def size_town(settlement_years, current_year, pop, city_perc):
     """
-        Display Aboriginal and Torres Strait Islander deaths in custody
+        Determine the display size and colour of every town / city for the current year, in one pass over the arrays
 
         Parameters
         ----------
-        cities
-            Dataframe: data read from file
+        settlement_years
+            Numpy Integer Array: year each town / city was established, only used for dated cities
         
         current_year
             integer: current year to display
         
-        lat
-            Float: geocoordinate latitude to start listing from
-        
-        lon
-            Float: geocoordinate longitude to start listing from
-        
         pop
-            Integer: population size of town or city
-        
-        plot_locations
-            Numpy 2D Float Array: empty array to hold location for town
+            Numpy Array: population size of each town / city
         
+        city_perc
+            Float: size factor of city to display, only used for undated cities to grow to full size over time,
+                negative for dated cities, which grow and change colour as the settlement ages
+
+        Returns
+        -------
         pop_size
-            Numpy Integer Array: empty array to hold size of town / city
+            Numpy Integer Array: size of each town / city
         
         city_colour
-            Numpy Object Array: empty array to hold colour string in or town / city, changes as the settlement ages
-        
-        city_perc
-            Float: size factor of city to display, only used for undated cities to grow to full size over time
-    """
-    for i in range(len(cities)):
-        plot_locations['position'][i][0] = lon[i]
-        plot_locations['position'][i][1] = lat[i]
-
-        if city_perc < 0:
-            settlement_year = cities.index[i]
-            town_age = final_anime_year - settlement_year
-            if town_age != 0:
-                pop_per_year = pop[i] / town_age
-                current_town_age = current_year - settlement_year
-                current_town_pop = pop_per_year * current_town_age
-
-                red_delta = int(current_town_age / 9.2)
-                green_delta = int(current_town_age / 3.5)
-                blue_delta = int(current_town_age / 1.77)
-            else:
-                current_town_pop = 0
+            Numpy Float Array: RGBA colour of each town / city, changes as the settlement ages
+    """
+    pop = pop.astype(float)
 
-                red_delta = int(0)
-                green_delta = int(0)
-                blue_delta = int(0)
-        else:
-            current_town_pop = pop[i] * city_perc
+    if city_perc < 0:
+        town_age = final_anime_year - settlement_years
+        current_town_age = current_year - settlement_years
+        aged_town = town_age != 0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pop_per_year = pop / town_age
+            current_town_pop = np.where(aged_town, pop_per_year * current_town_age, 0)
+
+        red_delta = np.where(aged_town, np.trunc(current_town_age / 9.2), 0)
+        green_delta = np.where(aged_town, np.trunc(current_town_age / 3.5), 0)
+        blue_delta = np.where(aged_town, np.trunc(current_town_age / 1.77), 0)
+    else:
+        current_town_pop = pop * city_perc
 
-            red_delta = int(0)
-            green_delta = int(0)
-            blue_delta = int(0)
+        red_delta = np.zeros(len(pop))
+        green_delta = np.zeros(len(pop))
+        blue_delta = np.zeros(len(pop))
                     
-        #250, 210, 140 - #FAD28C
-        #225, 145, 10 - #E1910A
+    #250, 210, 140 - #FAD28C
+    #225, 145, 10 - #E1910A
 
-        #230 years
-        # R reduce 1 every 9.2 years
-        # G reduce 1 every 3.5 years
-        # B reduce 1 every 1.77 years
+    #230 years
+    # R reduce 1 every 9.2 years
+    # G reduce 1 every 3.5 years
+    # B reduce 1 every 1.77 years
 
-        red_value = 250 - red_delta
-        green_value = 210 - green_delta
-        blue_value = 140 - blue_delta
+    red_value = 250 - red_delta
+    green_value = 210 - green_delta
+    blue_value = 140 - blue_delta
 
-        current_city_colour = "#" + hex(red_value)[2:].rjust(2, "0") + hex(green_value)[2:].rjust(2, "0") + hex(blue_value)[2:].rjust(2, "0")
-        city_colour[i] = current_city_colour      
+    city_colour = np.column_stack((red_value / 255, green_value / 255, blue_value / 255, np.ones(len(pop))))
 
-        pop_size[i] = town_display_size(current_town_pop)
+    pop_size = town_display_size(current_town_pop)
+
+    return pop_size, city_colour
 
 def town_display_size(current_town_pop):
     """
@@ -2165,22 +2825,47 @@ def town_display_size(current_town_pop):
         Parameters
         ----------
         current_town_pop
-            Integer: population of town / city
+            Numpy Float Array: population of each town / city
 
         Returns
         -------
         return
-            display size of town / city
+            Numpy Integer Array: display size of each town / city
 
     """
-    if pd.isna(current_town_pop):
-        pop = 4
-    else:
-        pop = current_town_pop
+    pop = np.where(np.isnan(current_town_pop), 4, current_town_pop)
     
     # treat the population as a volume of a sphere and return the radius
     # V = (4/3)*pi*r^3
-    return int((((6*pop)/np.pi)**(1/3))/2)
+    return ((((6*pop)/np.pi)**(1/3))/2).astype(int)
+
+def build_railway_line_index(line_names):
+    """
+        Indexes the segments of each railway line in the flattened railway coordinates, so mapping a railway line is a gather 
+        rather than a lookup by name
+
+        Parameters
+        ----------
+        line_names
+            Array-like: name of each railway line, as listed in the 'operating_dates_of_australian_railway_lines.csv' file
+
+        Returns
+        -------
+        railway_line_index
+            Dictionary:
+                'first_segment' - position of the first segment of each railway line
+                'segment_count' - number of segments of each railway line, zero for railway lines not in the GeoJSON
+                'segment_coords' - longitude and latitude of each segment, as views of the flattened coordinates
+    """
+    # segments of a railway line are stored contiguously, sorted by name
+    line_names = np.asarray(line_names, dtype=str)
+    first_segment = np.searchsorted(railways['names'], line_names, side='left')
+    last_segment = np.searchsorted(railways['names'], line_names, side='right')
+
+    offsets = railways['offsets']
+    segment_coords = [railways['coordinates'][offsets[segment]:offsets[segment + 1]] for segment in range(len(offsets) - 1)]
+
+    return {'first_segment': first_segment, 'segment_count': last_segment - first_segment, 'segment_coords': segment_coords}
 
 def map_railway_lines(current_year, list_items):
     """
@@ -2194,115 +2879,28 @@ def map_railway_lines(current_year, list_items):
         list_items
             list: MatplotLib ax objects to be drawn for this animation frame
     """
-    commenced_lines = railway_operating_dates[((railway_operating_dates['Commenced'] <= current_year) & (railway_operating_dates['Opened'] > current_year) & ((railway_operating_dates['Closed'] > current_year) | (railway_operating_dates['Closed'].isna())))]
-    opened_lines = railway_operating_dates[((railway_operating_dates['Opened'] <= current_year) & ((railway_operating_dates['Closed'] > current_year) | (railway_operating_dates['Closed'].isna())))]
-    closed_lines = railway_operating_dates[(railway_operating_dates['Closed'] <= current_year)]
-    
-    num_railway_segments = 0
-    for i in range(len(commenced_lines)):
-        num_railway_segments =+ map_railway_segments(list_items, commenced_lines, i, num_railway_segments, '0.5', 'dashed')
+    global railway_collections
 
-    for i in range(len(opened_lines)):   
-        num_railway_segments =+ map_railway_segments(list_items, opened_lines, i, num_railway_segments, '0.3', '-')   
+    railway_status_indexes = {'commenced': railway_commenced_index, 'opened': railway_opened_index, 'closed': railway_closed_index}
 
-    for i in range(len(closed_lines)):   
-        num_railway_segments =+ map_railway_segments(list_items, closed_lines, i, num_railway_segments, '0.6', 'dotted') 
+    num_railway_segments = 0
+    for railway_status, railway_status_index in railway_status_indexes.items():
+        railway_lines = active_interval_rows(railway_status_index, current_year)
+
+        # expand the segment range of each railway line into the positions of its segments
+        segment_count = railway_line_index['segment_count'][railway_lines]
+        first_segment = np.repeat(railway_line_index['first_segment'][railway_lines], segment_count)
+        segment_in_line = np.arange(segment_count.sum()) - np.repeat(np.cumsum(segment_count) - segment_count, segment_count)
+        railway_segments = [railway_line_index['segment_coords'][segment] for segment in first_segment + segment_in_line]
+
+        railway_collections[railway_status].set_segments(railway_segments)
+        list_items.append(railway_collections[railway_status])
+        #rail_line_plot, = ax.plot(line_coords[:, 0], line_coords[:, 1], color=colour, linestyle=line_style, linewidth=0.7, zorder=railway_zorder)
+        #list_items.append(rail_line_plot)
+        num_railway_segments += len(railway_segments)
 
     #print("Number of railway segments: " + str(num_railway_segments)) 
 
-def map_railway_segments(list_items, mapped_lines, i, num_railway_segments, colour='0.3', line_style='-'):
-    """
-        Map railway segments for a specific railway line
-
-        Parameters
-        ----------
-        list_items
-            list: MatplotLib ax objects to be drawn for this animation frame
-
-        mapped_lines
-            list: railway segments to be mapped for railway line
-
-        i
-            Integer: count of railway lines being mapped for current railway status - commenced, open, closed
-        
-        num_railway_segments
-            Integer: number of railway segments counted so far in mapping the railway lines
-        
-        (Optional) colour
-            String: colour of railway line
-                defaults to '0.3'        
-        
-        (Optional) line_style
-            String: line style for railway line 
-                defaults to '-'
-
-        Returns
-        -------
-        railway_segment_ctr
-            number of railway segments in mapped railway lines
-    """
-    global reference_railway_segments
-
-    railway_segment_ctr = num_railway_segments
-
-    line_name = mapped_lines.iloc[i]['Name']
-    #print(line_name)
-    railway_line = railways.loc[line_name]        
-    if len(railway_line.shape) == 1:
-        # single LineString
-        plot_pyplot_axes = reference_railway_segments[railway_segment_ctr]
-        plot_pyplot_axes.set_data([x[0] for x in railway_line['geometry.coordinates']], [y[1] for y in railway_line['geometry.coordinates']])
-        plot_pyplot_axes.set_color(colour)
-        plot_pyplot_axes.set_linestyle(line_style)
-        list_items.append(plot_pyplot_axes)  
-        #rail_line_plot, = ax.plot([x[0] for x in railway_line['geometry.coordinates']], [y[1] for y in railway_line['geometry.coordinates']], color=colour, linestyle=line_style, linewidth=0.7, zorder=railway_zorder)
-        #list_items.append(rail_line_plot)
-        railway_segment_ctr += 1
-    elif len(railway_line.shape) == 2:
-        # multiple LineStrings
-        for line_coords_segment in railway_line['geometry.coordinates']:
-            try:  
-                # multiple line_name entries, line_coords_segment will be an array of lat/lon values
-                if list_dimension(line_coords_segment) == 1:                    
-                    plot_pyplot_axes = reference_railway_segments[railway_segment_ctr]
-                    plot_pyplot_axes.set_data([line_coords_segment[0]], [line_coords_segment[1]])
-                    plot_pyplot_axes.set_color(colour)
-                    plot_pyplot_axes.set_linestyle(line_style)
-                    list_items.append(plot_pyplot_axes)
-                    #rail_line_plot, = ax.plot([line_coords_segment[0]], [line_coords_segment[1]], color=colour, linestyle=line_style, linewidth=0.7, zorder=railway_zorder)
-                    #list_items.append(rail_line_plot)
-                    railway_segment_ctr += 1
-                elif list_dimension(line_coords_segment) == 2: 
-                    plot_pyplot_axes = reference_railway_segments[railway_segment_ctr]
-                    plot_pyplot_axes.set_data([x[0] for x in line_coords_segment], [y[1] for y in line_coords_segment])
-                    plot_pyplot_axes.set_color(colour)
-                    plot_pyplot_axes.set_linestyle(line_style)
-                    list_items.append(plot_pyplot_axes)              
-                    #rail_line_plot, = ax.plot([x[0] for x in line_coords_segment], [y[1] for y in line_coords_segment], color=colour, linestyle=line_style, linewidth=0.7, zorder=railway_zorder)
-                    #list_items.append(rail_line_plot)
-                    railway_segment_ctr += 1
-                elif list_dimension(line_coords_segment) == 3:
-                    # handle MultiLineStrings
-                    for row in line_coords_segment:                        
-                        plot_pyplot_axes = reference_railway_segments[railway_segment_ctr]
-                        plot_pyplot_axes.set_data([x[0] for x in row], [y[1] for y in row])
-                        plot_pyplot_axes.set_color(colour)
-                        plot_pyplot_axes.set_linestyle(line_style)
-                        list_items.append(plot_pyplot_axes)
-                        #rail_line_plot, = ax.plot([x[0] for x in row], [y[1] for y in row], color=colour, linestyle=line_style, linewidth=0.7, zorder=railway_zorder)
-                        #list_items.append(rail_line_plot)
-                        railway_segment_ctr += 1
-            except ValueError as err:
-                print(f"Unexpected {err=}, {type(err)=}")
-                print("Value Error processing commenced line: " + line_name)
-                print(line_coords_segment)
-            except Exception as err:
-                print(f"Unexpected {err=}, {type(err)=}")
-                print("Error processing commenced line: " + line_name)
-                print(line_coords_segment)
-
-    return railway_segment_ctr
-
 def map_missions(current_year, list_items):
     """
         Map missions
@@ -2317,69 +2915,668 @@ def map_missions(current_year, list_items):
     """
     global closed_mission_scatter, open_mission_scatter
 
-    closed_missions = missions[((missions['To'] <= current_year) & pd.notna(missions['Lat']) & pd.notna(missions['Lon']))]
-    if len(closed_missions) > 0:        
-        plot_locations = np.zeros(len(closed_missions), dtype=[('position', float, 2)])         
-        lon = closed_missions['Lon'].values
-        lat = closed_missions['Lat'].values
-        for i in range(len(closed_missions)):
-            plot_locations['position'][i][0] = lon[i]
-            plot_locations['position'][i][1] = lat[i]
-        closed_mission_scatter.set_offsets(plot_locations['position'])
+    closed_missions = active_interval_rows(closed_missions_index, current_year)
+    if len(closed_missions) > 0:
+        closed_mission_scatter.set_offsets(mission_positions[closed_missions])
         list_items.append(closed_mission_scatter)
 
-    open_missions = missions[((missions['From'] <= current_year) & (missions['To'] > current_year) & pd.notna(missions['Lat']) & pd.notna(missions['Lon']))]
+    open_missions = active_interval_rows(open_missions_index, current_year)
     if len(open_missions) > 0:
-        plot_locations = np.zeros(len(open_missions), dtype=[('position', float, 2)])  
-        lon = open_missions['Lon'].values
-        lat = open_missions['Lat'].values
-        for i in range(len(open_missions)):
-            plot_locations['position'][i][0] = lon[i]
-            plot_locations['position'][i][1] = lat[i]
-        open_mission_scatter.set_offsets(plot_locations['position'])
+        open_mission_scatter.set_offsets(mission_positions[open_missions])
         list_items.append(open_mission_scatter)
 
 
-def list_dimension(testlist, dim=0):
+def start_profile_layer():
+    """
+        Starts timing a layer of the frame, when profile_frames is set
+
+        Returns
+        -------
+        layer_start
+            Tuple: wall and CPU clock readings at the start of the layer, or None when not profiling
+    """
+    if not profile_frames:
+        return None
+    return (time.perf_counter(), time.process_time())
+
+def stop_profile_layer(layer_name, layer_start):
+    """
+        Records the wall and CPU time taken by a layer of the frame being profiled
+
+        Parameters
+        ----------
+        layer_name
+            String: name of the layer, e.g. the function drawing it
+
+        layer_start
+            Tuple: returned by start_profile_layer
+    """
+    if layer_start is None:
+        return
+    start_wall, start_cpu = layer_start
+    profile_records.append({'frame': profiled_frame, 'year': profiled_year, 'layer': layer_name, 'start': start_wall, \
+                            'wall_seconds': time.perf_counter() - start_wall, 'cpu_seconds': time.process_time() - start_cpu})
+
+@contextlib.contextmanager
+def profile_layer(layer_name):
+    """
+        Times the enclosed block as a layer of the frame being profiled
+
+        Parameters
+        ----------
+        layer_name
+            String: name of the layer, e.g. the function drawing it
+    """
+    layer_start = start_profile_layer()
+    try:
+        yield
+    finally:
+        stop_profile_layer(layer_name, layer_start)
+
+def write_frame_profile(profile_name):
+    """
+        Writes the layer timings recorded so far to profile_directory, then starts recording afresh.
+        Writes per layer, per frame timings as CSV and JSON, a summary table of each layer across the frames,
+        also printed, and a speedscope evented profile of the frames (https://www.speedscope.app)
+
+        Parameters
+        ----------
+        profile_name
+            String: name the profile files are written under
+    """
+    global profile_records
+
+    if not profile_records:
+        return
+
+    os.makedirs(profile_directory, exist_ok=True)
+    profile_path = os.path.join(profile_directory, profile_name)
+    profile_start = min(record['start'] for record in profile_records)
+
+    frame_profile = pd.DataFrame(profile_records)
+    frame_profile['start'] -= profile_start
+    frame_profile.to_csv(profile_path + '.csv', index=False)
+    frame_profile.to_json(profile_path + '.json', orient='records', indent=1)
+
+    # layers nest within update_year, so their times add up to more than the frame
+    profile_summary = frame_profile.groupby('layer', sort=False).agg(frames=('frame', 'count'), total_wall_seconds=('wall_seconds', 'sum'), \
+                                                                     mean_wall_ms=('wall_seconds', 'mean'), max_wall_ms=('wall_seconds', 'max'), \
+                                                                     total_cpu_seconds=('cpu_seconds', 'sum'))
+    profile_summary[['mean_wall_ms', 'max_wall_ms']] *= 1000
+    profile_summary = profile_summary.sort_values('total_wall_seconds', ascending=False)
+    profile_summary.to_csv(profile_path + '_summary.csv')
+    print('Frame profile of ' + profile_name + ':')
+    print(profile_summary.to_string(float_format=lambda value: '{:.3f}'.format(value)))
+
+    # speedscope needs the events in time order, with layers closing before those they're nested in
+    layer_names = list(dict.fromkeys(frame_profile['layer']))
+    speedscope_events = []
+    open_layers = []
+    for record in frame_profile.sort_values(['start', 'wall_seconds'], ascending=[True, False], kind='stable').itertuples():
+        while open_layers and open_layers[-1][1] <= record.start:
+            layer_number, layer_end = open_layers.pop()
+            speedscope_events.append({'type': 'C', 'frame': layer_number, 'at': max(layer_end, speedscope_events[-1]['at'])})
+        speedscope_events.append({'type': 'O', 'frame': layer_names.index(record.layer), 'at': max(record.start, speedscope_events[-1]['at'] if speedscope_events else 0)})
+        open_layers.append((layer_names.index(record.layer), record.start + record.wall_seconds))
+    while open_layers:
+        layer_number, layer_end = open_layers.pop()
+        speedscope_events.append({'type': 'C', 'frame': layer_number, 'at': max(layer_end, speedscope_events[-1]['at'])})
+
+    speedscope_profile = {'$schema': 'https://www.speedscope.app/file-format-schema.json', 'name': profile_name, \
+                          'shared': {'frames': [{'name': layer_name} for layer_name in layer_names]}, \
+                          'profiles': [{'type': 'evented', 'name': profile_name, 'unit': 'seconds', 'startValue': 0, \
+                                        'endValue': speedscope_events[-1]['at'], 'events': speedscope_events}]}
+    with open(profile_path + '.speedscope.json', 'w') as speedscope_file:
+        json.dump(speedscope_profile, speedscope_file)
+
+    profile_records = []
+
+
+@contextlib.contextmanager
+def open_frame_pipe(movie_file_name, frame_width, frame_height):
+    """
+        Starts ffmpeg encoding raw RGBA frames into a movie. Frames are fed to ffmpeg from a background thread 
+        through a bounded queue, so encoding a frame overlaps with drawing the next one
+
+        Parameters
+        ----------
+        movie_file_name
+            String: path of the movie to write
+
+        frame_width
+            Integer: width of each frame in pixels
+
+        frame_height
+            Integer: height of each frame in pixels
+
+        Returns
+        -------
+        queue_frame
+            Function: queues the RGBA bytes of the next frame to be encoded
+    """
+    ffmpeg_command = [animation.FFMpegWriter.bin_path(), '-f', 'rawvideo', '-vcodec', 'rawvideo', '-s', str(frame_width) + 'x' + str(frame_height), '-pix_fmt', 'rgba', \
+                      '-framerate', str(1000 / anime_interval), '-loglevel', 'error', '-i', 'pipe:'] + output_ffmpeg_args + ['-y', movie_file_name]
+    frame_queue = queue.Queue(maxsize=frame_queue_size)
+    pipe_errors = []
+
+    def write_frames():
+        while True:
+            frame_bytes = frame_queue.get()
+            if frame_bytes is None:
+                break
+            # once ffmpeg has failed, keep draining the queue so drawing isn't blocked before the error is raised
+            if not pipe_errors:
+                try:
+                    ffmpeg_process.stdin.write(frame_bytes)
+                except OSError as pipe_error:
+                    pipe_errors.append(pipe_error)
+
+    def queue_frame(frame_bytes):
+        if pipe_errors:
+            raise RuntimeError('ffmpeg stopped accepting frames for ' + movie_file_name) from pipe_errors[0]
+        frame_queue.put(frame_bytes)
+
+    with subprocess.Popen(ffmpeg_command, stdin=subprocess.PIPE) as ffmpeg_process:
+        writer_thread = threading.Thread(target=write_frames, daemon=True)
+        writer_thread.start()
+        try:
+            yield queue_frame
+        finally:
+            frame_queue.put(None)
+            writer_thread.join()
+            try:
+                ffmpeg_process.stdin.close()
+            except OSError:
+                pass
+
+    if pipe_errors or ffmpeg_process.returncode != 0:
+        raise RuntimeError('ffmpeg failed writing ' + movie_file_name + ', exit code ' + str(ffmpeg_process.returncode))
+
+def recorded_draw_order():
+    """
+        Goes through a draw of the figure, recording the order its artists would be drawn in without drawing them, 
+        so the layers follow what Figure.draw and GeoAxes.draw actually do rather than a copy of their logic
+
+        Returns
+        -------
+        draw_order
+            List: artists of the figure, outside of the map's axes, and artists of the map's axes, in the order they are drawn
+    """
+    draw_order = []
+    top_level_artists = [artist for artist in fig.get_children() if artist is not ax] + ax.get_children()
+
+    def recording_draw(artist):
+        def draw(renderer, *args, **kwargs):
+            draw_order.append(artist)
+        return draw
+
+    for artist in top_level_artists:
+        artist.draw = recording_draw(artist)
+    try:
+        fig.canvas.draw()
+    finally:
+        for artist in top_level_artists:
+            del artist.draw
+
+    return draw_order
+
+def build_layer_compositor(rasters=None, check_composite=True):
+    """
+        Splits the order the figure draws its artists in into layers, each a run of artists that are either redrawn every frame, 
+        or cached as a raster. Cached layers hold the base map, the legend, and the state boundaries, which only change with their epoch.
+        Layers keep the figure's drawing order, so static layers above a changing one, like the coastlines above the towns, 
+        are composited over it rather than baked into the background.
+        The current frame can be composited, and compared with a full draw of it, to check the cached rasters reproduce the figure
+
+        Parameters
+        ----------
+        (Optional) rasters
+            Dictionary: cached rasters of a previous compositor, reused for the layers that are unchanged
+
+        (Optional) check_composite
+            Boolean: composite the current frame and compare it with a full draw
+                defaults to True
+
+        Returns
+        -------
+        layer_compositor
+            Dictionary:
+                'layers' - list of dictionaries, in drawing order:
+                    'artists' - artists in the layer
+                    'cached' - whether the layer is drawn from a cached raster
+                    'by_epoch' - whether the cached raster depends on the state boundary epoch
+                'rasters' - cached rasters, keyed by the artists in the layer and state boundary epoch
+                'number_artists' - number of artists on the axes when the layers were built, as artist pools grow over the animation
+                'difference' - largest difference of any pixel channel, out of 255, between the composited frame and a full draw of it, 
+                    None if not checked
+    """
+    cached_artists = set(base_map_artists + reference_state_boundary_features['artists'] + reference_state_names['artists'])
+    if ax.get_legend() is not None:
+        cached_artists.add(ax.get_legend())
+    epoch_artists = set(reference_state_boundary_features['artists'] + reference_state_names['artists'])
+
+    draw_order = recorded_draw_order()
+
+    layers = []
+    for artist in draw_order:
+        cached = artist in cached_artists
+        if not layers or layers[-1]['cached'] != cached:
+            layers.append({'artists': [], 'cached': cached, 'by_epoch': False})
+        layers[-1]['artists'].append(artist)
+        layers[-1]['by_epoch'] = layers[-1]['by_epoch'] or artist in epoch_artists
+
+    layer_compositor = {'layers': layers, 'rasters': rasters if rasters is not None else {}, 'number_artists': len(ax.get_children()), 'difference': None}
+    if not check_composite:
+        return layer_compositor
+
+    fig.canvas.draw()
+    frame_pixels = np.asarray(fig.canvas.buffer_rgba()).copy()
+    composite_frame(layer_compositor)
+    composited_pixels = np.asarray(fig.canvas.buffer_rgba())
+    layer_compositor['difference'] = int(np.abs(composited_pixels.astype(np.int16) - frame_pixels).max())
+
+    return layer_compositor
+
+def rasterize_layer(layer_artists):
+    """
+        Draws a layer of artists onto a transparent raster the size of the canvas, cropped to what was drawn.
+        The layer is drawn by a full draw of the figure with every other artist hidden, so it goes through Figure.draw and GeoAxes.draw
+
+        Parameters
+        ----------
+        layer_artists
+            List: artists in the layer
+
+        Returns
+        -------
+        layer_raster
+            Tuple: x, y offset of the bottom left corner in pixels, and the RGBA pixels drawn, or None if nothing was drawn
+    """
+    top_level_artists = [artist for artist in fig.get_children() if artist is not ax] + ax.get_children()
+    hidden_artists = [artist for artist in top_level_artists if artist not in layer_artists and artist.get_visible()]
+
+    for artist in hidden_artists:
+        artist.set_visible(False)
+    try:
+        fig.canvas.draw()
+    finally:
+        for artist in hidden_artists:
+            artist.set_visible(True)
+
+    layer_pixels = np.asarray(fig.canvas.buffer_rgba())
+    drawn_rows = np.flatnonzero(layer_pixels[:, :, 3].any(axis=1))
+    drawn_columns = np.flatnonzero(layer_pixels[:, :, 3].any(axis=0))
+    if drawn_rows.size == 0:
+        return None
+
+    # draw_image places rows from the bottom of the canvas up
+    return (drawn_columns[0], layer_pixels.shape[0] - drawn_rows[-1] - 1, \
+            layer_pixels[drawn_rows[0]:drawn_rows[-1] + 1, drawn_columns[0]:drawn_columns[-1] + 1][::-1].copy())
+
+def composite_frame(layer_compositor):
+    """
+        Draws the current frame onto the canvas, compositing cached rasters of the unchanged layers 
+        in between drawing the layers that change. Cached rasters are built the first time they are needed
+
+        Parameters
+        ----------
+        layer_compositor
+            Dictionary: built by build_layer_compositor
+    """
+    # rasters are drawn on the canvas, so build any that are missing before drawing the frame
+    raster_keys = []
+    for layer in layer_compositor['layers']:
+        raster_key = (tuple(layer['artists']), mapped_state_boundary_epoch if layer['by_epoch'] else None) if layer['cached'] else None
+        if raster_key is not None and raster_key not in layer_compositor['rasters']:
+            layer_compositor['rasters'][raster_key] = rasterize_layer(layer['artists'])
+        raster_keys.append(raster_key)
+
+    renderer = fig.canvas.get_renderer()
+    renderer.clear()
+
+    for layer, raster_key in zip(layer_compositor['layers'], raster_keys):
+        if not layer['cached']:
+            for artist in layer['artists']:
+                artist.draw(renderer)
+            continue
+
+        layer_raster = layer_compositor['rasters'][raster_key]
+        if layer_raster is not None:
+            graphics_context = renderer.new_gc()
+            renderer.draw_image(graphics_context, *layer_raster)
+            graphics_context.restore()
+
+def artist_state(artist):
+    """
+        Describes everything about an artist that affects how it's drawn, so frames can be compared before they are drawn. 
+        Covers every property pool_artist and update_year can set, and those they leave at their defaults, 
+        so a frame only matches the frame before when it would draw the same
+
+        Parameters
+        ----------
+        artist
+            MatplotLib artist: redrawn every frame
+
+        Returns
+        -------
+        state
+            List: properties of the artist that affect how it is drawn
+
+        Raises
+        ------
+        TypeError
+            the artist isn't a type this knows how to describe
+    """
+    state = [type(artist).__name__, artist.get_visible()]
+    # an artist that isn't drawn looks the same whatever its other properties are
+    if not artist.get_visible():
+        return state
+
+    state.extend([artist.get_alpha(), artist.get_zorder()])
+
+    if isinstance(artist, Text):
+        font_properties = artist.get_fontproperties()
+        state.extend([artist.get_text(), artist.get_position(), to_rgba(artist.get_color()), font_properties.get_size(), font_properties.get_family(), \
+                      font_properties.get_style(), font_properties.get_weight(), font_properties.get_stretch(), font_properties.get_variant(), \
+                      artist.get_rotation(), artist.get_rotation_mode(), artist.get_horizontalalignment(), artist.get_verticalalignment(), \
+                      artist.get_linespacing(), artist.get_wrap()])
+        if artist.get_bbox_patch() is not None:
+            state.append(artist_state(artist.get_bbox_patch()))
+    elif isinstance(artist, LineCollection):
+        state.extend([segment.tobytes() for segment in artist.get_segments()])
+        state.extend([artist.get_colors().tobytes(), artist.get_linewidths().tobytes(), repr(artist.get_linestyles())])
+    elif isinstance(artist, Collection):
+        state.extend([artist.get_offsets().tobytes(), artist.get_sizes().tobytes(), artist.get_facecolors().tobytes(), artist.get_edgecolors().tobytes(), \
+                      artist.get_linewidths().tobytes(), repr(artist.get_linestyles()), artist.get_hatch()])
+        state.extend([path.vertices.tobytes() for path in artist.get_paths()])
+    elif isinstance(artist, Line2D):
+        state.extend([artist.get_xydata().tobytes(), to_rgba(artist.get_color()), artist.get_linestyle(), artist.get_linewidth(), artist.get_drawstyle(), \
+                      artist.get_marker(), artist.get_markersize(), to_rgba(artist.get_markerfacecolor()), to_rgba(artist.get_markeredgecolor())])
+    elif isinstance(artist, patches.Patch):
+        # the patch transform places the patch's path, e.g. a Rectangle's x, y, width and height
+        state.extend([artist.get_path().vertices.tobytes(), artist.get_patch_transform().get_matrix().tobytes(), artist.get_facecolor(), \
+                      artist.get_edgecolor(), artist.get_fill(), artist.get_linewidth(), artist.get_linestyle(), artist.get_hatch()])
+    else:
+        # rather than risk a wrong match, an artist that can't be described has to be added here
+        raise TypeError('Can\'t compare frames drawing a ' + type(artist).__name__ + ', add it to artist_state or turn off skip_duplicate_draws')
+
+    return state
+
+def frame_state_hash(layer_compositor):
+    """
+        Hashes the state of every artist redrawn each frame, and the state boundary epoch, 
+        so identical consecutive frames can be detected without drawing them
+
+        Parameters
+        ----------
+        layer_compositor
+            Dictionary: built by build_layer_compositor
+
+        Returns
+        -------
+        state_hash
+            String: hex digest of the frame state
+    """
+    frame_hash = hashlib.sha1(repr(mapped_state_boundary_epoch).encode())
+    for layer in layer_compositor['layers']:
+        if not layer['cached']:
+            for artist in layer['artists']:
+                frame_hash.update(repr(artist_state(artist)).encode())
+
+    return frame_hash.hexdigest()
+
+figure_layout_fixed = False
+
+def fix_figure_layout():
+    """
+        Lays out the figure once, before any frame is constructed, then fixes it. Constrained layout otherwise adjusts from 
+        whichever frame was drawn before, so frames would depend on the order they are drawn in.
+        Called by each way of rendering, rather than on import, as laying out the figure draws the whole map
+    """
+    global figure_layout_fixed
+
+    if figure_layout_fixed:
+        return
+
+    fig.canvas.draw()
+    fig.set_layout_engine('none')
+    figure_layout_fixed = True
+
+def render_frames(movie_file_name, first_frame, end_frame):
     """
-        determine number of dimensions that a list holds, calls itself recursively
+        Draws a contiguous run of animation frames and streams them to ffmpeg as raw RGBA bytes.
+        Renders the whole movie, or a segment of it in a parallel_render worker process, 
+        which loaded the data and built its figure as it imported this script
 
         Parameters
         ----------
-        testlist
-            list: list to be tested
+        movie_file_name
+            String: path of the movie, or movie segment, to write
+
+        first_frame
+            Integer: first animation frame to draw
 
-        (Optional) dim
-            list: current call depth in recursion
+        end_frame
+            Integer: animation frame after the last frame to draw
 
         Returns
         -------
-        dim
-            returns the dimension in current recursive call
-    """
-   # tests if testlist is a list and how many dimensions it has
-   # returns -1 if it is no list at all, 0 if list is empty 
-   # and otherwise the dimensions of it - from Stackoverflow by https://stackoverflow.com/users/4112844/bunkus
-    if isinstance(testlist, list):
-        if testlist == []:
-            return dim
-        dim = dim + 1
-        dim = list_dimension(testlist[0], dim) #recursion to the end of the dimensions
-        return dim
+        movie_file_name
+            String: path of the movie written
+
+        skipped_draws
+            Integer: number of frames that repeated the frame before, so weren't drawn. They are still piped to ffmpeg and encoded
+    """
+    fix_figure_layout()
+
+    # h264 needs even frame dimensions, so trim the figure to them as anim.save did
+    figure_width_inches, figure_height_inches = animation.adjusted_figsize(fig.get_figwidth(), fig.get_figheight(), fig.dpi, 2)
+    fig.set_size_inches(figure_width_inches, figure_height_inches, forward=False)
+    frame_width, frame_height = fig.canvas.get_width_height(physical=True)
+
+    composite_layers = cache_static_layers
+    layer_compositor = None
+    previous_frame_hash = None
+    skipped_draws = 0
+
+    if profile_with_cprofile:
+        render_profiler = cProfile.Profile()
+        render_profiler.enable()
+
+    with open_frame_pipe(movie_file_name, frame_width, frame_height) as queue_frame:
+        for frame in range(first_frame, end_frame):
+            with profile_layer('update_year'):
+                update_year(frame)
+            # artists added by a pool growing need to be slotted into the layers, so the layers are rebuilt, 
+            # and checked against a full draw again, whenever the number of artists on the axes changes
+            if layer_compositor is None or len(ax.get_children()) != layer_compositor['number_artists']:
+                with profile_layer('build_layer_compositor'):
+                    layer_compositor = build_layer_compositor(layer_compositor['rasters'] if layer_compositor is not None else None, check_composite=composite_layers)
+                if composite_layers and layer_compositor['difference'] > compositor_tolerance:
+                    print('Composited frame ' + str(frame) + ' differs from a full draw by up to ' + str(layer_compositor['difference']) + '/255, drawing every frame in full')
+                    composite_layers = False
+
+            if skip_duplicate_draws:
+                with profile_layer('frame_state_hash'):
+                    frame_hash = frame_state_hash(layer_compositor)
+                if frame_hash == previous_frame_hash:
+                    # only the draw is skipped, the repeated frame is piped and encoded like any other
+                    with profile_layer('encode'):
+                        queue_frame(frame_bytes)
+                    skipped_draws += 1
+                    continue
+                previous_frame_hash = frame_hash
+
+            with profile_layer('draw'):
+                if composite_layers:
+                    composite_frame(layer_compositor)
+                else:
+                    fig.canvas.draw()
+                # the canvas buffer is reused by the next draw, so queue a copy of it
+                frame_bytes = bytes(fig.canvas.buffer_rgba())
+            # ffmpeg encodes in its own process, so this is how long drawing waits on the encoder to keep up
+            with profile_layer('encode'):
+                queue_frame(frame_bytes)
+
+    profile_name = os.path.splitext(os.path.basename(movie_file_name))[0] + ' profile'
+    if profile_with_cprofile:
+        render_profiler.disable()
+        os.makedirs(profile_directory, exist_ok=True)
+        render_profiler.dump_stats(os.path.join(profile_directory, profile_name + '.prof'))
+
+    print('Rendered ' + movie_file_name + ': ' + str(end_frame - first_frame) + ' frames, ' + str(skipped_draws) + ' draws skipped for repeats of the frame before')
+    report_artist_pools()
+    write_frame_profile(profile_name)
+
+    return movie_file_name, skipped_draws
+
+def render_segments(output_file_name, number_frames):
+    """
+        Renders the movie in segments, then joins the segments in frame order with ffmpeg's concat demuxer, without re-encoding them. 
+        Frames don't depend on those drawn before them, so each segment can be rendered independently of the others.
+        With parallel_render the segments are spread across a pool of worker processes. 
+        With a render_work_directory, each completed segment is recorded in a manifest there, 
+        so rerunning an interrupted render only renders the segments that weren't completed
+
+        Parameters
+        ----------
+        output_file_name
+            String: path of the movie to write
+
+        number_frames
+            Integer: number of animation frames in the movie
+    """
+    start_time = time.perf_counter()
+    fix_figure_layout()
+    if render_work_directory is None:
+        segment_directory = tempfile.mkdtemp(prefix='render_segments_', dir=os.path.dirname(os.path.abspath(output_file_name)))
     else:
-        if dim == 0:
-            return -1
+        segment_directory = render_work_directory
+        os.makedirs(segment_directory, exist_ok=True)
+    manifest_path = os.path.join(segment_directory, 'render_manifest.json')
+
+    # segments rendered with different settings, from different data, or by a different version of this script, can't be reused
+    display_settings = {setting: value for setting, value in globals().items() if setting.startswith('display_') and isinstance(value, (bool, str))}
+    source_sha1s = {source_file: source_file_signature(data_file_path(source_file), signature)['sha1'] for source_file, signature in sorted(data_source_signatures.items())}
+    render_settings = {'output_file_name': output_file_name, 'number_frames': number_frames, 'frames_per_render_segment': frames_per_render_segment, \
+                       'output_ffmpeg_args': output_ffmpeg_args, 'frame_size': fig.canvas.get_width_height(physical=True), \
+                       'script_sha1': source_file_signature(os.path.abspath(__file__))['sha1'], \
+                       'data_directory': os.path.abspath(data_directory), 'display_settings': display_settings, 'source_sha1s': source_sha1s}
+    render_settings = json.loads(json.dumps(render_settings))
+
+    manifest = {}
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            manifest = {}
+    if manifest.get('settings') != render_settings:
+        if manifest:
+            print('Render settings have changed, discarding the segments already rendered in ' + segment_directory)
+        manifest = {'settings': render_settings, 'segments': {}}
+
+    def record_segment(segment_file_name, skipped_draws):
+        manifest['segments'][os.path.basename(segment_file_name)] = skipped_draws
+        def write_manifest(temporary_path):
+            with open(temporary_path, 'w') as manifest_file:
+                json.dump(manifest, manifest_file, indent=2)
+        write_replacing(manifest_path, write_manifest)
+
+    segments = []
+    for segment_number, first_frame in enumerate(range(0, number_frames, frames_per_render_segment)):
+        segment_file_name = os.path.join(segment_directory, 'segment_' + str(segment_number).zfill(5) + '.mp4')
+        segments.append((segment_file_name, first_frame, min(first_frame + frames_per_render_segment, number_frames)))
+    segment_list_path = os.path.join(segment_directory, 'segments.txt')
+
+    def remove_render_files():
+        # only remove what the render wrote, in case the work directory holds anything else
+        for render_file in [segment[0] for segment in segments] + [segment_list_path, manifest_path]:
+            if os.path.exists(render_file):
+                os.remove(render_file)
+        if not os.listdir(segment_directory):
+            os.rmdir(segment_directory)
+
+    try:
+        remaining_segments = [segment for segment in segments \
+                              if os.path.basename(segment[0]) not in manifest['segments'] or not os.path.exists(segment[0])]
+        if len(remaining_segments) < len(segments):
+            print('Resuming render, ' + str(len(segments) - len(remaining_segments)) + ' of ' + str(len(segments)) + ' segments already rendered in ' + segment_directory)
+
+        if parallel_render and len(remaining_segments) > 1:
+            # spawn rather than fork, so each worker builds its own figure rather than sharing the parent's canvas
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(render_workers, len(remaining_segments)), mp_context=multiprocessing.get_context('spawn')) as executor:
+                segment_futures = [executor.submit(render_frames, *segment) for segment in remaining_segments]
+                for rendered_segments, segment_future in enumerate(concurrent.futures.as_completed(segment_futures), start=1):
+                    record_segment(*segment_future.result())
+                    print('Rendered ' + str(rendered_segments) + ' of ' + str(len(remaining_segments)) + ' segments in ' + '{:.1f}'.format(time.perf_counter() - start_time) + 's')
         else:
-            return dim
+            for segment in remaining_segments:
+                record_segment(*render_frames(*segment))
+
+        with open(segment_list_path, 'w') as segment_list:
+            for segment_file_name, first_frame, end_frame in segments:
+                segment_list.write("file '" + os.path.basename(segment_file_name) + "'\n")
+
+        subprocess.run([animation.FFMpegWriter.bin_path(), '-loglevel', 'error', '-f', 'concat', '-safe', '0', '-i', segment_list_path, '-c', 'copy', '-y', output_file_name], check=True)
+    except BaseException:
+        # a render in a temporary directory can't be resumed, so don't leave it behind
+        if render_work_directory is None:
+            remove_render_files()
+        raise
+
+    skipped_draws = sum(manifest['segments'].values())
+    remove_render_files()
 
+    print('Rendered ' + output_file_name + ' in ' + '{:.1f}'.format(time.perf_counter() - start_time) + 's: ' + str(number_frames) + ' frames, ' + str(skipped_draws) + ' draws skipped for repeats of the frame before')
 
 #fetch data
+if compile_data_cache_only:
+    compile_data_cache()
+    sys.exit(0)
+
 population, state_boundaries, first_nations_milestones, australian_conflicts = init_file_load(display_state_boundaries, display_first_nations_milestones, display_australian_conflict)
 
+if display_state_boundaries:
+    state_boundary_geometry = read_state_boundary_geometry(state_boundaries)
+
+#index the year ranges queried every frame
+if display_australian_conflict:
+    australian_conflicts_index = build_interval_index(australian_conflicts['From'], australian_conflicts['To'], final_anime_year)
+    australian_conflicts_white_history = (australian_conflicts['Blak Hx'] != True).values
+
 if display_colonisation:
     explorers, cities, undated_cities, railways, railway_operating_dates, massacres, missions, deaths_in_custody, incarceration_rates, defining_moments \
         = init_colonial_file_load(display_explorers, display_towns, display_undated_towns, display_railway_lines, display_massacre_sites, display_missions, display_deaths_in_custody, display_incarceration_rates, display_defining_moments)
 
+    if display_explorers:
+        explorer_paths = read_explorer_paths(explorers)
+
+    if display_massacre_sites:
+        massacre_accumulator = init_massacre_accumulator()
+
+    if display_defining_moments:
+        defining_moments_index = build_interval_index(defining_moments['From'], defining_moments['To'], final_anime_year)
+        defining_moments_from = defining_moments['From'].values
+        defining_moments_to = defining_moments['To'].values
+        defining_moments_wrapped_lines = defining_moments['Wrapped Lines'].values
+        defining_moments_white_history = (defining_moments['Blak Hx'] != True).values
+
+    if display_missions:
+        # missions without a location can't be mapped, and are only shown as open once their closure date is known
+        mappable_missions = missions['To'].notna() & missions['Lat'].notna() & missions['Lon'].notna()
+        open_missions_index = build_interval_index(missions['From'].where(mappable_missions), missions['To'], final_anime_year, inclusive_to=False)
+        closed_missions_index = build_interval_index(missions['To'].where(mappable_missions), np.full(len(missions), np.nan), final_anime_year)
+        mission_positions = np.column_stack((missions['Lon'].values, missions['Lat'].values)).astype(float)
+
+    if display_railway_lines:
+        # construction ends when the line opens, or closes if that happens first
+        railway_commenced_index = build_interval_index(railway_operating_dates['Commenced'].where(railway_operating_dates['Opened'].notna()), \
+            np.fmin(railway_operating_dates['Opened'].values, railway_operating_dates['Closed'].values), final_anime_year, inclusive_to=False)
+        railway_opened_index = build_interval_index(railway_operating_dates['Opened'], railway_operating_dates['Closed'], final_anime_year, inclusive_to=False)
+        railway_closed_index = build_interval_index(railway_operating_dates['Closed'], np.full(len(railway_operating_dates), np.nan), final_anime_year)
+        railway_line_index = build_railway_line_index(railway_operating_dates['Name'])
+
     #set up legend with dummy scatter points and plot lines
     #lat, lon, size, lw=, edgecolors=, facecolors=, zorder
     town_scat = ax.scatter([], [], s=20, c="#e1910a", zorder=town_zorder)
@@ -2411,14 +3608,22 @@ if display_colonisation:
         plt.legend(legend_list, legend_label_list, loc='lower left')   
 
 elif display_legal_controls:
-    state_protection_boards, british_legislation, commonwealth_legislation, act_legislation, qld_legislation, wa_legislation, sa_legislation, nsw_legislation, nt_legislation, tas_legislation, vic_legislation = init_legal_file_load()
+    state_protection_boards, legislation = init_legal_file_load()
+
+    legislation_index = build_interval_index(legislation['From'], legislation['To'], final_anime_year, inclusive_to=False)
+
+#precompute the values displayed in each frame, for each telling of history being animated
+if display_white_blak_hx_back_to_back:
+    frame_plans = {False: build_frame_plan(False), True: build_frame_plan(True)}
+else:
+    frame_plans = {display_blak_history: build_frame_plan(display_blak_history)}
 
 if display_white_blak_hx_back_to_back:
     white_to_blak = 2
 else: 
     white_to_blak = 1
 
-anim = animation.FuncAnimation(plt.gcf(), update_year, frames=(timelapse_period + (number_repeat_frames_at_start_and_end * 2)) * white_to_blak, interval=anime_interval, blit=True, repeat=loop_display, init_func=init)
+number_frames = (timelapse_period + (number_repeat_frames_at_start_and_end * 2)) * white_to_blak
 
 if display_white_blak_hx_back_to_back:
     output_file_name = 'Australia in 4 minutes - a White and Blak history.mp4'
@@ -2427,8 +3632,15 @@ elif display_blak_history:
 else:
     output_file_name = 'Australia in 2 minutes - a White history.mp4'
 
-if output_file:
-    #ffmpeg
-    anim.save(output_file_name, extra_args=['-vcodec', 'h264', '-framerate', '2', '-vf', 'fps=24', '-pix_fmt', 'yuv420p'])
-if output_console:
-    plt.show()
+#parallel_render workers import this script to build their own figure, so only the parent renders the movie
+if __name__ == '__main__':
+    if output_file:
+        #ffmpeg
+        if parallel_render or render_work_directory is not None:
+            render_segments(output_file_name, number_frames)
+        else:
+            render_frames(output_file_name, 0, number_frames)
+    if output_console:
+        fix_figure_layout()
+        anim = animation.FuncAnimation(plt.gcf(), update_year, frames=number_frames, interval=anime_interval, blit=True, repeat=loop_display, init_func=init)
+        plt.show()
@@ -0,0 +1,468 @@
+"""
+    Writes a copy of the data directory with synthetic towns, massacres, railway lines and missions added,
+    scaling those datasets 10 to 100 times, to see how each layer of display_colonial_map.py scales before the real datasets get there.
+    Each synthetic record is a copy of a real one, renamed, moved a little, and shifted up to 5 years, or up to 365 days for massacres, 
+    so it keeps the real data's schema and spread over time. Every other file is copied as is.
+
+    python generate_synthetic_data.py --scale 10 --output ./data_10x
+    COLONIAL_MAP_DATA_DIRECTORY=./data_10x python benchmark_colonial_map.py
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import math
+import os
+import random
+import re
+import shutil
+
+from geojson_stream import iterate_geojson_features, open_geojson_stream
+
+source_data_directory = './data'
+railway_lines_file = 'Railway_Lines_vw_-3300151204749464250.geojson' # as display_colonial_map.railway_lines_file
+railway_lines_archive = 'Railway_Lines_vw_-3300151204749464250.7z'
+massacres_file = 'ColonialMassacresInAustralia_Data.json'
+missions_file = 'Aboriginal and Torres Strait Islander Missions and Reserves.csv'
+railway_operating_dates_file = 'operating_dates_of_australian_railway_lines.csv'
+
+location_jitter = 0.5 # degrees a synthetic record is moved from the real one it copies
+year_jitter = 5 # years a synthetic town, railway line or mission is shifted from the real one it copies
+massacre_day_jitter = 365 # days a synthetic massacre is shifted from the real one it copies, as massacres are dated to the day
+
+reg_dec = re.compile(r'^[-+]?[0-9]{1,3}[.]{1}[0-9]+')
+
+def synthetic_name(name, copy_number):
+    """
+        Names a synthetic copy of a record
+
+        Parameters
+        ----------
+        name
+            String: name of the real record
+
+        copy_number
+            Integer: which copy of the real record this is, from 1
+
+        Returns
+        -------
+        name
+            String: name of the synthetic record
+    """
+    return name + ' (synthetic ' + str(copy_number) + ')'
+
+def jitter_year(year_text, year_offset):
+    """
+        Shifts a year held as text, keeping its format, e.g. '1788' or '1788.0'
+
+        Parameters
+        ----------
+        year_text
+            String: year to shift, blank or non-numeric values, like 'current', are left as they are
+
+        year_offset
+            Integer: years to shift by
+
+        Returns
+        -------
+        year_text
+            String: shifted year
+    """
+    try:
+        year = float(year_text)
+    except ValueError:
+        return year_text
+    if not math.isfinite(year) or year <= 0:
+        # undated
+        return year_text
+
+    if '.' in year_text:
+        return str(year + year_offset)
+    return str(int(year) + year_offset)
+
+def coordinate_value(coordinate_text):
+    """
+        Converts a decimal, or degree/minute/second, geocoordinate to a decimal value
+
+        Parameters
+        ----------
+        coordinate_text
+            String: geocoordinate, e.g. '-30.7665', '34.8554°S' or '32°33′39″S'
+
+        Returns
+        -------
+        coordinate
+            Float: decimal geocoordinate, or None if there isn't one
+    """
+    coordinate_text = re.sub(r'\s', '', coordinate_text)
+    sign = -1 if re.search('[swSW]', coordinate_text) else 1
+    if reg_dec.search(coordinate_text):
+        return sign * float(reg_dec.search(coordinate_text)[0])
+
+    numbers = [float(number) for number in re.findall(r'[0-9]+', coordinate_text)[:3]]
+    if len(numbers) == 0:
+        return None
+    numbers += [0] * (3 - len(numbers))
+    return sign * (numbers[0] + numbers[1] / 60 + numbers[2] / 3600)
+
+def read_csv_rows(file_path):
+    """
+        Reads a CSV file as rows of text, so the synthetic copy keeps the formatting of every column
+
+        Parameters
+        ----------
+        file_path
+            String: path of the CSV file
+
+        Returns
+        -------
+        rows
+            List: each row as a list of strings
+
+        encoding
+            String: 'utf-8-sig' if the file starts with a byte order mark, otherwise 'utf-8'
+    """
+    with open(file_path, 'rb') as csv_file:
+        encoding = 'utf-8-sig' if csv_file.read(3) == b'\xef\xbb\xbf' else 'utf-8'
+    with open(file_path, encoding=encoding, newline='') as csv_file:
+        return list(csv.reader(csv_file)), encoding
+
+def write_csv_rows(file_path, rows, encoding):
+    """
+        Writes rows of text as a CSV file
+
+        Parameters
+        ----------
+        file_path
+            String: path of the CSV file
+
+        rows
+            List: each row as a list of strings
+
+        encoding
+            String: as returned by read_csv_rows
+    """
+    with open(file_path, 'w', encoding=encoding, newline='') as csv_file:
+        csv.writer(csv_file).writerows(rows)
+
+def scale_cities(source_path, output_path, scale, dated):
+    """
+        Scales the 'city_list.csv' or 'undated_city_list.csv' file
+
+        Parameters
+        ----------
+        source_path
+            String: path of the real file
+
+        output_path
+            String: path to write the scaled file to
+
+        scale
+            Integer: number of records written for each real record
+
+        dated
+            Boolean: whether the towns have an established date to shift
+
+        Returns
+        -------
+        number_towns
+            Integer: number of towns written
+    """
+    #Town Name [0], Title [1], HREF Text [2], State [3], wikipedia href [4], dms_latitude [5], dms_longitude [6], dec_latitude [7], dec_longitude [8], established date (city page) [9], established date (parent page) [10], population [11]
+    rows, encoding = read_csv_rows(source_path)
+
+    synthetic_rows = list(rows)
+    for copy_number in range(1, scale):
+        for row in rows:
+            synthetic_row = list(row)
+            for column in [0, 1, 2]:
+                synthetic_row[column] = synthetic_name(row[column], copy_number)
+            synthetic_row[7] = str(float(row[7]) + random.uniform(-location_jitter, location_jitter))
+            synthetic_row[8] = str(float(row[8]) + random.uniform(-location_jitter, location_jitter))
+            if dated:
+                year_offset = random.randint(-year_jitter, year_jitter)
+                synthetic_row[9] = jitter_year(row[9], year_offset)
+                synthetic_row[10] = jitter_year(row[10], year_offset)
+            if row[11].isdigit():
+                synthetic_row[11] = str(int(int(row[11]) * random.uniform(0.5, 1.5)))
+            synthetic_rows.append(synthetic_row)
+
+    write_csv_rows(output_path, synthetic_rows, encoding)
+    return len(synthetic_rows)
+
+def scale_missions(source_path, output_path, scale):
+    """
+        Scales the 'Aboriginal and Torres Strait Islander Missions and Reserves.csv' file.
+        Synthetic missions are located with decimal geocoordinates, whatever format the real mission uses
+
+        Parameters
+        ----------
+        source_path
+            String: path of the real file
+
+        output_path
+            String: path to write the scaled file to
+
+        scale
+            Integer: number of records written for each real record
+
+        Returns
+        -------
+        number_missions
+            Integer: number of missions written
+    """
+    # Mission, State, From, To, Run By, Lat, Lon, Wikipedia
+    rows, encoding = read_csv_rows(source_path)
+    header, rows = rows[0], rows[1:]
+    mission_column, from_column, to_column, lat_column, lon_column = [header.index(column) for column in ['Mission', 'From', 'To', 'Lat', 'Lon']]
+
+    synthetic_rows = [header] + rows
+    for copy_number in range(1, scale):
+        for row in rows:
+            latitude = coordinate_value(row[lat_column])
+            longitude = coordinate_value(row[lon_column])
+            if latitude is None or longitude is None:
+                continue
+
+            synthetic_row = list(row)
+            synthetic_row[mission_column] = synthetic_name(row[mission_column], copy_number)
+            synthetic_row[lat_column] = '{:.4f}'.format(latitude + random.uniform(-location_jitter, location_jitter))
+            synthetic_row[lon_column] = '{:.4f}'.format(longitude + random.uniform(-location_jitter, location_jitter))
+            year_offset = random.randint(-year_jitter, year_jitter)
+            synthetic_row[from_column] = jitter_year(row[from_column], year_offset)
+            synthetic_row[to_column] = jitter_year(row[to_column], year_offset)
+            synthetic_rows.append(synthetic_row)
+
+    write_csv_rows(output_path, synthetic_rows, encoding)
+    return len(synthetic_rows) - 1
+
+def scale_massacres(source_path, output_path, scale):
+    """
+        Scales the 'ColonialMassacresInAustralia_Data.json' file.
+        Synthetic massacres are shifted by up to 365 days, massacre_day_jitter, so they keep the spread of the real massacres over the timelapse
+
+        Parameters
+        ----------
+        source_path
+            String: path of the real file
+
+        output_path
+            String: path to write the scaled file to
+
+        scale
+            Integer: number of records written for each real record
+
+        Returns
+        -------
+        number_massacres
+            Integer: number of massacres written
+    """
+    with open(source_path) as massacre_file:
+        massacre_data = json.load(massacre_file)
+    features = massacre_data['features']
+
+    synthetic_features = list(features)
+    for copy_number in range(1, scale):
+        for feature in features:
+            synthetic_feature = json.loads(json.dumps(feature))
+            properties = synthetic_feature['properties']
+            properties['name'] = synthetic_name(properties['name'], copy_number)
+            properties['id'] = properties['id'] + '-' + str(copy_number)
+
+            longitude_offset = random.uniform(-location_jitter, location_jitter)
+            latitude_offset = random.uniform(-location_jitter, location_jitter)
+            synthetic_feature['geometry']['coordinates'] = [feature['geometry']['coordinates'][0] + longitude_offset, feature['geometry']['coordinates'][1] + latitude_offset]
+            properties['longitude'] = '{:.3f}'.format(float(properties['longitude']) + longitude_offset)
+            properties['latitude'] = '{:.3f}'.format(float(properties['latitude']) + latitude_offset)
+
+            day_offset = random.randint(-massacre_day_jitter, massacre_day_jitter)
+            for date_field, unix_date_field in [('datestart', 'udatestart'), ('dateend', 'udateend')]:
+                if properties.get(date_field):
+                    properties[date_field] = (datetime.date.fromisoformat(properties[date_field]) + datetime.timedelta(days=day_offset)).isoformat()
+                if isinstance(properties.get(unix_date_field), int):
+                    properties[unix_date_field] += day_offset * 24 * 60 * 60 * 1000
+            synthetic_features.append(synthetic_feature)
+
+    massacre_data['features'] = synthetic_features
+    with open(output_path, 'w') as massacre_file:
+        json.dump(massacre_data, massacre_file)
+    return len(synthetic_features)
+
+def railway_lines_source_path(source_directory):
+    """
+        Finds the railway lines GeoJSON in the real data directory, preferring an extracted copy over the shipped '.7z' archive
+
+        Parameters
+        ----------
+        source_directory
+            String: real data directory
+
+        Returns
+        -------
+        source_path
+            String: path of the GeoJSON file or the archive
+    """
+    for source_file in [railway_lines_file, railway_lines_archive]:
+        if os.path.exists(os.path.join(source_directory, source_file)):
+            return os.path.join(source_directory, source_file)
+
+    raise FileNotFoundError('Railway lines not found in ' + source_directory + ': ' + railway_lines_file + ' or ' + railway_lines_archive)
+
+def shift_coordinates(coordinates, longitude_offset, latitude_offset):
+    """
+        Moves GeoJSON coordinates, of any nesting, keeping the shape they describe
+
+        Parameters
+        ----------
+        coordinates
+            List: GeoJSON coordinates, a position or nested lists of positions
+
+        longitude_offset
+            Float: degrees to move east
+
+        latitude_offset
+            Float: degrees to move north
+
+        Returns
+        -------
+        coordinates
+            List: moved coordinates
+    """
+    if len(coordinates) > 0 and not isinstance(coordinates[0], list):
+        return [coordinates[0] + longitude_offset, coordinates[1] + latitude_offset] + coordinates[2:]
+    return [shift_coordinates(position, longitude_offset, latitude_offset) for position in coordinates]
+
+def scale_railway_lines(source_directory, output_directory, scale):
+    """
+        Scales the railway lines GeoJSON, and the 'operating_dates_of_australian_railway_lines.csv' file naming the lines mapped.
+        A synthetic railway line keeps the shape of the real one, moved as a whole, and the features of the line are moved together.
+        The real features are streamed, each written out followed by its synthetic copies, so neither the real nor the scaled GeoJSON is held in memory.
+        The GeoJSON is written extracted, which display_colonial_map.py uses in preference to the archive, 
+        as a FeatureCollection of just the features, as those are all display_colonial_map.py reads
+
+        Parameters
+        ----------
+        source_directory
+            String: real data directory
+
+        output_directory
+            String: directory to write the scaled files to
+
+        scale
+            Integer: number of records written for each real record
+
+        Returns
+        -------
+        number_features
+            Integer: number of railway line features written
+
+        number_railway_lines
+            Integer: number of railway lines written to the operating dates file
+    """
+    source_path = railway_lines_source_path(source_directory)
+    rows, encoding = read_csv_rows(os.path.join(source_directory, railway_operating_dates_file))
+    header, rows = rows[0], rows[1:]
+    name_column, commenced_column, opened_column, closed_column = [header.index(column) for column in ['Name', 'Commenced', 'Opened', 'Closed']]
+
+    # synthetic features are numbered after the real ones, which needs a pass over the real features first
+    next_feature_id = 1
+    with open_geojson_stream(source_path) as railway_stream:
+        for feature in iterate_geojson_features(railway_stream):
+            next_feature_id = max(next_feature_id, (feature.get('id') or 0) + 1)
+
+    number_features = 0
+    line_offsets = {}
+    with open_geojson_stream(source_path) as railway_stream, \
+         open(os.path.join(output_directory, railway_lines_file), 'w', encoding='utf-8') as railway_file:
+        railway_file.write('{"type": "FeatureCollection", "features": [\n')
+
+        for feature in iterate_geojson_features(railway_stream):
+            railway_file.write((',\n' if number_features > 0 else '') + json.dumps(feature))
+            number_features += 1
+
+            name = (feature.get('properties') or {}).get('name')
+            if name is None or feature.get('geometry') is None:
+                continue
+
+            for copy_number in range(1, scale):
+                if (name, copy_number) not in line_offsets:
+                    line_offsets[(name, copy_number)] = (random.uniform(-location_jitter, location_jitter), random.uniform(-location_jitter, location_jitter))
+
+                synthetic_feature = json.loads(json.dumps(feature))
+                synthetic_feature['id'] = next_feature_id
+                if 'objectid' in synthetic_feature['properties']:
+                    synthetic_feature['properties']['objectid'] = next_feature_id
+                next_feature_id += 1
+                synthetic_feature['properties']['name'] = synthetic_name(name, copy_number)
+                synthetic_feature['geometry']['coordinates'] = shift_coordinates(feature['geometry']['coordinates'], *line_offsets[(name, copy_number)])
+                railway_file.write(',\n' + json.dumps(synthetic_feature))
+                number_features += 1
+
+        railway_file.write('\n]}\n')
+
+    synthetic_rows = [header] + rows
+    for copy_number in range(1, scale):
+        for row in rows:
+            synthetic_row = list(row)
+            synthetic_row[name_column] = synthetic_name(row[name_column], copy_number)
+            year_offset = random.randint(-year_jitter, year_jitter)
+            for year_column in [commenced_column, opened_column, closed_column]:
+                synthetic_row[year_column] = jitter_year(row[year_column], year_offset)
+            synthetic_rows.append(synthetic_row)
+
+    write_csv_rows(os.path.join(output_directory, railway_operating_dates_file), synthetic_rows, encoding)
+    return number_features, len(synthetic_rows) - 1
+
+def generate_synthetic_data(source_directory, output_directory, scale):
+    """
+        Writes a copy of the data directory with the towns, massacres, railway lines and missions scaled
+
+        Parameters
+        ----------
+        source_directory
+            String: real data directory
+
+        output_directory
+            String: directory to write the synthetic data directory to
+
+        scale
+            Integer: number of records written for each real record
+    """
+    scaled_files = ['city_list.csv', 'undated_city_list.csv', massacres_file, missions_file, railway_lines_file, railway_lines_archive, railway_operating_dates_file]
+    os.makedirs(output_directory, exist_ok=True)
+
+    # everything else is copied as is, apart from the compiled data cache, which is rebuilt from the synthetic data
+    for file_name in os.listdir(source_directory):
+        source_path = os.path.join(source_directory, file_name)
+        if file_name in scaled_files or file_name == 'cache':
+            continue
+        if os.path.isdir(source_path):
+            shutil.copytree(source_path, os.path.join(output_directory, file_name), dirs_exist_ok=True)
+        else:
+            shutil.copy2(source_path, os.path.join(output_directory, file_name))
+
+    print('Towns: ' + str(scale_cities(os.path.join(source_directory, 'city_list.csv'), os.path.join(output_directory, 'city_list.csv'), scale, True)))
+    print('Undated towns: ' + str(scale_cities(os.path.join(source_directory, 'undated_city_list.csv'), os.path.join(output_directory, 'undated_city_list.csv'), scale, False)))
+    print('Massacres: ' + str(scale_massacres(os.path.join(source_directory, massacres_file), os.path.join(output_directory, massacres_file), scale)))
+    print('Missions: ' + str(scale_missions(os.path.join(source_directory, missions_file), os.path.join(output_directory, missions_file), scale)))
+    railway_features, railway_lines = scale_railway_lines(source_directory, output_directory, scale)
+    print('Railway line features: ' + str(railway_features) + ', railway lines: ' + str(railway_lines))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write a data directory with synthetic towns, massacres, railway lines and missions added, for stress testing')
+    parser.add_argument('--scale', type=int, default=10, help='number of records written for each real record, e.g. 10 to 100')
+    parser.add_argument('--source', default=source_data_directory, help='real data directory')
+    parser.add_argument('--output', help='directory to write the synthetic data to, defaults to data_<scale>x')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the random jitter, so the synthetic data can be regenerated')
+    args = parser.parse_args()
+
+    if args.scale < 1:
+        parser.error('--scale must be at least 1')
+    output_directory = args.output if args.output is not None else './data_' + str(args.scale) + 'x'
+    if os.path.abspath(output_directory) == os.path.abspath(args.source):
+        parser.error('--output must be a different directory to --source')
+
+    random.seed(args.seed)
+    generate_synthetic_data(args.source, output_directory, args.scale)
+    print('Wrote ' + output_directory + ', render or benchmark with it by setting COLONIAL_MAP_DATA_DIRECTORY=' + output_directory)
@@ -0,0 +1,124 @@
+"""
+    Streams the features of GeoJSON FeatureCollections one at a time, reading them directly out of the '.7z' archives they can be shipped in.
+    Shared by display_colonial_map.py and generate_synthetic_data.py, without importing display_colonial_map, which builds its figure when imported
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+def iterate_geojson_features(text_stream, chunk_size=1024 * 1024):
+    """
+        Streams the features of a GeoJSON FeatureCollection one at a time, 
+        so only the feature being decoded is held in memory rather than the whole document
+
+        Parameters
+        ----------
+        text_stream
+            Text file object: GeoJSON document
+
+        (Optional) chunk_size
+            Integer: number of characters to read from the stream at a time
+                defaults to 1MB
+
+        Returns
+        -------
+        feature
+            Generator of Dictionaries: decoded features
+    """
+    decoder = json.JSONDecoder()
+    features_start = re.compile(r'"features"\s*:\s*\[')
+    separators = re.compile(r'[\s,]*')
+
+    buffer = ''
+    match = None
+    while match is None:
+        chunk = text_stream.read(chunk_size)
+        if not chunk:
+            raise ValueError('No "features" array found in the GeoJSON stream, it is empty or not a FeatureCollection')
+        buffer += chunk
+        match = features_start.search(buffer)
+
+    position = match.end()
+    end_of_stream = False
+    while True:
+        position = separators.match(buffer, position).end()
+        if position < len(buffer) and buffer[position] == ']':
+            return
+
+        try:
+            feature, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if end_of_stream:
+                raise
+            # feature is split across chunks, so read the rest of it
+            buffer = buffer[position:]
+            position = 0
+            chunk = text_stream.read(chunk_size)
+            end_of_stream = not chunk
+            buffer += chunk
+            continue
+
+        yield feature
+
+@contextlib.contextmanager
+def open_geojson_stream(source_path):
+    """
+        Opens a GeoJSON file as a text stream, decompressing it on the fly when given the '.7z' archive.
+        Uses the 7-Zip command line tool if installed, streaming it straight from the archive, 
+        otherwise the py7zr package, which doesn't stream, so extracts the whole file to a temporary directory first
+
+        Parameters
+        ----------
+        source_path
+            String: path of the GeoJSON file, or the '.7z' archive holding it
+
+        Returns
+        -------
+        geojson_stream
+            Text file object: GeoJSON document
+    """
+    if not source_path.endswith('.7z'):
+        with open(source_path, encoding='utf-8') as geojson_stream:
+            yield geojson_stream
+        return
+
+    seven_zip = shutil.which('7z') or shutil.which('7za') or shutil.which('7zr')
+    if seven_zip is not None:
+        # 7-Zip's errors go to a file rather than a pipe, so it can't block writing them while the GeoJSON is read
+        with tempfile.TemporaryFile() as seven_zip_errors:
+            with subprocess.Popen([seven_zip, 'e', '-so', source_path], stdout=subprocess.PIPE, stderr=seven_zip_errors) as seven_zip_process:
+                try:
+                    yield io.TextIOWrapper(seven_zip_process.stdout, encoding='utf-8')
+                    # read past the end of the features, so 7-Zip can finish writing and exit
+                    seven_zip_process.stdout.read()
+                except ValueError as err:
+                    # the stream ends early or empty when 7-Zip fails, so report 7-Zip's error rather than the GeoJSON being cut short
+                    if seven_zip_process.wait() != 0:
+                        seven_zip_errors.seek(0)
+                        raise RuntimeError('7-Zip failed to extract ' + source_path + ': ' + seven_zip_errors.read().decode(errors='replace').strip()) from err
+                    raise
+
+                if seven_zip_process.wait() != 0:
+                    seven_zip_errors.seek(0)
+                    raise RuntimeError('7-Zip failed to extract ' + source_path + ': ' + seven_zip_errors.read().decode(errors='replace').strip())
+        return
+
+    try:
+        import py7zr
+    except ImportError:
+        raise ImportError('Reading ' + source_path + ' requires the 7-Zip command line tool or the py7zr package, alternatively extract the GeoJSON from it')
+
+    with tempfile.TemporaryDirectory() as extract_directory:
+        with py7zr.SevenZipFile(source_path, 'r') as archive:
+            archive.extractall(path=extract_directory)
+        extracted_files = [file_name for file_name in os.listdir(extract_directory) if file_name.endswith('json')]
+        if not extracted_files:
+            raise ValueError('No GeoJSON file found in ' + source_path)
+        with open(os.path.join(extract_directory, extracted_files[0]), encoding='utf-8') as geojson_stream:
+            yield geojson_stream
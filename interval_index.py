@@ -0,0 +1,114 @@
+"""
+    Indexes the From/To year ranges of the datasets display_colonial_map.py queries every frame.
+    Kept apart from display_colonial_map.py, which builds its figure when imported, so the index can be tested without loading the data
+"""
+
+import numpy as np
+import pandas as pd
+
+def build_interval_index(from_years, to_years, final_year, inclusive_to=True):
+    """
+        Builds an index over the From/To year ranges of a dataset, so the rows active in a year, 
+        or that ended within a recent window, are looked up rather than found by masking the whole dataset every frame.
+        Built once per dataset at load time
+
+        Parameters
+        ----------
+        from_years
+            Array-like: year each row starts, rows with no start year are never active
+
+        to_years
+            Array-like: year each row ends, rows with no end year remain active indefinitely
+
+        final_year
+            Integer: last year of the timelapse, the years are indexed up to it, or the latest year of any row if that's later
+
+        (Optional) inclusive_to
+            boolean: whether a row is still active in its end year
+                defaults to True
+
+        Returns
+        -------
+        interval_index
+            Dictionary:
+                'first_year' - earliest year any row is active
+                'year_offsets' - index into 'year_rows' of the first active row for each year from 'first_year', with a final entry for the total
+                'year_rows' - row positions active in each year, in dataset order
+                'open_rows' - row positions still active after the last indexed year
+                'recent_order' - row positions with an end year, ordered by end year descending, then start year ascending
+                'recent_to' - negated end year of the rows in 'recent_order', ascending for sorted lookups
+    """
+    from_years = pd.Series(from_years, dtype='float64').to_numpy()
+    to_years = pd.Series(to_years, dtype='float64').to_numpy()
+
+    finite_years = np.concatenate([from_years[~np.isnan(from_years)], to_years[~np.isnan(to_years)], [final_year]])
+    first_year = int(finite_years.min())
+    last_year = int(finite_years.max())
+
+    end_years = np.where(np.isnan(to_years), last_year + 1, to_years + (1 if inclusive_to else 0))
+    indexed_rows = np.flatnonzero(~np.isnan(from_years) & (end_years > from_years))
+    start_years = from_years[indexed_rows].astype(np.int64)
+    durations = end_years[indexed_rows].astype(np.int64) - start_years
+
+    # expand each row into one entry per year it is active, then group the entries by year
+    row_entries = np.repeat(indexed_rows, durations)
+    year_entries = np.repeat(start_years, durations) + np.arange(durations.sum()) - np.repeat(np.cumsum(durations) - durations, durations)
+    entry_order = np.lexsort((row_entries, year_entries))
+    year_rows = row_entries[entry_order]
+    year_offsets = np.searchsorted(year_entries[entry_order], np.arange(first_year, last_year + 2))
+
+    ended_rows = np.flatnonzero(~np.isnan(to_years))
+    recent_order = ended_rows[np.lexsort((from_years[ended_rows], -to_years[ended_rows]))]
+
+    return {'first_year': first_year, 'year_offsets': year_offsets, 'year_rows': year_rows, \
+            'open_rows': indexed_rows[np.isnan(to_years[indexed_rows])], 'recent_order': recent_order, 'recent_to': -to_years[recent_order]}
+
+def active_interval_rows(interval_index, year):
+    """
+        Looks up the rows active in a year
+
+        Parameters
+        ----------
+        interval_index
+            Dictionary: built by build_interval_index
+
+        year
+            Integer: year to look up
+
+        Returns
+        -------
+        rows
+            Numpy Integer Array: positions of the active rows, in dataset order
+    """
+    year_position = year - interval_index['first_year']
+    if year_position < 0:
+        return interval_index['year_rows'][:0]
+    if year_position >= len(interval_index['year_offsets']) - 1:
+        return interval_index['open_rows']
+
+    return interval_index['year_rows'][interval_index['year_offsets'][year_position]:interval_index['year_offsets'][year_position + 1]]
+
+def ended_interval_rows(interval_index, year, memory):
+    """
+        Looks up the rows that ended within a number of years before a year, i.e. year - memory < To < year
+
+        Parameters
+        ----------
+        interval_index
+            Dictionary: built by build_interval_index
+
+        year
+            Integer: year to look back from
+
+        memory
+            Integer: number of years to look back
+
+        Returns
+        -------
+        rows
+            Numpy Integer Array: positions of the ended rows, most recently ended first, then by start year
+    """
+    first_recent = np.searchsorted(interval_index['recent_to'], -year, side='right')
+    last_recent = np.searchsorted(interval_index['recent_to'], -(year - memory), side='left')
+
+    return interval_index['recent_order'][first_recent:last_recent]
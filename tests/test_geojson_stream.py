@@ -0,0 +1,44 @@
+"""
+    Checks the streamed GeoJSON features against the whole document decoded by json.load, 
+    reading a few characters at a time so features are split across chunks
+"""
+
+import io
+import json
+
+import pytest
+
+from geojson_stream import iterate_geojson_features
+
+feature_collection = '''{
+    "type": "FeatureCollection",
+    "name": "Railway_Lines",
+    "crs": {"type": "name", "properties": {"name": "urn:ogc:def:crs:OGC:1.3:CRS84"}},
+    "features" :
+    [
+        {"type": "Feature", "properties": {"NAME": "Main, [North]", "OPENED": 1857}, "geometry": {"type": "LineString", "coordinates": [[151.2, -33.8], [151.0, -33.7]]}} ,
+        {"type": "Feature", "properties": {"NAME": "Brace } Line", "OPENED": null}, "geometry": {"type": "MultiLineString", "coordinates": [[[150.1, -34.1], [150.2, -34.2]], [[149.9, -33.9], [149.8, -33.8]]]}},
+
+        {"type": "Feature", "properties": {"NAME": "Unicode é", "OPENED": 1901}, "geometry": null}
+    ]
+}
+'''
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 1024 * 1024])
+def test_features_match_json_load(chunk_size):
+    features = list(iterate_geojson_features(io.StringIO(feature_collection), chunk_size=chunk_size))
+    assert features == json.loads(feature_collection)['features']
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 1024 * 1024])
+def test_empty_features(chunk_size):
+    empty_collection = '{"type": "FeatureCollection", "features": [ \n ]}'
+    assert list(iterate_geojson_features(io.StringIO(empty_collection), chunk_size=chunk_size)) == []
+
+@pytest.mark.parametrize('document', ['', '{"type": "Feature", "geometry": null}'])
+def test_missing_features(document):
+    with pytest.raises(ValueError):
+        list(iterate_geojson_features(io.StringIO(document), chunk_size=3))
+
+def test_truncated_features():
+    with pytest.raises(ValueError):
+        list(iterate_geojson_features(io.StringIO(feature_collection[:feature_collection.index('Brace')]), chunk_size=7))
@@ -0,0 +1,46 @@
+"""
+    Checks the interval index against the pandas masks it replaced, on a toy dataset covering 
+    open ended rows, rows without a start year, and rows ending in the year they start
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from interval_index import build_interval_index, active_interval_rows, ended_interval_rows
+
+final_year = 2020
+
+toy_dataset = pd.DataFrame({
+    'From': [1788, 1800, 1850, 1850, np.nan, 1900, 1990, 1795, 2010, 1830],
+    'To':   [1800, np.nan, 1850, 1870, 1860, np.nan, 2025, 1790, 2015, 1870],
+})
+
+checked_years = range(1770, 2040)
+
+@pytest.mark.parametrize('inclusive_to', [True, False])
+def test_active_rows_match_mask(inclusive_to):
+    interval_index = build_interval_index(toy_dataset['From'], toy_dataset['To'], final_year, inclusive_to=inclusive_to)
+
+    for year in checked_years:
+        still_active = (toy_dataset['To'] >= year) if inclusive_to else (toy_dataset['To'] > year)
+        mask = (toy_dataset['From'] <= year) & (still_active | toy_dataset['To'].isna())
+        assert list(active_interval_rows(interval_index, year)) == list(np.flatnonzero(mask)), year
+
+@pytest.mark.parametrize('inclusive_to', [True, False])
+@pytest.mark.parametrize('memory', [1, 5, 30])
+def test_ended_rows_match_mask(inclusive_to, memory):
+    interval_index = build_interval_index(toy_dataset['From'], toy_dataset['To'], final_year, inclusive_to=inclusive_to)
+
+    for year in checked_years:
+        mask = (toy_dataset['To'] > year - memory) & (toy_dataset['To'] < year)
+        expected = toy_dataset[mask].reset_index().sort_values(['To', 'From'], ascending=[False, True], kind='stable')['index']
+        assert list(ended_interval_rows(interval_index, year, memory)) == list(expected), year
+
+def test_without_end_years():
+    interval_index = build_interval_index(toy_dataset['To'], np.full(len(toy_dataset), np.nan), final_year)
+
+    for year in checked_years:
+        mask = toy_dataset['To'] <= year
+        assert list(active_interval_rows(interval_index, year)) == list(np.flatnonzero(mask)), year
+        assert len(ended_interval_rows(interval_index, year, 30)) == 0